@@ -0,0 +1,312 @@
+import asyncio
+import itertools
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from fastapi import HTTPException
+
+
+# Priorities accepted by the queue; lower values run first
+JOB_PRIORITIES = {"high": 0, "normal": 1, "low": 2}
+
+# Job states; "queued" and "running" jobs whose lease expired are resumed by the next process that starts
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+FINISHED_STATES = (DONE, FAILED)
+
+
+class JobQueueFullError(Exception):
+    """Raised when the analysis queue is at capacity and cannot accept another job."""
+
+
+class InMemoryJobStore:
+    """
+    Job store kept in a dict. Jobs are lost on restart; meant for tests and local runs.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, dict] = {}
+
+    async def create(self, job: dict):
+        self._jobs[job["job_id"]] = dict(job)
+
+    async def update(self, job_id: str, fields: dict):
+        self._jobs[job_id].update(fields)
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        job = self._jobs.get(job_id)
+        return dict(job) if job else None
+
+    async def claim_expired(self, owner: str, now: float, lease_expires_at: float) -> List[dict]:
+        claimed = []
+        for job in self._jobs.values():
+            if job["status"] not in FINISHED_STATES and (job.get("lease_expires_at") or 0) < now:
+                job.update(owner=owner, lease_expires_at=lease_expires_at)
+                claimed.append(dict(job))
+        return claimed
+
+    async def renew(self, owner: str, job_ids: List[str], lease_expires_at: float):
+        for job_id in job_ids:
+            job = self._jobs.get(job_id)
+            if job and job.get("owner") == owner:
+                job["lease_expires_at"] = lease_expires_at
+
+
+class MongoJobStore:
+    """
+    Job store backed by a Mongo collection (through an AsyncCollection), so job state and
+    results survive a restart and are visible to every API process. Finished jobs are
+    removed by a TTL index once `retention` seconds have passed.
+    """
+
+    def __init__(self, collection, retention: float = 24 * 3600):
+        self.collection = collection
+        self.retention = retention
+        collection.collection.create_index("expires_at", expireAfterSeconds=0)
+        collection.collection.create_index("status")
+
+    async def create(self, job: dict):
+        await self.collection.insert_one({"_id": job["job_id"], **job})
+
+    async def update(self, job_id: str, fields: dict):
+        if fields.get("status") in FINISHED_STATES:
+            fields = {**fields, "expires_at": _utc_datetime(time.time() + self.retention)}
+        await self.collection.update_one({"_id": job_id}, {"$set": fields})
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        return await self.collection.find_one({"_id": job_id}, {"_id": 0, "expires_at": 0})
+
+    async def claim_expired(self, owner: str, now: float, lease_expires_at: float) -> List[dict]:
+        """
+        Take over unfinished jobs whose owner stopped renewing their lease (or that predate leases).
+        """
+        candidates = await self.collection.find(
+            {
+                "status": {"$in": [QUEUED, RUNNING]},
+                "$or": [{"lease_expires_at": {"$lt": now}}, {"lease_expires_at": None}],
+            },
+            {"_id": 0, "expires_at": 0},
+        )
+        claimed = []
+        for job in candidates:
+            # Several processes may start at once; the update only matches for the first one to claim the job
+            result = await self.collection.update_one(
+                {"_id": job["job_id"], "lease_expires_at": job.get("lease_expires_at")},
+                {"$set": {"owner": owner, "lease_expires_at": lease_expires_at}},
+            )
+            if result.modified_count:
+                claimed.append({**job, "owner": owner, "lease_expires_at": lease_expires_at})
+        return claimed
+
+    async def renew(self, owner: str, job_ids: List[str], lease_expires_at: float):
+        await self.collection.update_many(
+            {"_id": {"$in": job_ids}, "owner": owner}, {"$set": {"lease_expires_at": lease_expires_at}}
+        )
+
+
+class AnalysisJobQueue:
+    """
+    Bounded in-process priority queue that runs resume analyses in the background.
+
+    `submit` persists the job and returns its id at once; `workers` asyncio tasks take jobs
+    by priority (then submission order) and call `handler(job)`, storing its result or
+    error. At most `max_queue` jobs may wait, beyond which submit raises JobQueueFullError.
+
+    Each job records the process that owns it and a lease that the owner renews every
+    `lease / 3` seconds while the job is queued or running. On start, and then at every
+    renewal, jobs whose lease expired (their process stopped) are claimed and queued again,
+    up to `max_attempts` runs per job; a job past that is marked failed and passed to
+    `on_abandon(job)`, so resources the handler would have released can be cleaned up.
+    Jobs of other live processes are left alone.
+
+    Status changes are also pushed to in-process listeners, so event streams do not have to
+    poll the store; other processes fall back to polling.
+    """
+
+    def __init__(
+        self,
+        store,
+        handler: Callable[[dict], Awaitable[dict]],
+        workers: int = 4,
+        max_queue: int = 100,
+        max_attempts: int = 2,
+        lease: float = 60.0,
+        on_abandon: Optional[Callable[[dict], None]] = None,
+    ):
+        self.store = store
+        self.handler = handler
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_attempts = max_attempts
+        self.lease = lease
+        self.on_abandon = on_abandon
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        # Ids of the jobs this process has queued or is running, whose leases it renews
+        self._held: set = set()
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._order = itertools.count()
+        self._listeners: Dict[str, List[asyncio.Event]] = {}
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    async def start(self):
+        self._queue = asyncio.PriorityQueue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        await self._resume_expired()
+        self._tasks.append(asyncio.create_task(self._renew_leases()))
+
+    async def _resume_expired(self):
+        now = time.time()
+        resumed = 0
+        for job in await self.store.claim_expired(self.owner, now, now + self.lease):
+            if job.get("attempts", 0) >= self.max_attempts:
+                await self._finish(job, FAILED, error={"status_code": 500, "detail": "Analysis was interrupted"})
+                if self.on_abandon:
+                    self.on_abandon(job)
+                continue
+            await self.store.update(job["job_id"], {"status": QUEUED})
+            self._held.add(job["job_id"])
+            self._queue.put_nowait((JOB_PRIORITIES.get(job["priority"], 1), next(self._order), job))
+            resumed += 1
+        if resumed:
+            print(f"INFO: Resumed {resumed} unfinished resume analysis jobs")
+
+    async def _renew_leases(self):
+        while True:
+            await asyncio.sleep(self.lease / 3)
+            try:
+                if self._held:
+                    await self.store.renew(self.owner, list(self._held), time.time() + self.lease)
+                await self._resume_expired()
+            except Exception as e:
+                print(f"ERROR: Failed to renew resume analysis job leases: {str(e)}")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, payload: dict, priority: str = "normal") -> dict:
+        """
+        Persist a new job and queue it.
+
+        Args:
+            payload (dict): Job-specific fields, passed to the handler with the job.
+            priority (str): "high", "normal" or "low".
+
+        Returns:
+            dict: The stored job.
+
+        Raises:
+            JobQueueFullError: If `max_queue` jobs are already waiting.
+        """
+        if self._queue is None:
+            raise RuntimeError("AnalysisJobQueue.start() has not been called")
+        if self._queue.qsize() >= self.max_queue:
+            self._rejected += 1
+            raise JobQueueFullError("Resume analysis queue is full")
+
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "status": QUEUED,
+            "priority": priority,
+            "attempts": 0,
+            "created_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None,
+            "owner": self.owner,
+            "lease_expires_at": time.time() + self.lease,
+            **payload,
+        }
+        await self.store.create(job)
+        self._held.add(job["job_id"])
+        self._queue.put_nowait((JOB_PRIORITIES[priority], next(self._order), job))
+        return job
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        return await self.store.get(job_id)
+
+    async def wait_for_change(self, job_id: str, timeout: float):
+        """
+        Wait until this process updates the job, or until `timeout` seconds pass.
+        """
+        event = asyncio.Event()
+        self._listeners.setdefault(job_id, []).append(event)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            listeners = self._listeners.get(job_id, [])
+            if event in listeners:
+                listeners.remove(event)
+            if not listeners:
+                self._listeners.pop(job_id, None)
+
+    def _notify(self, job_id: str):
+        for event in self._listeners.get(job_id, []):
+            event.set()
+
+    async def _finish(self, job: dict, status: str, result: Optional[dict] = None, error: Optional[dict] = None):
+        await self.store.update(
+            job["job_id"], {"status": status, "finished_at": time.time(), "result": result, "error": error}
+        )
+        self._notify(job["job_id"])
+
+    async def _worker(self):
+        while True:
+            _, _, job = await self._queue.get()
+            self._running += 1
+            try:
+                job["attempts"] = job.get("attempts", 0) + 1
+                await self.store.update(
+                    job["job_id"], {"status": RUNNING, "started_at": time.time(), "attempts": job["attempts"]}
+                )
+                self._notify(job["job_id"])
+
+                try:
+                    result = await self.handler(job)
+                except HTTPException as e:
+                    self._failed += 1
+                    await self._finish(job, FAILED, error={"status_code": e.status_code, "detail": e.detail})
+                except Exception as e:
+                    self._failed += 1
+                    print(f"ERROR: Resume analysis job {job['job_id']} failed: {str(e)}")
+                    await self._finish(job, FAILED, error={"status_code": 500, "detail": "Resume analysis failed"})
+                else:
+                    self._completed += 1
+                    await self._finish(job, DONE, result=result)
+            except asyncio.CancelledError:
+                # Shutting down: the job stays "running" in the store and is resumed once its lease expires
+                raise
+            except Exception as e:
+                print(f"ERROR: Failed to update resume analysis job {job['job_id']}: {str(e)}")
+            finally:
+                # Once this process stops renewing the lease, another one may take the job over
+                self._held.discard(job["job_id"])
+                self._running -= 1
+                self._queue.task_done()
+
+    def metrics(self) -> dict:
+        return {
+            "workers": self.workers,
+            "running": self._running,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "max_queue": self.max_queue,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+        }
+
+
+def _utc_datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
@@ -0,0 +1,94 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+import pymongo
+from pymongo.errors import PyMongoError
+
+
+class QueryTimeoutError(Exception):
+    """Raised when a database call does not finish within its timeout."""
+
+
+class AsyncCollection:
+    """
+    Awaitable facade over a synchronous pymongo collection.
+
+    Every call runs on a dedicated, size-limited thread pool, so a slow query no longer
+    blocks the event loop for other requests. Each call is bounded by a timeout: inside the
+    worker thread via pymongo.timeout (client-side operation timeout, also sent to the
+    server as maxTimeMS), and on the event loop side so time spent queueing for a worker
+    counts too.
+    """
+
+    def __init__(self, collection, executor: ThreadPoolExecutor, timeout: float):
+        self.collection = collection
+        self.executor = executor
+        self.timeout = timeout
+
+    async def run(self, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run a blocking function that uses the collection on the database executor.
+
+        Args:
+            func (Callable): The blocking function to run.
+            timeout (float, optional): Seconds to allow; defaults to the collection timeout.
+
+        Raises:
+            QueryTimeoutError: If the call does not finish in time.
+        """
+        timeout = self.timeout if timeout is None else timeout
+
+        def call():
+            with pymongo.timeout(timeout):
+                return func(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        try:
+            # A little slack so the in-thread timeout normally fires first with a clearer error
+            return await asyncio.wait_for(loop.run_in_executor(self.executor, call), timeout + 1)
+        except asyncio.TimeoutError as e:
+            raise QueryTimeoutError(f"Query on {self.collection.name} timed out after {timeout}s") from e
+        except PyMongoError as e:
+            if e.timeout:
+                raise QueryTimeoutError(f"Query on {self.collection.name} timed out after {timeout}s") from e
+            raise
+
+    async def find(
+        self, filter: Optional[dict] = None, projection: Optional[dict] = None, limit: int = 0, sort=None
+    ) -> List[dict]:
+        def query():
+            cursor = self.collection.find(filter or {}, projection, limit=limit)
+            if sort:
+                cursor = cursor.sort(sort)
+            return list(cursor)
+
+        return await self.run(query)
+
+    async def aggregate(self, pipeline: List[dict]) -> List[dict]:
+        return await self.run(lambda: list(self.collection.aggregate(pipeline)))
+
+    async def find_one(self, filter: dict, projection: Optional[dict] = None) -> Optional[dict]:
+        return await self.run(self.collection.find_one, filter, projection)
+
+    async def insert_one(self, document: dict):
+        return await self.run(self.collection.insert_one, document)
+
+    async def update_one(self, filter: dict, update: dict, upsert: bool = False):
+        return await self.run(self.collection.update_one, filter, update, upsert=upsert)
+
+    async def update_many(self, filter: dict, update: dict):
+        return await self.run(self.collection.update_many, filter, update)
+
+
+class AsyncDatabase:
+    """
+    Holds the database executor and hands out AsyncCollection wrappers that share it.
+    """
+
+    def __init__(self, max_workers: int, timeout: float):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mongo")
+        self.timeout = timeout
+
+    def wrap(self, collection) -> AsyncCollection:
+        return AsyncCollection(collection, self.executor, self.timeout)
@@ -0,0 +1,85 @@
+"""
+Benchmark job list serialization: Job models re-validated against response_model and encoded
+with the standard json module, vs projected documents encoded directly (job_responses.dumps).
+
+The first path mirrors what FastAPI did for `[Job(**job) for job in jobs]` with
+response_model=List[Job]: build the models, validate them again, dump to JSON-compatible
+data and json.dumps it. Jobs are synthesized, so no database is needed.
+
+Usage (from the backend directory):
+    python benchmarks/bench_job_serialization.py --jobs 200 --rounds 200
+    python benchmarks/bench_job_serialization.py --jobs 10000 --rounds 5
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import BaseModel, TypeAdapter  # noqa: E402
+
+from job_responses import dumps, orjson  # noqa: E402
+
+
+# Same fields as main.Job; importing main would connect to MongoDB
+class Job(BaseModel):
+    id: str
+    job_title: str
+    company: str
+    date: str
+    job_link: str
+    skills: List[str]
+
+
+def legacy_serialize(jobs, adapter):
+    models = [Job(**job) for job in jobs]
+    validated = adapter.validate_python(models)
+    return json.dumps(adapter.dump_python(validated, mode="json"), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=200, help="Jobs per response")
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=216)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    skills = ["python", "sql", "aws", "docker", "kubernetes", "react", "java", "spark", "tableau", "excel"]
+    jobs = [
+        {
+            "id": f"{i:024x}",
+            "job_title": f"Software Engineer {i}",
+            "company": f"Company {i % 997} Pte Ltd",
+            "date": "2024-09-11",
+            "job_link": f"https://www.linkedin.com/jobs/view/{4020000000 + i}/",
+            "skills": random.sample(skills, random.randint(2, 8)),
+        }
+        for i in range(args.jobs)
+    ]
+    adapter = TypeAdapter(List[Job])
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        legacy = legacy_serialize(jobs, adapter)
+    legacy_time = (time.perf_counter() - start) / args.rounds
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        fast = dumps(jobs)
+    fast_time = (time.perf_counter() - start) / args.rounds
+
+    print(f"Jobs per response: {args.jobs}, encoder: {'orjson' if orjson is not None else 'json'}")
+    print(f"Validate + json:   {legacy_time * 1000:.2f} ms/response")
+    print(f"Direct encode:     {fast_time * 1000:.2f} ms/response")
+    print(f"Speedup: {legacy_time / fast_time:.1f}x")
+    print(f"Identical JSON: {json.loads(legacy) == json.loads(fast)}")
+
+
+if __name__ == "__main__":
+    main()
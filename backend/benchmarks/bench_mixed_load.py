@@ -0,0 +1,100 @@
+"""
+Concurrency benchmark: mixed read load against a running API, reporting latency percentiles.
+
+Run it before and after a change to see whether slow endpoints (e.g. /university_stats)
+still stall fast ones. Start the API first (uvicorn main:app), then from the backend directory:
+    python benchmarks/bench_mixed_load.py --url http://localhost:8000 --concurrency 50 --duration 30
+    python benchmarks/bench_mixed_load.py --username user@example.com
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import defaultdict
+
+import httpx
+
+
+def build_mix(username):
+    # (weight, path): mostly fast lookups with a steady share of heavy aggregate endpoints
+    mix = [
+        (30, "/jobs/all?limit=20"),
+        (15, "/jobs/title/engineer"),
+        (10, "/jobs/skills/python,sql"),
+        (10, "/top_skills"),
+        (10, "/get_industry_growth"),
+        (10, "/get_market_trend"),
+        (10, "/university_stats"),
+        (5, "/get_graduate_starting_pay_data"),
+    ]
+    if username:
+        mix += [(10, f"/get_recommended_jobs/{username}"), (5, f"/get_recommended_skill_to_learn/{username}")]
+    return mix
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def worker(client, mix, deadline, latencies, errors):
+    weights = [weight for weight, _ in mix]
+    paths = [path for _, path in mix]
+    while time.perf_counter() < deadline:
+        path = random.choices(paths, weights)[0]
+        endpoint = path.split("?")[0]
+        start = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 500:
+                errors[endpoint] += 1
+        except httpx.HTTPError:
+            errors[endpoint] += 1
+            continue
+        latencies[endpoint].append((time.perf_counter() - start) * 1000)
+
+
+async def run(args):
+    mix = build_mix(args.username)
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=args.url, timeout=60, limits=limits) as client:
+        deadline = time.perf_counter() + args.duration
+        await asyncio.gather(
+            *(worker(client, mix, deadline, latencies, errors) for _ in range(args.concurrency))
+        )
+
+    everything = []
+    print(f"{'endpoint':<45} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for endpoint in sorted(latencies):
+        values = sorted(latencies[endpoint])
+        everything.extend(values)
+        print(
+            f"{endpoint:<45} {len(values):>7} {percentile(values, 0.5):>9.1f} "
+            f"{percentile(values, 0.95):>9.1f} {percentile(values, 0.99):>9.1f} {errors[endpoint]:>7}"
+        )
+    everything.sort()
+    print(
+        f"{'ALL':<45} {len(everything):>7} {percentile(everything, 0.5):>9.1f} "
+        f"{percentile(everything, 0.95):>9.1f} {percentile(everything, 0.99):>9.1f} {sum(errors.values()):>7}"
+    )
+    print(f"Throughput: {len(everything) / args.duration:.1f} requests/s at concurrency {args.concurrency}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--username", default=None, help="Existing user to include recommendation endpoints")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark the compiled SkillMatcher against the original per-skill substring scan.
+
+Usage (from the backend directory):
+    python benchmarks/bench_parse_skills.py
+    python benchmarks/bench_parse_skills.py --csv linkedin_jobs.csv --repeat 20
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_matcher import SkillMatcher  # noqa: E402
+
+
+# Original implementation from main.py, kept here as the baseline
+def legacy_parse_skills(description, skills):
+    description = description.lower()
+    return [skill for skill in skills if skill in description]
+
+
+def load_descriptions(csv_file_path):
+    with open(csv_file_path, "r", newline="", encoding="utf-8") as file:
+        return [row["Description"] for row in csv.DictReader(file) if row["Description"].strip()]
+
+
+def time_it(func, descriptions, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for description in descriptions:
+            func(description)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", default="linkedin_jobs.csv")
+    parser.add_argument("--skills", default="tech-skills-json.json")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with open(args.skills, "r") as file:
+        skills = [skill.lower() for skill in json.load(file)["skills"]]
+    descriptions = load_descriptions(args.csv)
+
+    build_start = time.perf_counter()
+    matcher = SkillMatcher(skills)
+    build_time = time.perf_counter() - build_start
+
+    legacy_time = time_it(lambda text: legacy_parse_skills(text, skills), descriptions, args.repeat)
+    matcher_time = time_it(matcher.find, descriptions, args.repeat)
+
+    # Compare outputs to show which legacy matches were substring false positives
+    dropped = {}
+    added = {}
+    for description in descriptions:
+        legacy = set(legacy_parse_skills(description, skills))
+        compiled = set(matcher.find(description))
+        for skill in legacy - compiled:
+            dropped[skill] = dropped.get(skill, 0) + 1
+        for skill in compiled - legacy:
+            added[skill] = added.get(skill, 0) + 1
+
+    calls = len(descriptions) * args.repeat
+    print(f"Descriptions: {len(descriptions)}, skills: {len(matcher)}, repeat: {args.repeat}")
+    print(f"Matcher build time: {build_time * 1000:.1f} ms")
+    print(f"Legacy substring scan: {legacy_time:.3f} s ({legacy_time / calls * 1e6:.1f} us/description)")
+    print(f"Compiled matcher:      {matcher_time:.3f} s ({matcher_time / calls * 1e6:.1f} us/description)")
+    print(f"Speedup: {legacy_time / matcher_time:.1f}x")
+    print(f"Legacy-only matches (substring false positives): {sorted(dropped.items(), key=lambda x: -x[1])[:20]}")
+    print(f"Matcher-only matches: {sorted(added.items(), key=lambda x: -x[1])[:20]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark job recommendation scoring: the original per-job loop vs the sparse SkillIndex.
+
+Jobs are synthesized from the skill taxonomy, so no database is needed.
+
+Usage (from the backend directory):
+    python benchmarks/bench_recommendations.py --jobs 100000 --users 50
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_index import SkillIndex  # noqa: E402
+
+
+# Original implementation from main.py, kept here as the baseline
+def legacy_calculate_skill_match(user_skills, job_skills):
+    matching_skills = []
+    for user_skill in user_skills:
+        for job_skill in job_skills:
+            if user_skill.lower() == job_skill.lower():
+                matching_skills.append(job_skill)
+                break
+
+    match_percentage = (len(matching_skills) / len(job_skills)) * 100 if job_skills else 0
+    return match_percentage, matching_skills
+
+
+def legacy_recommend(user_skills, all_jobs):
+    job_matches = []
+    for job in all_jobs:
+        match_percentage, matching_skills = legacy_calculate_skill_match(user_skills, job.get("skills", []))
+        job_matches.append(
+            {
+                "job_title": job["job_title"],
+                "company": job["company"],
+                "job_link": job["job_link"],
+                "match_percentage": round(match_percentage, 2),
+                "matching_skills": matching_skills,
+            }
+        )
+    return sorted(job_matches, key=lambda x: (x["match_percentage"], len(x["matching_skills"])), reverse=True)[:5]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skills", default="tech-skills-json.json")
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=216)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    with open(args.skills, "r") as file:
+        skills = [skill.lower() for skill in json.load(file)["skills"]]
+    # Skew skill popularity so some skills are far more common, as in real postings
+    weights = [1 / (rank + 1) for rank in range(len(skills))]
+
+    jobs = [
+        {
+            "job_title": f"Job {i}",
+            "company": f"Company {i % 997}",
+            "job_link": f"https://example.com/job/{i}",
+            "skills": list(dict.fromkeys(random.choices(skills, weights, k=random.randint(1, 15)))),
+        }
+        for i in range(args.jobs)
+    ]
+    users = [random.sample(skills[:100], random.randint(3, 12)) for _ in range(args.users)]
+
+    build_start = time.perf_counter()
+    index = SkillIndex(jobs)
+    build_time = time.perf_counter() - build_start
+
+    start = time.perf_counter()
+    legacy_results = [legacy_recommend(user, jobs) for user in users]
+    legacy_time = (time.perf_counter() - start) / len(users)
+
+    start = time.perf_counter()
+    index_results = [index.recommend(user, k=5) for user in users]
+    index_time = (time.perf_counter() - start) / len(users)
+
+    print(f"Jobs: {len(jobs)}, distinct skills: {len(index.skill_ids)}, users: {len(users)}")
+    print(f"Index build time: {build_time:.2f} s, matrix nnz: {index.matrix.nnz}")
+    print(f"Legacy loop:  {legacy_time * 1000:.1f} ms/request")
+    print(f"Sparse index: {index_time * 1000:.1f} ms/request")
+    print(f"Speedup: {legacy_time / index_time:.1f}x")
+    print(f"Identical results: {legacy_results == index_results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark job title search: a case-insensitive regex over every title vs the trigram TitleIndex.
+
+The regex scan stands in for the unanchored $regex the endpoint used to send, which MongoDB
+evaluates against every title. Titles are synthesized, so no database is needed.
+
+Usage (from the backend directory):
+    python benchmarks/bench_title_search.py --jobs 200000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from title_index import TitleIndex  # noqa: E402
+
+
+SENIORITY = ["", "Junior ", "Senior ", "Lead ", "Principal ", "Staff ", "Associate "]
+AREAS = ["Software", "Data", "Machine Learning", "Cloud", "Security", "Frontend", "Backend", "DevOps", "QA", "Mobile"]
+ROLES = ["Engineer", "Developer", "Analyst", "Scientist", "Architect", "Manager", "Consultant", "Specialist"]
+QUERIES = ["engineer", "learning", "data sci", "senior cloud", "qa", "devops eng", "architect", "ml", "principal data"]
+
+
+def legacy_search(titles, text, limit):
+    pattern = re.compile(re.escape(text), re.IGNORECASE)
+    return [job_id for job_id, title in titles if pattern.search(title)][:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=200000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=216)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    jobs = [
+        {
+            "id": f"{i:024x}",
+            "job_title": f"{random.choice(SENIORITY)}{random.choice(AREAS)} {random.choice(ROLES)}"
+            f" ({random.choice(['Remote', 'Hybrid', 'Onsite'])}) #{random.randint(1, 9999)}",
+        }
+        for i in range(args.jobs)
+    ]
+    titles = [(job["id"], job["job_title"]) for job in jobs]
+
+    build_start = time.perf_counter()
+    index = TitleIndex(jobs)
+    build_time = time.perf_counter() - build_start
+
+    print(f"Jobs: {len(index)}, trigrams: {len(index.postings)}, index build time: {build_time:.2f} s")
+    print(f"{'query':<16} {'scan ms':>9} {'index ms':>9} {'same':>6}")
+    for text in QUERIES:
+        start = time.perf_counter()
+        expected = legacy_search(titles, text, args.limit)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = index.search(text, args.limit)
+        index_time = time.perf_counter() - start
+
+        print(f"{text:<16} {legacy_time * 1000:>9.1f} {index_time * 1000:>9.2f} {str(found == expected):>6}")
+
+
+if __name__ == "__main__":
+    main()
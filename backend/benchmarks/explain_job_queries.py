@@ -0,0 +1,99 @@
+"""
+Query-plan check for the job search endpoints.
+
+Runs MongoDB's explain on the queries the endpoints send, next to the queries they used to
+send, and prints the winning plan's stages and the keys and documents examined. Exits with
+status 1 if an endpoint query does not use an index (no IXSCAN stage), so it can run in CI
+against a seeded database.
+
+Run it from the backend directory, after `python migrate_jobs.py`:
+    python benchmarks/explain_job_queries.py
+    python benchmarks/explain_job_queries.py --company "EPS CONSULTANTS PTE LTD"
+    python benchmarks/explain_job_queries.py --skills python,sql,aws
+"""
+
+import argparse
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def plan_stages(plan) -> list:
+    """
+    All stage names in an explain plan tree, outermost first.
+    """
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(plan_stages(value))
+    elif isinstance(plan, list):
+        for value in plan:
+            stages.extend(plan_stages(value))
+    return stages
+
+
+def explain(collection, query: dict) -> dict:
+    result = collection.find(query).explain()
+    stats = result.get("executionStats", {})
+    return {
+        "stages": plan_stages(result["queryPlanner"]["winningPlan"]),
+        "returned": stats.get("nReturned"),
+        "keys_examined": stats.get("totalKeysExamined"),
+        "docs_examined": stats.get("totalDocsExamined"),
+        "time_ms": stats.get("executionTimeMillis"),
+    }
+
+
+def build_checks(args) -> list:
+    from ingest import normalize_company, normalize_skill
+
+    skills = args.skills.split(",")
+    skill_keys = [normalize_skill(skill) for skill in skills]
+    old_skills_query = {"$or": [{"skills": {"$regex": f"^{re.escape(skill)}$", "$options": "i"}} for skill in skills]}
+
+    # (name, old query, endpoint query)
+    return [
+        (
+            "company",
+            {"company": {"$regex": f"^{re.escape(args.company)}$", "$options": "i"}},
+            {"company_key": normalize_company(args.company)},
+        ),
+        ("skills mode=any", old_skills_query, {"skill_keys": {"$in": skill_keys}}),
+        ("skills mode=all", {"$and": old_skills_query["$or"]}, {"skill_keys": {"$all": skill_keys}}),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--company", default="EPS CONSULTANTS PTE LTD", help="Company name to look up")
+    parser.add_argument("--skills", default="python,sql,aws", help="Comma-separated skills to look up")
+    args = parser.parse_args()
+
+    # Importing main sets up the MongoDB connection and the indexes the same way the API does
+    from main import jobs_collection
+
+    failed = False
+    for name, old_query, new_query in build_checks(args):
+        old, new = explain(jobs_collection, old_query), explain(jobs_collection, new_query)
+        print(f"{name}:")
+        for label, plan in (("before", old), ("now", new)):
+            print(
+                f"  {label:<7} {' <- '.join(plan['stages']):<40} returned={plan['returned']} "
+                f"keys_examined={plan['keys_examined']} docs_examined={plan['docs_examined']} "
+                f"time_ms={plan['time_ms']}"
+            )
+        if "IXSCAN" not in new["stages"]:
+            print(f"ERROR: {name} query does not use an index")
+            failed = True
+
+    if failed:
+        sys.exit(1)
+    print("SUCCESS: All job search queries use an index")
+
+
+if __name__ == "__main__":
+    main()
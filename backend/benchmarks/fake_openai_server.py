@@ -0,0 +1,100 @@
+"""
+Fake OpenAI-compatible chat completions server for local development and load tests.
+
+It answers POST /v1/chat/completions, with and without "stream": true, after a configurable
+delay, and can fail a share of requests with 500/429 to exercise retries. Point the API at
+it with OPENAI_BASE_URL:
+
+    python benchmarks/fake_openai_server.py --port 9100 --latency 2.0 --token-delay 0.02 --error-rate 0.1
+    OPENAI_BASE_URL=http://127.0.0.1:9100/v1 uvicorn main:app
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+FAKE_SUGGESTIONS = {
+    "content_improvements": {
+        "experience_and_achievements": ["Quantify the impact of your most recent project"],
+        "skills_presentation": ["Group technical skills by area"],
+    },
+    "language_improvements": {"grammar_spelling": [], "sentence_structure": ["Start bullets with action verbs"]},
+}
+
+
+def create_app(latency: float = 1.0, token_delay: float = 0.01, error_rate: float = 0.0) -> FastAPI:
+    app = FastAPI(title="Fake OpenAI")
+    stats = {"requests": 0, "errors": 0}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        stats["requests"] += 1
+        await asyncio.sleep(latency)
+
+        if random.random() < error_rate:
+            stats["errors"] += 1
+            status = random.choice([429, 500])
+            return JSONResponse(status_code=status, content={"error": {"message": "Injected failure", "type": "fake"}})
+
+        content = json.dumps(FAKE_SUGGESTIONS, indent=2)
+        created = int(time.time())
+        model = body.get("model", "fake")
+
+        if not body.get("stream"):
+            return {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}
+                ],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            }
+
+        async def events():
+            # Roughly one token per word, delivered with a delay between tokens
+            for piece in content.split(" "):
+                chunk = {
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": piece + " "}, "finish_reason": None}],
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+                await asyncio.sleep(token_delay)
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency", type=float, default=1.0, help="Seconds before the response starts")
+    parser.add_argument("--token-delay", type=float, default=0.01, help="Seconds between streamed tokens")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 429/500")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    uvicorn.run(create_app(args.latency, args.token_delay, args.error_rate), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
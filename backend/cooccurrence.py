@@ -0,0 +1,220 @@
+import heapq
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from pymongo import UpdateOne
+
+
+# Example job titles kept per skill
+EXAMPLE_JOBS_CAP = 10
+
+# _id of the document whose counter is bumped on every change, so readers can tell when to reload.
+# It has no "skill" field; SKILL_DOCUMENTS matches every other document.
+VERSION_DOCUMENT_ID = "version"
+SKILL_DOCUMENTS = {"skill": {"$exists": True}}
+
+
+def _field_key(skill: str) -> str:
+    # MongoDB field names cannot contain "." or start with "$", and skills like "node.js" do
+    return skill.replace("%", "%25").replace(".", "%2E").replace("$", "%24")
+
+
+class CooccurrenceModel:
+    """
+    Skill co-occurrence counts over the jobs collection.
+
+    For each skill it stores how many jobs list it, how many jobs list it together with
+    every other skill, and a capped sample of example jobs ({"id", "job_title"}). These
+    counts are persisted by ingest.py, one document per skill (see to_documents), and
+    a model with negative counts is used as a delta when applying ingestion changes to
+    the persisted model (see apply_job_changes).
+
+    A model built with from_jobs also keeps, for every skill, a bitset of the positions
+    (in scan order) of the jobs that list it. recommend() uses the pair counts to find the
+    candidate skills and the bitsets to count each candidate's distinct matching jobs, so
+    it never loops over the matching jobs themselves.
+    """
+
+    def __init__(self, example_cap: int = EXAMPLE_JOBS_CAP):
+        self.example_cap = example_cap
+        self.job_counts: Counter = Counter()
+        self.pair_counts: Dict[str, Counter] = {}
+        self.example_jobs: Dict[str, List[dict]] = {}
+        self.removed_examples: Dict[str, List[str]] = {}
+        # Filled by from_jobs only: job titles by position, and per skill a bitset of job positions
+        self.job_titles: List[str] = []
+        self.job_bits: Dict[str, int] = {}
+
+    def add_job(self, skills: List[str], job_title: str, job_id: Optional[str] = None, weight: int = 1):
+        distinct = list(dict.fromkeys(skills))
+        for skill in distinct:
+            self.job_counts[skill] += weight
+            pairs = self.pair_counts.setdefault(skill, Counter())
+            for other in distinct:
+                if other != skill:
+                    pairs[other] += weight
+
+            if weight > 0:
+                examples = self.example_jobs.setdefault(skill, [])
+                if len(examples) < self.example_cap:
+                    examples.append({"id": job_id, "job_title": job_title})
+            else:
+                self.removed_examples.setdefault(skill, []).append(job_id)
+
+    def remove_job(self, skills: List[str], job_title: str, job_id: Optional[str] = None):
+        self.add_job(skills, job_title, job_id, weight=-1)
+
+    def recommend(self, user_skills: List[str], k: int = 5, example_count: int = 3) -> List[dict]:
+        """
+        Rank skills the user lacks by the number of jobs that list them and at least one of the user's skills.
+
+        Requires a model built with from_jobs. Ties go to the skill listed by the earliest
+        matching job (in the order the jobs were read), then to the alphabetically first one.
+        Example jobs are the first matching jobs that list the skill, in that same order.
+
+        Args:
+            user_skills (List[str]): The user's current skills.
+            k (int): Number of skills to recommend.
+            example_count (int): Example job titles returned per skill.
+
+        Returns:
+            List[dict]: Recommendations in the /get_recommended_skill_to_learn response format.
+        """
+        owned = set(user_skills)
+        matching = 0
+        candidates = set()
+        for skill in owned:
+            matching |= self.job_bits.get(skill, 0)
+            candidates.update(self.pair_counts.get(skill, {}))
+        candidates -= owned
+
+        ranked = []
+        for skill in candidates:
+            common = self.job_bits.get(skill, 0) & matching
+            if common:
+                first = (common & -common).bit_length() - 1
+                ranked.append((-common.bit_count(), first, skill, common))
+
+        recommendations = []
+        for negative_count, _, skill, common in heapq.nsmallest(k, ranked):
+            examples = []
+            while common and len(examples) < example_count:
+                lowest = common & -common
+                examples.append(self.job_titles[lowest.bit_length() - 1])
+                common ^= lowest
+            recommendations.append({"skill": skill, "frequency": -negative_count, "example_jobs": examples})
+        return recommendations
+
+    @classmethod
+    def from_jobs(cls, jobs: Iterable[dict], example_cap: int = EXAMPLE_JOBS_CAP) -> "CooccurrenceModel":
+        model = cls(example_cap)
+        positions: Dict[str, List[int]] = {}
+        for job in jobs:
+            skills = job.get("skills", []) or []
+            model.add_job(skills, job["job_title"], job.get("id"))
+            for skill in set(skills):
+                positions.setdefault(skill, []).append(len(model.job_titles))
+            model.job_titles.append(job["job_title"])
+
+        # Bitsets are packed from the position lists at the end; growing Python ints job by job is quadratic
+        for skill, skill_positions in positions.items():
+            bits = np.zeros(len(model.job_titles), dtype=bool)
+            bits[skill_positions] = True
+            model.job_bits[skill] = int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little")
+        return model
+
+    def to_documents(self) -> List[dict]:
+        return [
+            {
+                "skill": skill,
+                "job_count": self.job_counts[skill],
+                "co": {_field_key(other): count for other, count in self.pair_counts.get(skill, {}).items() if count},
+                "example_jobs": self.example_jobs.get(skill, []),
+            }
+            for skill in self.job_counts
+        ]
+
+    def to_update_operations(self) -> List[UpdateOne]:
+        """
+        Express this (delta) model as $inc upserts against the persisted collection.
+        """
+        operations = []
+        for skill in set(self.job_counts) | set(self.removed_examples):
+            increments = {f"co.{_field_key(other)}": count for other, count in self.pair_counts.get(skill, {}).items() if count}
+            if self.job_counts[skill]:
+                increments["job_count"] = self.job_counts[skill]
+
+            # $pull and $push cannot target the same field in one update. Examples are removed by job id,
+            # so other jobs with the same title keep theirs
+            if self.removed_examples.get(skill):
+                operations.append(
+                    UpdateOne(
+                        {"skill": skill}, {"$pull": {"example_jobs": {"id": {"$in": self.removed_examples[skill]}}}}
+                    )
+                )
+
+            update = {}
+            if increments:
+                update["$inc"] = increments
+            if self.example_jobs.get(skill):
+                update["$push"] = {"example_jobs": {"$each": self.example_jobs[skill], "$slice": self.example_cap}}
+            if update:
+                operations.append(UpdateOne({"skill": skill}, update, upsert=True))
+        return operations
+
+
+# Function to apply a batch of job inserts/updates to the persisted co-occurrence model
+def apply_job_changes(collection, previous_jobs: Dict[str, dict], jobs: List[dict]) -> int:
+    """
+    Update the co-occurrence collection for jobs that were just written.
+
+    Args:
+        collection: The skill_cooccurrence collection.
+        previous_jobs (Dict[str, dict]): Stored state of the written jobs before the write,
+            keyed by job id (missing for new jobs).
+        jobs (List[dict]): The jobs as written.
+
+    Returns:
+        int: Number of skill documents touched.
+    """
+    delta = CooccurrenceModel()
+    # A job repeated within a batch is written once (the last copy wins), so it must be counted once
+    for job in {job["id"]: job for job in jobs}.values():
+        previous: Optional[dict] = previous_jobs.get(job["id"])
+        if previous is not None:
+            if previous.get("skills") == job["skills"] and previous.get("job_title") == job["job_title"]:
+                continue
+            delta.remove_job(previous.get("skills") or [], previous.get("job_title"), job["id"])
+        delta.add_job(job["skills"], job["job_title"], job["id"])
+
+    operations = delta.to_update_operations()
+    if operations:
+        collection.bulk_write(operations, ordered=True)
+        bump_version(collection)
+    return len(operations)
+
+
+# Function to rebuild the persisted co-occurrence model from every stored job
+def rebuild_collection(collection, jobs: Iterable[dict]) -> int:
+    model = CooccurrenceModel.from_jobs(jobs)
+    documents = model.to_documents()
+    # The version document is kept, so its counter keeps increasing across rebuilds
+    collection.delete_many(SKILL_DOCUMENTS)
+    if documents:
+        collection.insert_many(documents)
+    collection.create_index("skill", unique=True)
+    bump_version(collection)
+    return len(documents)
+
+
+def bump_version(collection):
+    collection.update_one({"_id": VERSION_DOCUMENT_ID}, {"$inc": {"version": 1}}, upsert=True)
+
+
+def model_version(collection) -> Optional[int]:
+    """
+    The persisted model's change counter, or None if it was never written by this version of ingest.py.
+    """
+    document = collection.find_one({"_id": VERSION_DOCUMENT_ID})
+    return document["version"] if document else None
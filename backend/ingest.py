@@ -0,0 +1,576 @@
+"""
+Streaming, parallel ingestion of scraped LinkedIn job CSVs.
+
+Rows are read in fixed-size chunks, skill extraction runs across a process pool,
+and parsed jobs are handed to a single writer thread through a bounded queue.
+Only a few chunks are ever in flight, so memory stays flat regardless of file size.
+
+Usage (from the backend directory):
+    python ingest.py linkedin_jobs.csv
+    python ingest.py big_export.csv --workers 8 --chunk-size 2000 --batch-size 1000
+    python ingest.py linkedin_jobs.csv --dry-run
+    python ingest.py daily_export.csv --delta
+    python ingest.py linkedin_jobs.csv --rebuild-cooccurrence
+"""
+
+import argparse
+import csv
+import hashlib
+import os
+import queue
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import ConnectionFailure, PyMongoError
+
+from cooccurrence import apply_job_changes, rebuild_collection
+from taxonomy import TaxonomySnapshot, load_taxonomy
+
+
+# Columns a row must have (non-empty) to become a job
+REQUIRED_FIELDS = ["Title", "Company", "Date", "Job Link", "Description"]
+
+
+def _normalize_link(job_link: str) -> str:
+    # LinkedIn adds per-scrape tracking parameters (refId, trackingId) to otherwise identical URLs
+    return job_link.strip().split("?", 1)[0].split("#", 1)[0].rstrip("/")
+
+
+def _normalize_text(value: str) -> str:
+    return re.sub(r"\s+", " ", value).strip()
+
+
+# Function to derive a stable job id from the posting itself
+def make_job_id(job_link: str, job_title: str, company: str) -> str:
+    """
+    Hash the job link, title and company into a deterministic id.
+
+    The query string is dropped from the link so repeated scrapes of a posting get the same id.
+
+    Returns:
+        str: A 24-character hex id, the same length as a MongoDB ObjectId string.
+    """
+    key = "\x1f".join([_normalize_link(job_link), job_title.strip().lower(), company.strip().lower()])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+
+
+# Function to fingerprint a row's content so unchanged rows can be skipped on re-ingestion
+def make_row_fingerprint(row: dict, taxonomy_version: str) -> str:
+    """
+    Hash the normalized row together with the taxonomy version.
+
+    Whitespace is collapsed and tracking parameters are dropped from the link, so only real
+    content changes alter the fingerprint. Including the taxonomy version means every job is
+    re-extracted once after the skill list changes.
+    """
+    values = [_normalize_text(row[field]) for field in REQUIRED_FIELDS if field != "Job Link"]
+    values.append(_normalize_link(row["Job Link"]))
+    values.append(taxonomy_version)
+    return hashlib.sha256("\x1f".join(values).encode("utf-8")).hexdigest()
+
+
+# Function to derive the key /jobs/company/{company_name} looks companies up by
+def normalize_company(company: str) -> str:
+    """
+    Casefold a company name, so a case-insensitive match becomes an indexed equality match.
+    """
+    return company.casefold()
+
+
+# Function to derive the canonical form /jobs/skills/{skills} matches skills in
+def normalize_skill(skill: str) -> str:
+    return skill.strip().casefold()
+
+
+# Function to compute the search fields stored alongside a job's own fields
+def add_search_fields(job: dict) -> dict:
+    job["company_key"] = normalize_company(job["company"])
+    # Distinct canonical skills, so skill filters are single $in/$all queries on a multikey index
+    job["skill_keys"] = sorted({normalize_skill(skill) for skill in job.get("skills") or []})
+    return job
+
+
+def _is_complete_row(row: dict) -> bool:
+    return all((row.get(field) or "").strip() for field in REQUIRED_FIELDS)
+
+
+# Function to turn one CSV row into a job document, or None if it should be skipped
+def parse_job_row(row: dict, taxonomy: TaxonomySnapshot) -> Optional[dict]:
+    if not _is_complete_row(row):
+        return None
+
+    parsed_skills = taxonomy.matcher.find(row["Description"])
+    if not parsed_skills:
+        return None
+
+    return add_search_fields(
+        {
+            "id": make_job_id(row["Job Link"], row["Title"], row["Company"]),
+            "job_title": row["Title"],
+            "company": row["Company"],
+            "date": row["Date"],
+            "job_link": row["Job Link"],
+            "skills": parsed_skills,
+            "fingerprint": make_row_fingerprint(row, taxonomy.version),
+        }
+    )
+
+
+# Function to read a CSV file lazily in chunks, keeping only the columns we use
+def read_row_chunks(csv_file_path: str, chunk_size: int) -> Iterator[List[dict]]:
+    with open(csv_file_path, "r", newline="", encoding="utf-8") as file:
+        chunk = []
+        for row in csv.DictReader(file):
+            chunk.append({field: row.get(field) for field in REQUIRED_FIELDS})
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+# Function to load selected fields of stored jobs for a batch of job ids in one query
+def fetch_stored_jobs(collection, job_ids: List[str], fields: List[str]) -> Dict[str, dict]:
+    projection = {field: 1 for field in fields}
+    projection.update({"id": 1, "_id": 0})
+    return {doc["id"]: doc for doc in collection.find({"id": {"$in": job_ids}}, projection)}
+
+
+# Function to look up the stored fingerprints for a batch of job ids in one query per collection
+def fetch_job_fingerprints(collection, job_ids: List[str], skipped_collection=None) -> Dict[str, str]:
+    stored = fetch_stored_jobs(collection, job_ids, ["fingerprint"])
+    fingerprints = {job_id: doc.get("fingerprint") for job_id, doc in stored.items()}
+    if skipped_collection is not None:
+        # A row seen without skills is more recent than a job stored from an earlier version of it
+        for doc in skipped_collection.find({"_id": {"$in": job_ids}}):
+            fingerprints[doc["_id"]] = doc["fingerprint"]
+    return fingerprints
+
+
+# Function to remember the fingerprints of complete rows that had no skills, so delta runs skip them too
+def record_skipped_rows(collection, skipped: List[dict], max_retries: int = 3) -> int:
+    operations = [
+        UpdateOne({"_id": row["id"]}, {"$set": {"fingerprint": row["fingerprint"]}}, upsert=True) for row in skipped
+    ]
+    return _write_batch_with_retry(collection, operations, max_retries, retry_delay=0.5) if operations else 0
+
+
+def bulk_upsert_jobs(
+    jobs: Iterable[dict], collection, batch_size: int = 500, max_retries: int = 3, retry_delay: float = 0.5
+) -> int:
+    """
+    Upsert jobs by id using unordered bulk_write batches.
+
+    Because job ids are deterministic, re-ingesting the same CSV matches the existing
+    documents instead of duplicating them. Each batch is retried with exponential backoff
+    on transient errors (lost connections, retryable write errors); retrying is safe
+    because every operation is an idempotent upsert.
+
+    Args:
+        jobs (Iterable[dict]): Job documents, each with an "id" field.
+        collection: The MongoDB jobs collection.
+        batch_size (int): Maximum operations per bulk_write round trip.
+        max_retries (int): Retries per batch before the error is raised.
+        retry_delay (float): Initial backoff in seconds, doubled after each retry.
+
+    Returns:
+        int: Number of jobs inserted or modified.
+    """
+    written = 0
+    # Keyed by id so a posting repeated within a batch becomes one upsert, not a duplicate-key race
+    batch = {}
+    for job in jobs:
+        batch[job["id"]] = UpdateOne({"id": job["id"]}, {"$set": job}, upsert=True)
+        if len(batch) >= batch_size:
+            written += _write_batch_with_retry(collection, list(batch.values()), max_retries, retry_delay)
+            batch = {}
+    if batch:
+        written += _write_batch_with_retry(collection, list(batch.values()), max_retries, retry_delay)
+    return written
+
+
+def _write_batch_with_retry(collection, operations: List[UpdateOne], max_retries: int, retry_delay: float) -> int:
+    attempt = 0
+    while True:
+        try:
+            result = collection.bulk_write(operations, ordered=False)
+            return result.upserted_count + result.modified_count
+        except PyMongoError as e:
+            transient = isinstance(e, ConnectionFailure) or e.has_error_label("RetryableWriteError")
+            if not transient or attempt >= max_retries:
+                raise
+            delay = retry_delay * (2**attempt)
+            attempt += 1
+            print(f"INFO: Transient MongoDB error, retrying batch in {delay:.1f}s ({attempt}/{max_retries}): {str(e)}")
+            time.sleep(delay)
+
+
+def backfill_search_fields(collection, batch_size: int = 500, max_retries: int = 3, dry_run: bool = False) -> dict:
+    """
+    Recompute the search fields of every stored job and write those that are missing or stale.
+
+    Used once after a search field is added, for jobs ingested before it existed. Jobs are read
+    with one cursor and only changed fields are written, in unordered bulk_write batches.
+
+    Returns:
+        dict: Counts of jobs scanned and updated.
+    """
+    scanned = updated = 0
+    batch = []
+    for job in collection.find({}):
+        scanned += 1
+        derived = add_search_fields(dict(job))
+        changes = {field: value for field, value in derived.items() if job.get(field) != value}
+        if not changes:
+            continue
+        updated += 1
+        batch.append(UpdateOne({"_id": job["_id"]}, {"$set": changes}))
+        if len(batch) >= batch_size:
+            if not dry_run:
+                _write_batch_with_retry(collection, batch, max_retries, retry_delay=0.5)
+            batch = []
+    if batch and not dry_run:
+        _write_batch_with_retry(collection, batch, max_retries, retry_delay=0.5)
+    return {"scanned": scanned, "updated": updated}
+
+
+# Function to move jobs stored before ids were deterministic onto make_job_id, dropping duplicate copies
+def migrate_job_ids(collection, batch_size: int = 500, max_retries: int = 3, dry_run: bool = False) -> dict:
+    """
+    Rewrite the `id` of every stored job to make_job_id of its link, title and company.
+
+    Jobs ingested before ids were derived from the posting have random ids, so re-ingesting
+    them would add a second copy. Jobs that map to the same id are duplicates of one posting:
+    the copy that already has the derived id is kept (otherwise the most recently inserted
+    one), and the others are deleted before any id is rewritten, so the unique index on `id`
+    never sees two copies. Safe to re-run: jobs that already have their derived id are not written.
+
+    Returns:
+        dict: Counts of jobs scanned, re-identified and deleted as duplicates.
+    """
+    keep: Dict[str, dict] = {}
+    duplicates = []
+    scanned = 0
+    for job in collection.find({}, {"_id": 1, "id": 1, "job_link": 1, "job_title": 1, "company": 1}):
+        scanned += 1
+        job_id = make_job_id(job["job_link"], job["job_title"], job["company"])
+        current = keep.get(job_id)
+        if current is None:
+            keep[job_id] = job
+            continue
+        # ObjectIds grow with insertion time, so the larger _id is the more recent copy
+        if current.get("id") != job_id and (job.get("id") == job_id or job["_id"] > current["_id"]):
+            keep[job_id], job = job, current
+        duplicates.append(job["_id"])
+
+    renames = [(job["_id"], job_id) for job_id, job in keep.items() if job.get("id") != job_id]
+    if not dry_run:
+        for start in range(0, len(duplicates), batch_size):
+            collection.delete_many({"_id": {"$in": duplicates[start : start + batch_size]}})
+        for start in range(0, len(renames), batch_size):
+            operations = [
+                UpdateOne({"_id": _id}, {"$set": {"id": job_id}}) for _id, job_id in renames[start : start + batch_size]
+            ]
+            _write_batch_with_retry(collection, operations, max_retries, retry_delay=0.5)
+    return {"scanned": scanned, "renamed": len(renames), "deleted": len(duplicates)}
+
+
+# Each worker process loads its own copy of the taxonomy once
+_worker_taxonomy: Optional[TaxonomySnapshot] = None
+
+
+def _init_worker(json_file_path: str):
+    global _worker_taxonomy
+    _worker_taxonomy = load_taxonomy(json_file_path)
+
+
+def _extract_chunk(rows: List[dict]) -> List[dict]:
+    jobs = []
+    for row in rows:
+        job = parse_job_row(row, _worker_taxonomy)
+        if job is not None:
+            jobs.append(job)
+    return jobs
+
+
+class IngestStats:
+    """
+    Counters for an ingestion run, safe to read from the progress reporter.
+    """
+
+    def __init__(self):
+        self.rows_read = 0
+        self.jobs_parsed = 0
+        self.jobs_written = 0
+        # Only counted in delta mode
+        self.new_rows = 0
+        self.changed_rows = 0
+        self.unchanged_rows = 0
+        # New or changed rows that had no skills, so no job was written for them
+        self.skipped_rows = 0
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def summary(self) -> dict:
+        elapsed = self.elapsed
+        return {
+            "rows_read": self.rows_read,
+            "jobs_parsed": self.jobs_parsed,
+            "jobs_written": self.jobs_written,
+            "new": self.new_rows,
+            "changed": self.changed_rows,
+            "unchanged": self.unchanged_rows,
+            "skipped": self.skipped_rows,
+            "elapsed_seconds": round(elapsed, 2),
+            "rows_per_second": round(self.rows_read / elapsed, 1) if elapsed else 0.0,
+        }
+
+
+def stream_ingest(
+    csv_file_path: str,
+    json_file_path: str,
+    write_batch: Callable[[List[dict]], int],
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    queue_size: int = 4,
+    progress_interval: float = 5.0,
+    lookup_fingerprints: Optional[Callable[[List[str]], Dict[str, str]]] = None,
+    record_skipped: Optional[Callable[[List[dict]], int]] = None,
+) -> IngestStats:
+    """
+    Ingest a job CSV in chunks, extracting skills in parallel and writing as results arrive.
+
+    Args:
+        csv_file_path (str): The scraped job CSV.
+        json_file_path (str): The skill taxonomy JSON file.
+        write_batch (Callable): Called from the writer thread with each list of parsed jobs;
+            returns the number of jobs it wrote.
+        workers (int, optional): Size of the process pool. Defaults to the CPU count.
+            Use 0 to extract skills in the calling process.
+        chunk_size (int): Number of CSV rows sent to a worker at a time.
+        queue_size (int): Maximum parsed chunks waiting for the writer. When the writer falls
+            behind, reading pauses instead of buffering more rows.
+        progress_interval (float): Seconds between progress lines. Use 0 to disable.
+        lookup_fingerprints (Callable, optional): Enables delta mode. Called with the job ids of
+            each chunk and returns their stored fingerprints; rows whose fingerprint is unchanged
+            skip skill extraction and writing.
+        record_skipped (Callable, optional): In delta mode, called from the writer thread with the
+            {"id", "fingerprint"} of new or changed rows that had no skills. Storing them where
+            lookup_fingerprints finds them lets the next run count these rows as unchanged.
+
+    Returns:
+        IngestStats: Row, job and throughput counters for the run.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    stats = IngestStats()
+    results = queue.Queue(maxsize=queue_size)
+    writer_errors = []
+    done = threading.Event()
+
+    def writer():
+        while True:
+            item = results.get()
+            if item is None:
+                return
+            if writer_errors:
+                # Keep draining so the reader never blocks on a full queue
+                continue
+            jobs, skipped = item
+            try:
+                stats.jobs_written += write_batch(jobs) if jobs else 0
+                if skipped and record_skipped is not None:
+                    record_skipped(skipped)
+            except Exception as e:
+                writer_errors.append(e)
+
+    def reporter():
+        while not done.wait(progress_interval):
+            summary = stats.summary()
+            print(
+                f"INFO: {summary['rows_read']} rows read, {summary['jobs_parsed']} jobs parsed, "
+                f"{summary['jobs_written']} written ({summary['rows_per_second']} rows/s)"
+            )
+
+    writer_thread = threading.Thread(target=writer, name="ingest-writer", daemon=True)
+    writer_thread.start()
+    if progress_interval > 0:
+        threading.Thread(target=reporter, name="ingest-progress", daemon=True).start()
+
+    def publish(jobs: List[dict], fingerprints: Optional[Dict[str, str]]):
+        stats.jobs_parsed += len(jobs)
+        skipped = []
+        if fingerprints:
+            # Every row sent for extraction in delta mode is complete, so a missing job means no skills were found
+            parsed = {job["id"] for job in jobs}
+            skipped = [
+                {"id": job_id, "fingerprint": fingerprint}
+                for job_id, fingerprint in fingerprints.items()
+                if job_id not in parsed
+            ]
+            stats.skipped_rows += len(skipped)
+        results.put((jobs, skipped))
+
+    # The main process only needs the taxonomy version to fingerprint rows in delta mode
+    taxonomy = load_taxonomy(json_file_path) if workers == 0 or lookup_fingerprints else None
+
+    # Yields each chunk of rows to extract, with the fingerprints of its rows in delta mode (None otherwise)
+    def chunks_to_extract() -> Iterator[Tuple[List[dict], Optional[Dict[str, str]]]]:
+        for rows in read_row_chunks(csv_file_path, chunk_size):
+            stats.rows_read += len(rows)
+            if lookup_fingerprints is None:
+                yield rows, None
+                continue
+
+            fingerprinted = []
+            for row in rows:
+                if _is_complete_row(row):
+                    job_id = make_job_id(row["Job Link"], row["Title"], row["Company"])
+                    fingerprinted.append((job_id, make_row_fingerprint(row, taxonomy.version), row))
+            stored = lookup_fingerprints([job_id for job_id, _, _ in fingerprinted]) if fingerprinted else {}
+
+            changed = []
+            fingerprints = {}
+            for job_id, fingerprint, row in fingerprinted:
+                if job_id not in stored:
+                    stats.new_rows += 1
+                elif stored[job_id] != fingerprint:
+                    stats.changed_rows += 1
+                else:
+                    stats.unchanged_rows += 1
+                    continue
+                changed.append(row)
+                fingerprints[job_id] = fingerprint
+            if changed:
+                yield changed, fingerprints
+
+    try:
+        if workers == 0:
+            for rows, fingerprints in chunks_to_extract():
+                publish([job for job in (parse_job_row(row, taxonomy) for row in rows) if job is not None], fingerprints)
+                if writer_errors:
+                    break
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(json_file_path,)
+            ) as pool:
+                # Bound the number of chunks in flight; results are published in file order
+                in_flight = deque()
+                for rows, fingerprints in chunks_to_extract():
+                    in_flight.append((pool.submit(_extract_chunk, rows), fingerprints))
+                    if len(in_flight) >= workers * 2:
+                        future, chunk_fingerprints = in_flight.popleft()
+                        publish(future.result(), chunk_fingerprints)
+                    if writer_errors:
+                        break
+                while in_flight:
+                    future, chunk_fingerprints = in_flight.popleft()
+                    if writer_errors:
+                        future.cancel()
+                    else:
+                        publish(future.result(), chunk_fingerprints)
+    finally:
+        results.put(None)
+        writer_thread.join()
+        stats.finished_at = time.perf_counter()
+        done.set()
+
+    if writer_errors:
+        raise writer_errors[0]
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("csv_file", help="Scraped job CSV to ingest")
+    parser.add_argument("--skills", default="tech-skills-json.json", help="Skill taxonomy JSON file")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count, 0: in-process)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="CSV rows per worker task")
+    parser.add_argument("--batch-size", type=int, default=500, help="Upserts per MongoDB bulk_write")
+    parser.add_argument("--queue-size", type=int, default=4, help="Parsed chunks buffered for the writer")
+    parser.add_argument("--progress-interval", type=float, default=5.0, help="Seconds between progress lines")
+    parser.add_argument("--dry-run", action="store_true", help="Parse and count jobs without writing to MongoDB")
+    parser.add_argument("--delta", action="store_true", help="Skip rows whose fingerprint is unchanged in MongoDB")
+    parser.add_argument(
+        "--rebuild-cooccurrence",
+        action="store_true",
+        help="Rebuild the skill co-occurrence model from all stored jobs after ingesting",
+    )
+    args = parser.parse_args()
+
+    jobs_collection = cooccurrence_collection = skipped_collection = None
+    if not args.dry_run or args.delta:
+        # Importing main sets up the MongoDB connection the same way the API does
+        from main import jobs_collection, skill_cooccurrence_collection as cooccurrence_collection
+
+        # Fingerprints of rows that had no skills; only ingest.py reads them
+        skipped_collection = jobs_collection.database["ingest_skipped_rows"]
+
+    def write_batch(jobs):
+        if args.dry_run:
+            return len(jobs)
+        job_ids = [job["id"] for job in jobs]
+        if args.rebuild_cooccurrence:
+            written = bulk_upsert_jobs(jobs, jobs_collection, batch_size=args.batch_size)
+        else:
+            # Keep the co-occurrence model in step with the jobs: read the previous state first,
+            # then apply the difference once the jobs are written
+            previous = fetch_stored_jobs(jobs_collection, job_ids, ["skills", "job_title"])
+            written = bulk_upsert_jobs(jobs, jobs_collection, batch_size=args.batch_size)
+            apply_job_changes(cooccurrence_collection, previous, jobs)
+        # The stored job now holds the row's latest fingerprint
+        skipped_collection.delete_many({"_id": {"$in": job_ids}})
+        return written
+
+    lookup_fingerprints = record_skipped = None
+    if args.delta:
+
+        def lookup_fingerprints(job_ids):
+            return fetch_job_fingerprints(jobs_collection, job_ids, skipped_collection)
+
+        def record_skipped(skipped):
+            return 0 if args.dry_run else record_skipped_rows(skipped_collection, skipped)
+
+    stats = stream_ingest(
+        args.csv_file,
+        args.skills,
+        write_batch,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        queue_size=args.queue_size,
+        progress_interval=args.progress_interval,
+        lookup_fingerprints=lookup_fingerprints,
+        record_skipped=record_skipped,
+    )
+    summary = stats.summary()
+    print(
+        f"SUCCESS: Ingested {summary['rows_read']} rows into {summary['jobs_written']} jobs "
+        f"in {summary['elapsed_seconds']}s ({summary['rows_per_second']} rows/s)"
+    )
+    if args.delta:
+        print(
+            f"INFO: Delta: {summary['new']} new, {summary['changed']} changed, {summary['unchanged']} unchanged rows "
+            f"({summary['skipped']} new or changed rows had no skills)"
+        )
+
+    if args.rebuild_cooccurrence and not args.dry_run:
+        skill_count = rebuild_collection(
+            cooccurrence_collection, jobs_collection.find({}, {"_id": 0, "id": 1, "skills": 1, "job_title": 1})
+        )
+        print(f"SUCCESS: Rebuilt skill co-occurrence model ({skill_count} skills)")
+
+
+if __name__ == "__main__":
+    main()
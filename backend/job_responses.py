@@ -0,0 +1,44 @@
+import json
+from typing import Iterable, Iterator
+
+from fastapi import Request
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # Falls back to the standard json encoder
+    orjson = None
+
+
+# The Job model's fields: job listings read only these from MongoDB and return the documents as they are
+JOB_PROJECTION = {"_id": 0, "id": 1, "job_title": 1, "company": 1, "date": 1, "job_link": 1, "skills": 1}
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def dumps(value) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=str)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def json_response(content) -> Response:
+    """
+    Encode `content` directly into a JSON response.
+
+    Returning a Response skips FastAPI's validation against the route's response_model (which
+    then only documents the shape), so callers must pass data that already matches it.
+    """
+    return Response(content=dumps(content), media_type="application/json")
+
+
+def wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_lines(documents: Iterable[dict]) -> Iterator[bytes]:
+    """
+    Encode documents as NDJSON, one line per document, as they are read.
+    """
+    for document in documents:
+        yield dumps(document) + b"\n"
@@ -0,0 +1,214 @@
+import asyncio
+import random
+import time
+from typing import AsyncIterator, List, Optional
+
+import httpx
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
+
+
+class LLMError(Exception):
+    """Raised when the LLM provider fails after all retries."""
+
+
+class LLMTimeoutError(LLMError):
+    """Raised when an LLM call does not finish before its deadline."""
+
+
+class LLMBusyError(LLMError):
+    """Raised when no LLM call slot frees up before the deadline."""
+
+
+# Errors worth retrying: network failures, timeouts of one attempt, rate limits and 5xx responses
+RETRYABLE_ERRORS = (APIConnectionError, APITimeoutError, RateLimitError, InternalServerError)
+
+
+class LLMClient:
+    """
+    Async, deadline-bounded wrapper around an OpenAI-compatible chat completions API.
+
+    One AsyncOpenAI client (and its pooled HTTP connections) is shared by every call. At
+    most `max_concurrency` calls are in flight; the rest wait for a slot within their
+    deadline. Retryable failures are retried up to `max_retries` times with full-jitter
+    exponential backoff, but never past the call's deadline. `base_url` can point at any
+    OpenAI-compatible server, e.g. benchmarks/fake_openai_server.py in development.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        base_url: Optional[str] = None,
+        timeout: float = 60.0,
+        max_concurrency: int = 8,
+        max_retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+    ):
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.client = AsyncOpenAI(
+            api_key=api_key or "missing",
+            base_url=base_url,
+            # Retries and deadlines are handled here, so the SDK's own retry loop is disabled
+            max_retries=0,
+            timeout=timeout,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+                timeout=timeout,
+            ),
+        )
+        self._slots = None
+        self._in_flight = 0
+        self._calls = 0
+        self._retries = 0
+        self._failures = 0
+        self._timeouts = 0
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so the semaphore binds to the running event loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        return self._slots
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    async def _acquire(self, deadline: float):
+        try:
+            await asyncio.wait_for(self._semaphore().acquire(), max(deadline - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            raise LLMBusyError("Timed out waiting for an LLM call slot")
+
+    async def _retry_wait(self, attempt: int, deadline: float, error: Exception) -> bool:
+        """
+        Sleep before the next attempt. Returns False when no attempt is left in the budget.
+        """
+        if attempt >= self.max_retries or not isinstance(error, RETRYABLE_ERRORS):
+            return False
+        delay = self._backoff(attempt)
+        if time.monotonic() + delay >= deadline:
+            return False
+        self._retries += 1
+        print(f"INFO: Retrying LLM call after {type(error).__name__} (attempt {attempt + 2})")
+        await asyncio.sleep(delay)
+        return True
+
+    def _raise_final(self, error: Exception, deadline: float):
+        self._failures += 1
+        if isinstance(error, (APITimeoutError, asyncio.TimeoutError)) or time.monotonic() >= deadline:
+            self._timeouts += 1
+            raise LLMTimeoutError("LLM call timed out") from error
+        if isinstance(error, APIStatusError):
+            raise LLMError(f"LLM provider returned {error.status_code}") from error
+        raise LLMError(f"LLM call failed: {type(error).__name__}") from error
+
+    async def complete(self, messages: List[dict], model: str, timeout: Optional[float] = None, **kwargs) -> str:
+        """
+        Run a chat completion and return the message content.
+
+        Args:
+            messages (List[dict]): Chat messages.
+            model (str): Model name.
+            timeout (float, optional): Deadline for the whole call, including waiting for a
+                slot and retries; defaults to the client timeout.
+
+        Raises:
+            LLMTimeoutError: If the deadline passes.
+            LLMBusyError: If no call slot frees up in time.
+            LLMError: If the provider keeps failing or returns a non-retryable error.
+        """
+        deadline = time.monotonic() + (timeout or self.timeout)
+        await self._acquire(deadline)
+        self._in_flight += 1
+        self._calls += 1
+        try:
+            attempt = 0
+            while True:
+                try:
+                    completion = await asyncio.wait_for(
+                        self.client.chat.completions.create(
+                            model=model, messages=messages, timeout=max(deadline - time.monotonic(), 0.001), **kwargs
+                        ),
+                        max(deadline - time.monotonic(), 0),
+                    )
+                    return completion.choices[0].message.content
+                except (APIStatusError, APIConnectionError, asyncio.TimeoutError) as e:
+                    if not await self._retry_wait(attempt, deadline, e):
+                        self._raise_final(e, deadline)
+                    attempt += 1
+        finally:
+            self._in_flight -= 1
+            self._semaphore().release()
+
+    async def stream(
+        self, messages: List[dict], model: str, timeout: Optional[float] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Run a streaming chat completion, yielding content deltas as they arrive.
+
+        Failures before the first delta are retried like complete(); once text has been
+        yielded a failure is raised to the caller, since the partial output was already sent.
+
+        Raises:
+            LLMTimeoutError, LLMBusyError, LLMError: As for complete().
+        """
+        deadline = time.monotonic() + (timeout or self.timeout)
+        await self._acquire(deadline)
+        self._in_flight += 1
+        self._calls += 1
+        try:
+            attempt = 0
+            while True:
+                started = False
+                try:
+                    response = await asyncio.wait_for(
+                        self.client.chat.completions.create(
+                            model=model,
+                            messages=messages,
+                            stream=True,
+                            timeout=max(deadline - time.monotonic(), 0.001),
+                            **kwargs,
+                        ),
+                        max(deadline - time.monotonic(), 0),
+                    )
+                    async with response:
+                        iterator = response.__aiter__()
+                        while True:
+                            try:
+                                chunk = await asyncio.wait_for(iterator.__anext__(), max(deadline - time.monotonic(), 0))
+                            except StopAsyncIteration:
+                                return
+                            if chunk.choices and chunk.choices[0].delta.content:
+                                started = True
+                                yield chunk.choices[0].delta.content
+                except (APIStatusError, APIConnectionError, asyncio.TimeoutError) as e:
+                    if started or not await self._retry_wait(attempt, deadline, e):
+                        self._raise_final(e, deadline)
+                    attempt += 1
+        finally:
+            self._in_flight -= 1
+            self._semaphore().release()
+
+    def metrics(self) -> dict:
+        return {
+            "in_flight": self._in_flight,
+            "max_concurrency": self.max_concurrency,
+            "calls": self._calls,
+            "retries": self._retries,
+            "failures": self._failures,
+            "timeouts": self._timeouts,
+        }
+
+    async def close(self):
+        await self.client.close()
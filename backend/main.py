@@ -1,26 +1,88 @@
 # Import necessary libraries and modules
-from fastapi import FastAPI, HTTPException, Query, Depends, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, Query, Depends, UploadFile, File, Form, Request, Header
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Dict
+from typing import BinaryIO, Callable, Iterable, List, Dict, Optional
 from bson import ObjectId
 from pymongo import MongoClient
 import csv
 import json
+import hashlib
+import hmac
 import re
 from collections import Counter
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.formparsers import MultiPartParser
 from passlib.context import CryptContext
 from pymongo.errors import DuplicateKeyError
 from docx import Document
-from PyPDF2 import PdfReader
-import io
-from openai import OpenAI
 import httpx
 import os
+import time
+import asyncio
+import shutil
+import tempfile
+import uuid
+from contextlib import asynccontextmanager
+from starlette.concurrency import run_in_threadpool
+from skill_matcher import SkillMatcher
+from taxonomy import TaxonomyRegistry, load_taxonomy
+from ingest import add_search_fields, bulk_upsert_jobs, normalize_company, normalize_skill, parse_job_row
+from skill_index import JOB_INDEX_PROJECTION, IndexRegistry, SkillIndex
+from title_index import TITLE_INDEX_PROJECTION, TitleIndex
+from pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, encode_cursor
+from job_responses import JOB_PROJECTION, NDJSON_MEDIA_TYPE, dumps, json_response, ndjson_lines, wants_ndjson
+from cooccurrence import CooccurrenceModel, model_version
+from async_db import AsyncDatabase, QueryTimeoutError
+from password_pool import PasswordHasherPool, PasswordPoolBusyError
+from uploads import UploadSizeLimitMiddleware, detect_resume_type
+from pdf_extract import PdfExtraction, PdfExtractor
+from resume_cache import ResumeAnalysisCache, file_sha256, make_cache_key
+from llm_client import LLMBusyError, LLMClient, LLMError, LLMTimeoutError
+from prompt_builder import ResumePromptBuilder
+from swr_cache import SingleFlightCache
+from rate_limit import SlidingWindowRateLimiter
+from snapshots import DatasetSnapshot, snapshot_response
+from analysis_jobs import AnalysisJobQueue, InMemoryJobStore, JobQueueFullError, MongoJobStore, FINISHED_STATES
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Start the background resume analysis workers (resuming unfinished jobs) and release pools on shutdown
+    await resume_job_queue.start()
+    yield
+    await resume_job_queue.stop()
+    await llm_client.close()
+    await singstat_http_client.aclose()
+    pdf_extractor.shutdown()
 
 
 # Initialize FastAPI app
-app = FastAPI(title="Job Processing API", description="API for searching and retrieving job listings", version="1.0.0")
+app = FastAPI(
+    title="Job Processing API",
+    description="API for searching and retrieving job listings",
+    version="1.0.0",
+    lifespan=lifespan,
+)
+
+# Maximum resume upload size (512 MB by default)
+MAX_FILE_SIZE = int(os.environ.get("MAX_UPLOAD_BYTES", str(512 * 1024 * 1024)))
+
+# Uploads are spooled to a temporary file that stays in memory up to this size and moves to disk beyond it
+MultiPartParser.spool_max_size = int(os.environ.get("UPLOAD_SPOOL_THRESHOLD", str(1024 * 1024)))
+
+# PDF text is extracted page-parallel on a process pool, within page, time and CPU limits
+pdf_extractor = PdfExtractor(
+    max_workers=int(os.environ.get("PDF_EXTRACT_WORKERS", "2")),
+    max_pages=int(os.environ.get("PDF_MAX_PAGES", "50")),
+    page_timeout=float(os.environ.get("PDF_PAGE_TIMEOUT", "5")),
+    cpu_budget=float(os.environ.get("PDF_CPU_BUDGET", "20")),
+    total_timeout=float(os.environ.get("PDF_TOTAL_TIMEOUT", "30")),
+)
+
+# Reject oversized uploads from Content-Length or a running byte count, before the body is buffered.
+# Added before CORS so the CORS middleware wraps it and 413 responses still carry CORS headers
+app.add_middleware(UploadSizeLimitMiddleware, paths={"/upload_resume"}, max_size=MAX_FILE_SIZE)
 
 # Add CORS middleware to allow cross-origin requests
 app.add_middleware(
@@ -36,8 +98,17 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
-# Set up password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Set up password hashing context; the bcrypt cost factor can be lowered per environment (e.g. tests)
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+# Hashing runs on a small dedicated pool with a bounded wait queue, so login bursts cannot freeze the API
+password_pool = PasswordHasherPool(
+    pwd_context,
+    max_workers=int(os.environ.get("PASSWORD_HASH_WORKERS", "2")),
+    max_queue=int(os.environ.get("PASSWORD_HASH_MAX_QUEUE", "32")),
+    queue_timeout=float(os.environ.get("PASSWORD_HASH_QUEUE_TIMEOUT", "5")),
+)
 
 
 # Function to read Docker secrets for local environment
@@ -57,6 +128,12 @@ def read_secret(secret_name):
     return None
 
 
+# MongoDB pool and timeout settings, configurable per environment
+MONGO_MAX_POOL_SIZE = int(os.environ.get("MONGO_MAX_POOL_SIZE", "50"))
+MONGO_EXECUTOR_WORKERS = int(os.environ.get("MONGO_EXECUTOR_WORKERS", "32"))
+MONGO_QUERY_TIMEOUT = float(os.environ.get("MONGO_QUERY_TIMEOUT", "10"))
+
+
 # Set up MongoDB connection
 connection_string = read_secret("mongodb_connection_string")
 
@@ -70,7 +147,7 @@ if connection_string is None:
 
 if connection_string:
     try:
-        client = MongoClient(connection_string)
+        client = MongoClient(connection_string, maxPoolSize=MONGO_MAX_POOL_SIZE)
         # Test the connection
         client.server_info()
         print("SUCCESS: Connected to MongoDB successfully")
@@ -83,6 +160,9 @@ if connection_string:
         market_trend_collection = db["market_trends"]
         employment_survey_collection = db["employment_survey"]
         singstat_backup = db["sing_stat_backup"]
+        skill_cooccurrence_collection = db["skill_cooccurrence"]
+        resume_analysis_cache_collection = db["resume_analysis_cache"]
+        resume_jobs_collection = db["resume_jobs"]
 
         print("INFO: Initialized all database collections")
     except Exception as e:
@@ -120,15 +200,215 @@ if OPENAI_API_KEY is None:
     else:
         print("ERROR: OpenAI API key not found in Docker secrets or environment")
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+# Async OpenAI client shared by all requests: pooled connections, per-call deadlines, bounded concurrency
+# and jittered retries. OPENAI_BASE_URL can point at any OpenAI-compatible server (e.g. a local fake)
+llm_client = LLMClient(
+    api_key=OPENAI_API_KEY,
+    base_url=os.environ.get("OPENAI_BASE_URL") or None,
+    timeout=float(os.environ.get("OPENAI_TIMEOUT", "60")),
+    max_concurrency=int(os.environ.get("OPENAI_MAX_CONCURRENCY", "8")),
+    max_retries=int(os.environ.get("OPENAI_MAX_RETRIES", "2")),
+)
 
 
 # Create a unique index on the username field to ensure email uniqueness
 auth_collection.create_index("username", unique=True)
 
+# Job ids are derived from the posting, so upserts during ingestion match on this index
+jobs_collection.create_index("id", unique=True)
+
+# Casefolded company names and skills, so company and skill lookups are index seeks (backfilled by migrate_jobs.py).
+# The id suffix serves the id-ordered pages, so every page is a bounded index range scan.
+jobs_collection.create_index([("company_key", 1), ("id", 1)])
+jobs_collection.create_index([("skill_keys", 1), ("id", 1)])
+
+
+# Async handles used by the endpoints: queries run on a bounded executor with per-query timeouts,
+# so a slow query never blocks the event loop
+async_db = AsyncDatabase(max_workers=MONGO_EXECUTOR_WORKERS, timeout=MONGO_QUERY_TIMEOUT)
+async_jobs_collection = async_db.wrap(jobs_collection)
+async_auth_collection = async_db.wrap(auth_collection)
+async_employment_survey_collection = async_db.wrap(employment_survey_collection)
+async_singstat_backup = async_db.wrap(singstat_backup)
+
+
+@app.exception_handler(QueryTimeoutError)
+async def query_timeout_handler(request, exc: QueryTimeoutError):
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+
+@app.exception_handler(PasswordPoolBusyError)
+async def password_pool_busy_handler(request, exc: PasswordPoolBusyError):
+    return JSONResponse(status_code=503, content={"detail": "Server busy, please try again"}, headers={"Retry-After": "1"})
+
+
+@app.exception_handler(JobQueueFullError)
+async def job_queue_full_handler(request, exc: JobQueueFullError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Too many resumes being analysed, please try again"},
+        headers={"Retry-After": "10"},
+    )
+
+
+@app.exception_handler(LLMError)
+async def llm_error_handler(request, exc: LLMError):
+    if isinstance(exc, LLMTimeoutError):
+        return JSONResponse(status_code=504, content={"detail": "AI suggestions timed out, please try again"})
+    if isinstance(exc, LLMBusyError):
+        return JSONResponse(
+            status_code=503, content={"detail": "Server busy, please try again"}, headers={"Retry-After": "5"}
+        )
+    return JSONResponse(status_code=502, content={"detail": "AI suggestions are unavailable, please try again"})
+
+
+# Analyses of identical resume uploads are reused; the Mongo tier is opt-in since it stores resume text
+resume_cache = ResumeAnalysisCache(
+    max_entries=int(os.environ.get("RESUME_CACHE_MAX_ENTRIES", "256")),
+    ttl=float(os.environ.get("RESUME_CACHE_TTL", str(7 * 24 * 3600))),
+    collection=(
+        resume_analysis_cache_collection
+        if os.environ.get("RESUME_CACHE_PERSISTENT", "false").lower() in ("1", "true", "yes")
+        else None
+    ),
+)
+
+
+# Resume analyses requested with mode=async run on background workers. Job state lives in the resume_jobs
+# collection by default so results survive a restart; RESUME_JOB_STORE=memory keeps it in-process.
+# Queued uploads are files in RESUME_JOB_DIR, so a job can only be resumed by a process that sees that
+# directory: with several API hosts it must be shared storage, otherwise taken-over jobs fail with 410.
+RESUME_JOB_DIR = os.environ.get("RESUME_JOB_DIR", os.path.join(tempfile.gettempdir(), "resume_jobs"))
+os.makedirs(RESUME_JOB_DIR, exist_ok=True)
+
+resume_job_queue = AnalysisJobQueue(
+    store=(
+        InMemoryJobStore()
+        if os.environ.get("RESUME_JOB_STORE", "mongo") == "memory"
+        else MongoJobStore(async_db.wrap(resume_jobs_collection))
+    ),
+    handler=lambda job: run_resume_analysis_job(job),
+    workers=int(os.environ.get("RESUME_JOB_WORKERS", "4")),
+    max_queue=int(os.environ.get("RESUME_JOB_MAX_QUEUE", "100")),
+    lease=float(os.environ.get("RESUME_JOB_LEASE", "60")),
+    # The worker deletes the upload when it finishes a job; a job given up on is never run again
+    on_abandon=lambda job: remove_job_file(job["file_path"]),
+)
+
+
+# Load the skill taxonomy once; it is rebuilt automatically when the JSON file changes
+skill_registry = TaxonomyRegistry("tech-skills-json.json")
+
+
+# In-memory jobs x skills matrix for recommendations, rebuilt when the job count changes
+job_index = IndexRegistry(
+    build=lambda: SkillIndex(jobs_collection.find({}, JOB_INDEX_PROJECTION)),
+    name="job skill index",
+    signature=lambda: jobs_collection.estimated_document_count(),
+)
+
+# Trigram index for /jobs/title substring search, rebuilt when the job count changes
+title_index = IndexRegistry(
+    build=lambda: TitleIndex(jobs_collection.find({}, TITLE_INDEX_PROJECTION)),
+    name="job title index",
+    signature=lambda: jobs_collection.estimated_document_count(),
+)
+
+# In-memory skill co-occurrence model for /get_recommended_skill_to_learn, built from the jobs in scan order.
+# Per-skill bitsets of job positions give each candidate skill's distinct matching job count and its first
+# matching jobs; summed pair counts (as persisted in skill_cooccurrence) would count a job once per shared skill.
+skill_cooccurrence = IndexRegistry(
+    build=lambda: CooccurrenceModel.from_jobs(
+        jobs_collection.find({}, {"_id": 0, "id": 1, "skills": 1, "job_title": 1})
+    ),
+    name="skill co-occurrence model",
+    # ingest.py bumps the persisted model's version on every write; the job count also catches other writers
+    signature=lambda: (model_version(skill_cooccurrence_collection), jobs_collection.estimated_document_count()),
+)
+
+
+# Function to build the university -> school -> degree -> statistic -> year structure
+def build_university_stats(records) -> dict:
+    result = {}
+
+    # Process each record and build the hierarchical structure
+    for record in records:
+        university = record["university"]
+        school = record["school"]
+        degree = record["degree"]
+        year = str(record["year"])
+
+        # Create nested dictionaries if they don't exist
+        if university not in result:
+            result[university] = {}
+
+        if school not in result[university]:
+            result[university][school] = {}
+
+        if degree not in result[university][school]:
+            result[university][school][degree] = {"employment_rate_overall": {}, "gross_monthly_mean": {}}
+
+        # Add the statistics
+        result[university][school][degree]["employment_rate_overall"][year] = record["employment_rate_overall"]
+        result[university][school][degree]["gross_monthly_mean"][year] = record["gross_monthly_mean"]
+
+    return result
+
+
+# Function to keep a pre-serialized snapshot of a read-only dataset, rebuilt when its collection changes.
+# Inserts and deletes are picked up within DATASET_SNAPSHOT_CHECK_INTERVAL seconds, in-place edits within
+# DATASET_SNAPSHOT_MAX_AGE seconds, and POST /reload_datasets rebuilds at once.
+def dataset_snapshot(name: str, collection, build) -> IndexRegistry:
+    return IndexRegistry(
+        build=lambda: DatasetSnapshot(build()),
+        name=f"{name} snapshot",
+        signature=lambda: collection.estimated_document_count(),
+        check_interval=float(os.environ.get("DATASET_SNAPSHOT_CHECK_INTERVAL", "30")),
+        max_age=float(os.environ.get("DATASET_SNAPSHOT_MAX_AGE", "600")),
+    )
+
+
+# Admin endpoints (/reload_datasets, /batch_recommended_jobs) are only enabled when an admin token is configured
+ADMIN_API_TOKEN = os.environ.get("ADMIN_API_TOKEN")
+
+
+# Function to check the X-Admin-Token header of an admin endpoint
+def require_admin_token(token: Optional[str]):
+    if not ADMIN_API_TOKEN or not hmac.compare_digest((token or "").encode(), ADMIN_API_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+# POST /reload_datasets runs at most once per cooldown
+DATASET_RELOAD_COOLDOWN = float(os.environ.get("DATASET_RELOAD_COOLDOWN", "60"))
+dataset_reload_lock = asyncio.Lock()
+last_dataset_reload = 0.0
 
-# Maximum file size allowed (512 MB)
-MAX_FILE_SIZE = 512 * 1024 * 1024  # 512 MB in bytes
+
+dataset_snapshots = {
+    "graduate_starting_pay": dataset_snapshot(
+        "graduate starting pay", graduate_pay_collection, lambda: list(graduate_pay_collection.find({}, {"_id": 0}))
+    ),
+    "industry_growth": dataset_snapshot(
+        "industry growth", industry_growth_collection, lambda: list(industry_growth_collection.find({}, {"_id": 0}))
+    ),
+    "market_trend": dataset_snapshot(
+        "market trend", market_trend_collection, lambda: list(market_trend_collection.find({}, {"_id": 0}))
+    ),
+    "university_stats": dataset_snapshot(
+        "university stats",
+        employment_survey_collection,
+        lambda: build_university_stats(employment_survey_collection.find({}, {"_id": 0})),
+    ),
+}
+
+
+# Function to answer a dataset endpoint from its snapshot (304 when the client's ETag is current)
+async def serve_dataset_snapshot(request: Request, name: str):
+    try:
+        snapshot = await run_in_threadpool(dataset_snapshots[name].get)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
+    return snapshot_response(request, snapshot)
 
 
 # Define Pydantic models for data validation and serialization
@@ -145,6 +425,11 @@ class Job(BaseModel):
         json_encoders = {ObjectId: str}
 
 
+class JobPage(BaseModel):
+    jobs: List[Job]
+    next_cursor: Optional[str] = None
+
+
 class UserLogin(BaseModel):
     username: str
     password: str
@@ -160,14 +445,30 @@ class UserCreate(BaseModel):
     password: str = Field(..., min_length=10)
 
 
+class ResumeTextRequest(BaseModel):
+    username: str
+    resume_text: str = Field(..., min_length=1, max_length=100_000)
+
+
+class CohortFilter(BaseModel):
+    email_domain: Optional[str] = None
+    skills: Optional[List[str]] = None
+
+
+class BatchRecommendationRequest(BaseModel):
+    usernames: Optional[List[str]] = None
+    cohort: Optional[CohortFilter] = None
+    limit: int = Field(default=5, ge=1, le=50)
+
+
 # Password verification function
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password, hashed_password):
+    return await password_pool.verify(plain_password, hashed_password)
 
 
 # Password hashing function
-def get_password_hash(password):
-    return pwd_context.hash(password)
+async def get_password_hash(password):
+    return await password_pool.hash(password)
 
 
 # Function to load skills from a JSON file
@@ -177,108 +478,127 @@ def load_skills(json_file_path):
     return [skill.lower() for skill in data["skills"]]
 
 
-# Function to parse skills from job description
-def parse_skills(description, skills):
-    description = description.lower()
-    return [skill for skill in skills if skill in description]
+# Function to parse skills from job description in a single pass over the text
+def parse_skills(description, matcher: SkillMatcher):
+    return matcher.find(description)
 
 
 # Function to process CSV file and extract job data
+# For large exports use ingest.py, which streams the file through a process pool
 def process_csv(csv_file_path, json_file_path):
-    skills = load_skills(json_file_path)
+    taxonomy = load_taxonomy(json_file_path)
     jobs = []
 
     with open(csv_file_path, "r", newline="", encoding="utf-8") as file:
         csv_reader = csv.DictReader(file)
         for row in csv_reader:
-            if all(row[field].strip() for field in ["Title", "Company", "Date", "Job Link", "Description"]):
-                parsed_skills = parse_skills(row["Description"], skills)
-                if parsed_skills:
-                    job = Job(
-                        id=str(ObjectId()),
-                        job_title=row["Title"],
-                        company=row["Company"],
-                        date=row["Date"],
-                        job_link=row["Job Link"],
-                        skills=parsed_skills,
-                    )
-                    jobs.append(job)
+            job = parse_job_row(row, taxonomy)
+            if job is not None:
+                jobs.append(Job(**job))
     return jobs
 
 
-# Function to insert or update jobs in MongoDB
-def insert_jobs_to_mongodb(jobs, collection):
-    inserted_count = 0
-    for job in jobs:
-        job_dict = job.dict()
-        result = collection.update_one({"id": job_dict["id"]}, {"$set": job_dict}, upsert=True)
-        if result.upserted_id or result.modified_count > 0:
-            inserted_count += 1
-    return inserted_count
+# Function to insert or update jobs in MongoDB in batched bulk upserts keyed by job id
+def insert_jobs_to_mongodb(jobs, collection, batch_size=500):
+    # Job models carry only the API fields, so the derived search fields are added back here
+    job_dicts = (add_search_fields(job.dict() if isinstance(job, BaseModel) else job) for job in jobs)
+    return bulk_upsert_jobs(job_dicts, collection, batch_size=batch_size)
+
+
+def parse_resume_skills(resume_text: str, taxonomy=None) -> List[str]:
+    taxonomy = taxonomy or skill_registry.get()
+    parsed_skills = parse_skills(resume_text, taxonomy.matcher)
+    return parsed_skills
+
+
+async def update_user_skills(user_id: ObjectId, new_skills: List[str]):
+    # Update the user's skills in the database
+    await async_auth_collection.update_one({"_id": user_id}, {"$set": {"skills": new_skills}})
 
 
-def calculate_skill_match(user_skills: List[str], job_skills: List[str]) -> tuple[float, List[str]]:
+# In-process recommendation services shared by the endpoints and the resume upload pipeline
+def recommend_jobs_for_skills(user_skills: List[str], limit: int = 5):
     """
-    Calculate the percentage of matching skills and return matching skills.
+    Recommend jobs for a set of skills.
+
+    Returns:
+        List[Dict] | Dict: The top jobs by match percentage and number of matching skills,
+            or a message dict when there are no skills.
     """
-    matching_skills = []
-    for user_skill in user_skills:
-        for job_skill in job_skills:
-            if user_skill.lower() == job_skill.lower():
-                matching_skills.append(job_skill)
-                break
+    if not user_skills:
+        return {"message": "User has no skills listed. No job recommendations available."}
 
-    match_percentage = (len(matching_skills) / len(job_skills)) * 100 if job_skills else 0
-    return match_percentage, matching_skills
+    # Score all jobs at once and keep the top jobs by match percentage (descending)
+    # and then by number of matching skills (descending)
+    return job_index.get().recommend(user_skills, k=limit)
 
 
-def parse_resume_skills(resume_text: str, json_file_path: str) -> List[str]:
-    skills = load_skills(json_file_path)
-    resume_text = resume_text.lower()
-    parsed_skills = parse_skills(resume_text, skills)
-    return parsed_skills
+def recommend_skills_to_learn(user_skills: List[str], limit: int = 5):
+    """
+    Recommend skills to learn for a set of skills.
+
+    Returns:
+        List[Dict] | Dict: The top co-occurring skills the user lacks with example jobs,
+            or a message dict when there is nothing to recommend.
+    """
+    user_skills = set(user_skills)
+    if not user_skills:
+        return {"message": "User has no skills listed. No skill recommendations available."}
 
+    model = skill_cooccurrence.get()
+    if not any(model.job_bits.get(skill) for skill in user_skills):
+        return {"message": "No matching jobs found for user's skills. No skill recommendations available."}
+
+    # Rank skills by the number of jobs listing them together with at least one of the user's skills
+    return model.recommend(list(user_skills), k=limit, example_count=3)
 
-def update_user_skills(user_id: ObjectId, new_skills: List[str]):
-    # Update the user's skills in the database
-    auth_collection.update_one({"_id": user_id}, {"$set": {"skills": new_skills}})
+
+async def run_timed_stage(timings: Dict[str, float], name: str, func, *args):
+    # Run a stage (blocking ones in the threadpool) and record how long it took in milliseconds
+    start = time.perf_counter()
+    try:
+        if asyncio.iscoroutinefunction(func):
+            return await func(*args)
+        return await run_in_threadpool(func, *args)
+    finally:
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
 
 
-def parse_pdf(contents: bytes) -> str:
+def parse_pdf(stream: BinaryIO) -> PdfExtraction:
     """
     Parse PDF file and extract text.
 
+    Pages are extracted in parallel by the shared pdf_extractor. Very long or slow documents
+    are cut short at its limits and come back with partial text and `truncated` set.
+
     Args:
-        contents (bytes): The binary content of the PDF file.
+        stream (BinaryIO): Seekable file object with the PDF content.
 
     Returns:
-        str: Extracted text from the PDF.
+        PdfExtraction: Extracted text from the PDF, with page counts and the truncation flag.
     """
-    # Create a PdfReader object from the file contents
-    pdf = PdfReader(io.BytesIO(contents))
-
-    # Initialize an empty string to store the extracted text
-    text = ""
-
-    # Iterate through each page of the PDF and extract text
-    for page in pdf.pages:
-        text += page.extract_text()
-
-    return text
+    extraction = pdf_extractor.extract(stream)
+    if extraction.truncated:
+        print(
+            f"INFO: PDF extraction truncated ({extraction.reason}) after "
+            f"{extraction.pages_extracted}/{extraction.page_count} pages"
+        )
+    return extraction
 
 
-def parse_docx(contents: bytes) -> str:
+def parse_docx(stream: BinaryIO) -> str:
     """
     Parse DOCX file and extract text.
 
     Args:
-        contents (bytes): The binary content of the DOCX file.
+        stream (BinaryIO): Seekable file object with the DOCX content.
 
     Returns:
         str: Extracted text from the DOCX file.
     """
-    # Create a Document object from the file contents
-    doc = Document(io.BytesIO(contents))
+    # Create a Document object that reads straight from the file
+    stream.seek(0)
+    doc = Document(stream)
 
     # Extract text from each paragraph and join them with newlines
     text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
@@ -286,8 +606,18 @@ def parse_docx(contents: bytes) -> str:
     return text
 
 
-def get_ai_improvements(resume_text: str) -> str:
-    prompt = r"""
+# Model and prompts used for resume improvement suggestions
+AI_IMPROVEMENTS_MODEL = "gpt-4o"
+
+# /ai_improvements/stream calls allowed per user within the window (each one is a paid model call)
+ai_stream_rate_limiter = SlidingWindowRateLimiter(
+    max_calls=int(os.environ.get("AI_STREAM_MAX_CALLS", "10")),
+    window=float(os.environ.get("AI_STREAM_WINDOW", "3600")),
+)
+
+AI_IMPROVEMENTS_SYSTEM_PROMPT = "You are an expert resume analyst and writer with years of experience in recruitment and career counseling. Your task is to critically analyze resumes and provide specific, actionable improvements to enhance their impact and effectiveness."
+
+AI_IMPROVEMENTS_PROMPT = r"""
     Analyze the provided raw text resume and suggest content improvements in the following areas. Ignore all formatting issues and focus solely on content:
 
 
@@ -351,19 +681,46 @@ def get_ai_improvements(resume_text: str) -> str:
 
     """
 
-    completion = client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {
-                "role": "system",
-                "content": "You are an expert resume analyst and writer with years of experience in recruitment and career counseling. Your task is to critically analyze resumes and provide specific, actionable improvements to enhance their impact and effectiveness.",
-            },
-            {"role": "user", "content": resume_text},
-            {"role": "user", "content": prompt},
-        ],
-    )
+# Resume text sent to the model is normalized and trimmed to this many tokens
+AI_RESUME_MAX_TOKENS = int(os.environ.get("AI_RESUME_MAX_TOKENS", "3000"))
+
+prompt_builder = ResumePromptBuilder(AI_IMPROVEMENTS_MODEL, max_tokens=AI_RESUME_MAX_TOKENS)
 
-    return completion.choices[0].message.content
+# Cached analyses are only reused while the model, prompts, message layout and token budget are unchanged
+AI_PROMPT_VERSION = hashlib.sha256(
+    "\n".join(
+        [
+            AI_IMPROVEMENTS_MODEL,
+            AI_IMPROVEMENTS_SYSTEM_PROMPT,
+            AI_IMPROVEMENTS_PROMPT,
+            "instructions-first",
+            str(AI_RESUME_MAX_TOKENS),
+        ]
+    ).encode("utf-8")
+).hexdigest()[:12]
+
+
+def build_ai_improvements_messages(resume_text: str) -> List[dict]:
+    # The fixed system prompt and instructions come first and the resume last, so every request shares
+    # the same prefix and the provider can serve it from its prompt cache
+    return [
+        {"role": "system", "content": AI_IMPROVEMENTS_SYSTEM_PROMPT},
+        {"role": "user", "content": AI_IMPROVEMENTS_PROMPT},
+        {"role": "user", "content": resume_text},
+    ]
+
+
+async def get_ai_improvements(resume_text: str) -> str:
+    """
+    Get improvement suggestions for a resume.
+
+    Args:
+        resume_text (str): Resume text already prepared with prompt_builder.prepare().
+
+    Returns:
+        str: The model's suggestions (JSON text).
+    """
+    return await llm_client.complete(build_ai_improvements_messages(resume_text), model=AI_IMPROVEMENTS_MODEL)
 
 
 # Signup endpoint
@@ -386,10 +743,11 @@ async def signup(user: UserCreate):
     Possible errors:
     - 400 Bad Request: If the username already exists
     - 500 Internal Server Error: If there's an issue with the database operation
+    - 503 Service Unavailable: If too many requests are waiting for password hashing
     """
     try:
         # Hash the password
-        hashed_password = get_password_hash(user.password)
+        hashed_password = await get_password_hash(user.password)
 
         # Prepare user document with empty skills list
         user_doc = {
@@ -399,7 +757,7 @@ async def signup(user: UserCreate):
         }
 
         # Insert the new user
-        result = auth_collection.insert_one(user_doc)
+        result = await async_auth_collection.insert_one(user_doc)
 
         if result.inserted_id:
             return {"message": "User registered successfully with empty skills list"}
@@ -408,6 +766,8 @@ async def signup(user: UserCreate):
 
     except DuplicateKeyError:
         raise HTTPException(status_code=400, detail="Username already exists")
+    except (PasswordPoolBusyError, QueryTimeoutError):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
@@ -432,13 +792,14 @@ async def login(user: UserLogin):
 
     Possible errors:
     - 401 Unauthorized: If the username doesn't exist or the password is incorrect
+    - 503 Service Unavailable: If too many logins are waiting for password verification
     """
-    db_user = auth_collection.find_one({"username": user.username})
+    db_user = await async_auth_collection.find_one({"username": user.username})
 
     if db_user is None:
         raise HTTPException(status_code=401, detail="Username does not exist")
 
-    if not verify_password(user.password, db_user["hashed_password"]):
+    if not await verify_password(user.password, db_user["hashed_password"]):
         raise HTTPException(status_code=401, detail="Incorrect password")
 
     return UserResponse(username=db_user["username"], skills=db_user["skills"])
@@ -481,142 +842,469 @@ async def read_root():
     return {"message": "Welcome to the Job Processing API"}
 
 
+# Jobs read per MongoDB batch (and per title index lookup) when streaming NDJSON
+JOB_STREAM_BATCH_SIZE = 500
+# Seconds an NDJSON job stream may run, including the time the client takes to read it
+JOB_STREAM_TIMEOUT = float(os.environ.get("JOB_STREAM_TIMEOUT", "300"))
+
+
+# Function to turn up to limit + 1 jobs, in page order, into a page and the cursor of the next one.
+# Jobs are read with JOB_PROJECTION, so they already match the Job model and are returned without a second validation.
+def build_job_page(jobs: List[dict], limit: int, position) -> dict:
+    next_cursor = encode_cursor(position(jobs[limit - 1])) if len(jobs) > limit else None
+    return {"jobs": jobs[:limit], "next_cursor": next_cursor}
+
+
+# Function to narrow a query to the jobs after an id-ordered cursor.
+# Each page starts with an index seek past the previous page's last id, so deep pages cost the same as the first.
+def query_after_cursor(query: dict, cursor: Optional[str]) -> dict:
+    after = decode_cursor(cursor, {"id": str})
+    return {**query, "id": {"$gt": after["id"]}} if after is not None else query
+
+
+# Function to fetch one id-ordered page of the jobs matching a query
+async def find_job_page(query: dict, limit: int, cursor: Optional[str]):
+    jobs = await async_jobs_collection.find(
+        query_after_cursor(query, cursor), JOB_PROJECTION, limit=limit + 1, sort=[("id", 1)]
+    )
+    return json_response(build_job_page(jobs, limit, lambda job: {"id": job["id"]}))
+
+
+# Function to stream the documents returned by open_documents as NDJSON, within JOB_STREAM_TIMEOUT seconds.
+# StreamingResponse iterates the body in the threadpool, and open_documents(max_time_ms) is only called there,
+# so the query never blocks the event loop. It gets the timeout in milliseconds to send to the server as maxTimeMS.
+# A stream still running at the deadline is aborted, so the client sees an incomplete response rather than a short one.
+def stream_ndjson(open_documents: Callable[[int], Iterable[dict]]) -> StreamingResponse:
+    def documents():
+        deadline = time.monotonic() + JOB_STREAM_TIMEOUT
+        for document in open_documents(int(JOB_STREAM_TIMEOUT * 1000)):
+            if time.monotonic() > deadline:
+                print(f"ERROR: Job stream aborted after {JOB_STREAM_TIMEOUT}s")
+                raise QueryTimeoutError(f"Job stream timed out after {JOB_STREAM_TIMEOUT}s")
+            yield document
+
+    return StreamingResponse(ndjson_lines(documents()), media_type=NDJSON_MEDIA_TYPE)
+
+
+# Function to stream every job matching a query (after an optional cursor) in id order, as NDJSON.
+# Jobs are written as each cursor batch arrives, so the response starts at once and memory stays flat.
+def stream_jobs(query: dict, cursor: Optional[str]) -> StreamingResponse:
+    query = query_after_cursor(query, cursor)
+    return stream_ndjson(
+        lambda max_time_ms: jobs_collection.find(
+            query, JOB_PROJECTION, sort=[("id", 1)], batch_size=JOB_STREAM_BATCH_SIZE, max_time_ms=max_time_ms
+        )
+    )
+
+
 # Get all jobs endpoint
-@app.get("/jobs/all", response_model=List[Job])
-async def get_all_jobs(limit: int = Query(default=100, ge=1, le=10000)):
+@app.get("/jobs/all", response_model=JobPage)
+async def get_all_jobs(
+    request: Request,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(default=None),
+):
     """
-    Retrieve all jobs from the database, with an optional limit.
+    Retrieve all jobs from the database, one page at a time.
 
     Query Parameters:
-    - limit (optional): Maximum number of jobs to return. Default is 100, min 1, max 10000.
+    - limit (optional): Maximum number of jobs per page. Default is 50, min 1, max 200.
+    - cursor (optional): The next_cursor of the previous page.
 
     Examples:
     - GET /jobs/all
-    - GET /jobs/all?limit=500
+    - GET /jobs/all?limit=200
+    - GET /jobs/all?limit=200&cursor=eyJpZCI6IjAwMDk4MmY0In0
 
-    Response: A list of Job objects
-    [
-        {
-            "id": "...",
-            "job_title": "Software Engineer",
-            "company": "Tech Corp",
-            "date": "2023-05-01",
-            "job_link": "https://example.com/job1",
-            "skills": ["python", "javascript", "docker"]
-        },
-        ...
-    ]
+    Response: A page of Job objects ordered by id, and the cursor of the next page (null on the last page)
+    {
+        "jobs": [
+            {
+                "id": "...",
+                "job_title": "Software Engineer",
+                "company": "Tech Corp",
+                "date": "2023-05-01",
+                "job_link": "https://example.com/job1",
+                "skills": ["python", "javascript", "docker"]
+            },
+            ...
+        ],
+        "next_cursor": "eyJpZCI6IjAwMDk4MmY0In0"
+    }
+
+    With "Accept: application/x-ndjson", every job (after the cursor, if given) is streamed instead,
+    one Job object per line, and limit does not apply. The same holds for the other /jobs endpoints.
 
     Possible errors:
+    - 400 Bad Request: If the cursor is invalid
     - 500 Internal Server Error: If there's an issue with the database operation
     """
+    if wants_ndjson(request):
+        return stream_jobs({}, cursor)
     try:
-        jobs = list(jobs_collection.find().limit(limit))
-        return [Job(**job) for job in jobs]
+        return await find_job_page({}, limit, cursor)
+    except (HTTPException, QueryTimeoutError):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
 
 # Get jobs by company endpoint
-@app.get("/jobs/company/{company_name}", response_model=List[Job])
-async def get_jobs_by_company(company_name: str):
+@app.get("/jobs/company/{company_name}", response_model=JobPage)
+async def get_jobs_by_company(
+    request: Request,
+    company_name: str,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(default=None),
+):
     """
     Retrieve jobs from a specific company (case-insensitive).
 
     URL Parameters:
     - company_name: The exact name of the company (case-insensitive)
 
+    Query Parameters:
+    - limit (optional): Maximum number of jobs per page. Default is 50, min 1, max 200.
+    - cursor (optional): The next_cursor of the previous page.
+
     Example:
     GET /jobs/company/EPS%20CONSULTANTS%20PTE%20LTD
 
     Note: Spaces in the company name are automatically encoded by the browser.
 
-    Response: A list of Job objects from the specified company
-    [
-        {
-            "id": "...",
-            "job_title": "Data Analyst",
-            "company": "EPS CONSULTANTS PTE LTD",
-            "date": "2023-05-15",
-            "job_link": "https://example.com/job2",
-            "skills": ["sql", "python", "data visualization"]
-        },
-        ...
-    ]
+    Response: A page of Job objects from the specified company, ordered by id
+    {
+        "jobs": [
+            {
+                "id": "...",
+                "job_title": "Data Analyst",
+                "company": "EPS CONSULTANTS PTE LTD",
+                "date": "2023-05-15",
+                "job_link": "https://example.com/job2",
+                "skills": ["sql", "python", "data visualization"]
+            },
+            ...
+        ],
+        "next_cursor": null
+    }
     """
-    jobs = list(jobs_collection.find({"company": {"$regex": f"^{re.escape(company_name)}$", "$options": "i"}}))
-    return [Job(**job) for job in jobs]
+    # company_key holds the casefolded name, so this is an indexed equality match
+    query = {"company_key": normalize_company(company_name)}
+    if wants_ndjson(request):
+        return stream_jobs(query, cursor)
+    return await find_job_page(query, limit, cursor)
 
 
 # Get jobs by title endpoint
-@app.get("/jobs/title/{title_part}", response_model=List[Job])
-async def get_jobs_by_title(title_part: str):
+@app.get("/jobs/title/{title_part}", response_model=JobPage)
+async def get_jobs_by_title(
+    request: Request,
+    title_part: str,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(default=None),
+):
     """
     Retrieve jobs that contain a specific title part (case-insensitive).
 
     URL Parameters:
     - title_part: A part of the job title to search for
 
-    Example:
-    GET /jobs/title/learning
+    Query Parameters:
+    - limit (optional): Maximum number of jobs per page. Default is 50, min 1, max 200.
+    - cursor (optional): The next_cursor of the previous page.
 
-    Response: A list of Job objects with titles containing the specified part
-    [
-        {
-            "id": "...",
-            "job_title": "Machine Learning Engineer",
-            "company": "AI Solutions Inc.",
-            "date": "2023-05-20",
-            "job_link": "https://example.com/job3",
-            "skills": ["python", "machine learning", "tensorflow"]
-        },
-        ...
-    ]
+    Examples:
+    - GET /jobs/title/learning
+    - GET /jobs/title/learning?limit=20&cursor=eyJpZCI6IjAwMDk4MmY0In0
+
+    Response: A page of Job objects with titles containing the specified part, ordered by id
+    {
+        "jobs": [
+            {
+                "id": "...",
+                "job_title": "Machine Learning Engineer",
+                "company": "AI Solutions Inc.",
+                "date": "2023-05-20",
+                "job_link": "https://example.com/job3",
+                "skills": ["python", "machine learning", "tensorflow"]
+            },
+            ...
+        ],
+        "next_cursor": "eyJpZCI6IjAwMDk4MmY0In0"
+    }
     """
-    jobs = list(jobs_collection.find({"job_title": {"$regex": re.escape(title_part), "$options": "i"}}))
-    return [Job(**job) for job in jobs]
+    after = decode_cursor(cursor, {"id": str})
+    after_id = after["id"] if after else None
+    if wants_ndjson(request):
+        return stream_ndjson(lambda max_time_ms: stream_title_matches(title_part, after_id, max_time_ms))
+
+    # The in-memory trigram index finds the matching ids (in id order); the jobs are then fetched by id
+    job_ids = await run_in_threadpool(lambda: title_index.get().search(title_part, limit + 1, after_id))
+    jobs = {}
+    if job_ids:
+        jobs = {job["id"]: job for job in await async_jobs_collection.find({"id": {"$in": job_ids}}, JOB_PROJECTION)}
+    page = build_job_page([jobs[job_id] for job_id in job_ids if job_id in jobs], limit, lambda job: {"id": job["id"]})
+    return json_response(page)
+
+
+# Function to yield every job whose title contains title_part, in id order, a batch of index matches at a time
+def stream_title_matches(title_part: str, after_id: Optional[str], max_time_ms: int):
+    index = title_index.get()
+    while True:
+        job_ids = index.search(title_part, JOB_STREAM_BATCH_SIZE, after_id)
+        if not job_ids:
+            return
+        documents = jobs_collection.find({"id": {"$in": job_ids}}, JOB_PROJECTION, max_time_ms=max_time_ms)
+        jobs = {job["id"]: job for job in documents}
+        yield from (jobs[job_id] for job_id in job_ids if job_id in jobs)
+        after_id = job_ids[-1]
 
 
 # Get jobs by skills endpoint
-@app.get("/jobs/skills/{skills}", response_model=List[Job])
-async def get_jobs_by_skills(skills: str):
+@app.get("/jobs/skills/{skills}", response_model=JobPage)
+async def get_jobs_by_skills(
+    request: Request,
+    skills: str,
+    mode: str = Query("any", pattern="^(any|all)$"),
+    rank: bool = Query(default=False),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(default=None),
+):
     """
     Retrieve jobs that require specific skills (case-insensitive).
 
     URL Parameters:
     - skills: Comma-separated list of skills
 
+    Query Parameters:
+    - mode (optional): "any" (default) for jobs with at least one of the skills, "all" for jobs with every skill.
+    - rank (optional): If true, jobs matching more of the skills come first.
+    - limit (optional): Maximum number of jobs per page. Default is 50, min 1, max 200.
+    - cursor (optional): The next_cursor of the previous page (from a request with the same mode and rank).
+
     Examples:
     - GET /jobs/skills/blockchain,python
     - GET /jobs/skills/sql
     - GET /jobs/skills/big%20data,python
+    - GET /jobs/skills/python,sql,aws?rank=true
+    - GET /jobs/skills/python,sql?mode=all
 
     Note:
     - Multiple skills can be chained using commas.
     - Spaces in skill names are automatically encoded by the browser.
 
-    Response: A list of Job objects requiring the specified skills
-    [
+    Response: A page of Job objects requiring the specified skills, ordered by id (or by matched skills, then id)
+    {
+        "jobs": [
+            {
+                "id": "...",
+                "job_title": "Blockchain Developer",
+                "company": "Crypto Innovations",
+                "date": "2023-05-25",
+                "job_link": "https://example.com/job4",
+                "skills": ["blockchain", "python", "smart contracts"]
+            },
+            ...
+        ],
+        "next_cursor": null
+    }
+    """
+    skill_keys = list(dict.fromkeys(normalize_skill(skill.replace("_", " ")) for skill in skills.split(",")))
+    skill_keys = [skill for skill in skill_keys if skill]
+    if not skill_keys:
+        if wants_ndjson(request):
+            return StreamingResponse(ndjson_lines([]), media_type=NDJSON_MEDIA_TYPE)
+        return json_response({"jobs": [], "next_cursor": None})
+
+    # skill_keys holds each job's canonical skills, so this is one query on the multikey index
+    query = {"skill_keys": {"$all" if mode == "all" else "$in": skill_keys}}
+    if not rank:
+        if wants_ndjson(request):
+            return stream_jobs(query, cursor)
+        return await find_job_page(query, limit, cursor)
+
+    # Only the Job fields and the match count are carried through the sort
+    pipeline = [
+        {"$match": query},
         {
-            "id": "...",
-            "job_title": "Blockchain Developer",
-            "company": "Crypto Innovations",
-            "date": "2023-05-25",
-            "job_link": "https://example.com/job4",
-            "skills": ["blockchain", "python", "smart contracts"]
+            "$project": {
+                **JOB_PROJECTION,
+                "matched_skill_count": {
+                    "$size": {"$filter": {"input": "$skill_keys", "cond": {"$in": ["$$this", skill_keys]}}}
+                },
+            }
         },
-        ...
     ]
+    after = decode_cursor(cursor, {"matched": int, "id": str})
+    if after is not None:
+        pipeline.append(
+            {
+                "$match": {
+                    "$or": [
+                        {"matched_skill_count": {"$lt": after["matched"]}},
+                        {"matched_skill_count": after["matched"], "id": {"$gt": after["id"]}},
+                    ]
+                }
+            }
+        )
+    pipeline.append({"$sort": {"matched_skill_count": -1, "id": 1}})
+
+    if wants_ndjson(request):
+        return stream_ndjson(
+            lambda max_time_ms: jobs_collection.aggregate(
+                pipeline + [{"$project": {"matched_skill_count": 0}}],
+                allowDiskUse=True,
+                batchSize=JOB_STREAM_BATCH_SIZE,
+                maxTimeMS=max_time_ms,
+            )
+        )
+
+    # Ranked pages continue after the last (matched_skill_count, id) pair; $sort + $limit keeps only a page in memory
+    jobs = await async_jobs_collection.aggregate(pipeline + [{"$limit": limit + 1}])
+    page = build_job_page(jobs, limit, lambda job: {"matched": job["matched_skill_count"], "id": job["id"]})
+    for job in page["jobs"]:
+        del job["matched_skill_count"]
+    return json_response(page)
+
+
+# Skill taxonomy info endpoint
+@app.get("/skills_taxonomy")
+async def get_skills_taxonomy():
+    """
+    Report the skill taxonomy currently loaded by the API.
+
+    Example:
+    GET /skills_taxonomy
+
+    Response:
+    {
+        "version": "3f2a9c1d04be",
+        "skill_count": 548,
+        "loaded_at": 1729238400.0,
+        "build_time_ms": 31.5
+    }
+
+    Notes:
+    - The version is a short SHA-256 of the taxonomy JSON file.
+    - Edits to tech-skills-json.json are picked up within a few seconds without a restart.
     """
-    skill_list = [skill.replace("_", " ") for skill in skills.split(",")]
-    query = {"$or": [{"skills": {"$regex": f"^{re.escape(skill)}$", "$options": "i"}} for skill in skill_list]}
-    jobs = list(jobs_collection.find(query))
-    return [Job(**job) for job in jobs]
+    return skill_registry.info()
+
+
+# AI usage metrics endpoint
+@app.get("/ai_usage_stats")
+async def get_ai_usage_stats():
+    """
+    Report AI call and prompt token statistics since the process started.
+
+    Response:
+    {
+        "llm": {"in_flight": 1, "max_concurrency": 8, "calls": 120, "retries": 3, "failures": 0, "timeouts": 0},
+        "prompt": {
+            "requests": 120,
+            "original_tokens": 240500,
+            "sent_tokens": 151200,
+            "tokens_saved": 89300,
+            "truncated": 7,
+            "max_tokens": 3000,
+            "exact_token_counts": true
+        },
+        "resume_cache": {"entries": 40, "max_entries": 256, "hits": 31, "persistent_hits": 4, "misses": 52, "persistent": true},
+        "stream_rate_limit": {"max_calls": 10, "window_seconds": 3600.0, "tracked_keys": 12, "rejected": 2}
+    }
+    """
+    return {
+        "llm": llm_client.metrics(),
+        "prompt": prompt_builder.metrics(),
+        "resume_cache": resume_cache.metrics(),
+        "stream_rate_limit": ai_stream_rate_limiter.metrics(),
+    }
+
+
+# Password hashing pool metrics endpoint
+@app.get("/password_hashing_stats")
+async def get_password_hashing_stats():
+    """
+    Report the state of the password hashing pool used by /signup and /login.
+
+    Response:
+    {
+        "workers": 2,
+        "running": 1,
+        "queue_depth": 0,
+        "max_queue": 32,
+        "completed": 1520,
+        "rejected": 0,
+        "timed_out": 0,
+        "hash_time_ms": {"samples": 500, "avg": 212.4, "p95": 251.0, "max": 310.2}
+    }
+    """
+    return password_pool.metrics()
+
+
+@app.post("/reload_datasets")
+async def reload_datasets(
+    dataset: Optional[str] = Query(default=None), x_admin_token: Optional[str] = Header(default=None)
+):
+    """
+    Rebuild the snapshots served by the static dataset endpoints after their collections were reloaded.
+
+    Headers:
+    - X-Admin-Token: Must match the ADMIN_API_TOKEN environment variable.
+
+    Query Parameters:
+    - dataset (optional): One of graduate_starting_pay, industry_growth, market_trend, university_stats.
+      All snapshots are rebuilt when omitted.
+
+    Example:
+    POST /reload_datasets?dataset=market_trend
+
+    Response:
+    {
+        "market_trend": {
+            "etag": "W/\"5d41402abc4b2a76b9719d911017c592\"",
+            "built_at": 1718000000.0,
+            "bytes": {"identity": 5120, "gzip": 1433, "br": 1210}
+        }
+    }
+
+    Notes:
+        - The ETag only changes when the serialized data changes.
+        - Returns 403 when ADMIN_API_TOKEN is not set or the token does not match, and 429 when
+          called again within DATASET_RELOAD_COOLDOWN seconds or while a reload is running.
+        - Returns 500 if a snapshot fails to rebuild; the previous snapshot keeps being served.
+    """
+    global last_dataset_reload
+
+    require_admin_token(x_admin_token)
+    if dataset is not None and dataset not in dataset_snapshots:
+        raise HTTPException(status_code=404, detail=f"Unknown dataset: {dataset}")
+
+    retry_after = last_dataset_reload + DATASET_RELOAD_COOLDOWN - time.monotonic()
+    if dataset_reload_lock.locked() or retry_after > 0:
+        raise HTTPException(
+            status_code=429,
+            detail="Datasets were reloaded recently, please try again later",
+            headers={"Retry-After": str(max(1, int(retry_after + 1)))},
+        )
+
+    async with dataset_reload_lock:
+        last_dataset_reload = time.monotonic()
+        names = [dataset] if dataset else list(dataset_snapshots)
+        result = {}
+        for name in names:
+            try:
+                snapshot = await run_in_threadpool(dataset_snapshots[name].rebuild)
+            except Exception as e:
+                print(f"ERROR: Failed to rebuild {name} snapshot: {str(e)}")
+                raise HTTPException(status_code=500, detail=f"Failed to rebuild {name}: {str(e)}")
+            result[name] = snapshot.info()
+        return result
 
 
 # Get graduate starting pay data endpoint
 @app.get("/get_graduate_starting_pay_data")
-async def get_graduate_starting_pay_data():
+async def get_graduate_starting_pay_data(request: Request):
     """
         Retrieve all graduate starting pay data from the database. High level overview.
 
@@ -640,17 +1328,13 @@ async def get_graduate_starting_pay_data():
         }
     ]
 
-
+        Served from a pre-serialized snapshot with an ETag; send If-None-Match to get 304 when unchanged.
     """
-    try:
-        data = list(graduate_pay_collection.find({}, {"_id": 0}))  # Exclude the MongoDB _id field
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
+    return await serve_dataset_snapshot(request, "graduate_starting_pay")
 
 
 @app.get("/get_industry_growth")
-async def get_industry_growth():
+async def get_industry_growth(request: Request):
     """
     Retrieve all industry growth data from the database.
 
@@ -697,16 +1381,13 @@ async def get_industry_growth():
         - The 'forecast' field contains the latest growth forecast information.
         - 'quarterlyGrowth' provides quarter-wise growth data.
         - 'annualGrowth' shows yearly growth data, with future years marked with an 'f' suffix.
+        - Served from a pre-serialized snapshot with an ETag; send If-None-Match to get 304 when unchanged.
     """
-    try:
-        data = list(industry_growth_collection.find({}, {"_id": 0}))  # Exclude the MongoDB _id field
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
+    return await serve_dataset_snapshot(request, "industry_growth")
 
 
 @app.get("/get_market_trend")
-async def get_market_trend():
+async def get_market_trend(request: Request):
     """
     Retrieve all market trend data from the database.
 
@@ -745,12 +1426,9 @@ async def get_market_trend():
         - Growth is typically reported year-on-year and given as a percentage.
         - The 'details' field provides additional context about the sector's performance.
         - This endpoint is useful for analyzing current job market trends across various sectors in Singapore.
+        - Served from a pre-serialized snapshot with an ETag; send If-None-Match to get 304 when unchanged.
     """
-    try:
-        data = list(market_trend_collection.find({}, {"_id": 0}))  # Exclude the MongoDB _id field
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
+    return await serve_dataset_snapshot(request, "market_trend")
 
 
 # Get top skills endpoint
@@ -783,13 +1461,14 @@ async def get_top_skills(limit: int = Query(default=10, ge=1, le=100)):
     - 500 Internal Server Error: If there's an issue with the database operation
     """
     try:
-        # Get all jobs from the database
-        jobs = jobs_collection.find({}, {"skills": 1, "_id": 0})
+        # Count skills over all jobs on the database executor
+        def count_skills():
+            skill_counter = Counter()
+            for job in jobs_collection.find({}, {"skills": 1, "_id": 0}):
+                skill_counter.update(job.get("skills", []))
+            return skill_counter
 
-        # Count skills
-        skill_counter = Counter()
-        for job in jobs:
-            skill_counter.update(job.get("skills", []))
+        skill_counter = await async_jobs_collection.run(count_skills)
 
         # Get top N skills
         top_skills = skill_counter.most_common(limit)
@@ -798,6 +1477,8 @@ async def get_top_skills(limit: int = Query(default=10, ge=1, le=100)):
         result = [{"skill": skill, "count": count} for skill, count in top_skills]
 
         return result
+    except QueryTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
@@ -810,7 +1491,7 @@ async def get_recommended_jobs(username: str):
     This function performs the following steps:
     1. Validates the username exists in the database.
     2. Retrieves the user's skills.
-    3. Fetches all jobs from the database.
+    3. Scores every job in the in-memory jobs x skills matrix with one sparse matrix-vector product.
     4. Calculates a match percentage for each job based on the user's skills.
     5. Returns the top 5 jobs with the highest match percentage.
 
@@ -873,36 +1554,123 @@ async def get_recommended_jobs(username: str):
         - The function returns at most 5 job recommendations, even if more jobs have matching skills.
         - Job links are truncated in the example for brevity, but in actual responses, they will be full URLs.
         - Match percentages are rounded to two decimal places in the response.
+        - Jobs are served from an in-memory index that is rebuilt when the number of jobs changes
+          (checked every 30 seconds) and at least every 10 minutes.
     """
-    user = auth_collection.find_one({"username": username})
+    user = await async_auth_collection.find_one({"username": username})
     if not user:
         raise HTTPException(status_code=404, detail="Invalid username")
 
-    user_skills = user.get("skills", [])
-    if not user_skills:
-        return {"message": "User has no skills listed. No job recommendations available."}
+    # Scoring (and an occasional index rebuild) is CPU-bound, so keep it off the event loop
+    return await run_in_threadpool(recommend_jobs_for_skills, user.get("skills", []))
 
-    all_jobs = list(jobs_collection.find())
-    job_matches = []
 
-    for job in all_jobs:
-        match_percentage, matching_skills = calculate_skill_match(user_skills, job.get("skills", []))
-        job_matches.append(
-            {
-                "job_title": job["job_title"],
-                "company": job["company"],
-                "job_link": job["job_link"],
-                "match_percentage": round(match_percentage, 2),
-                "matching_skills": matching_skills,
-            }
+# Users are scored in blocks; each block is one sparse matrix product against all jobs
+BATCH_RECOMMENDATION_BLOCK_SIZE = 64
+
+
+def build_cohort_query(cohort: CohortFilter) -> dict:
+    query = {}
+    if cohort.email_domain:
+        query["username"] = {"$regex": f"@{re.escape(cohort.email_domain)}$", "$options": "i"}
+    if cohort.skills:
+        query["skills"] = {"$in": cohort.skills}
+    return query
+
+
+def stream_batch_recommendations(query: dict, usernames: Optional[List[str]], limit: int):
+    """
+    Yield one NDJSON line of job recommendations per user matching the query.
+
+    Users are read from a single auth_collection cursor and scored in blocks of
+    BATCH_RECOMMENDATION_BLOCK_SIZE. Requested usernames that do not exist are
+    reported at the end.
+    """
+    index = job_index.get()
+    seen = set()
+
+    def score_block(block):
+        with_skills = [user for user in block if user.get("skills")]
+        results = dict(
+            zip(
+                (user["username"] for user in with_skills),
+                index.recommend_many([user["skills"] for user in with_skills], k=limit),
+            )
         )
+        for user in block:
+            if user["username"] in results:
+                line = {"username": user["username"], "recommended_jobs": results[user["username"]]}
+            else:
+                line = {
+                    "username": user["username"],
+                    "message": "User has no skills listed. No job recommendations available.",
+                }
+            yield dumps(line) + b"\n"
+
+    block = []
+    for user in auth_collection.find(query, {"_id": 0, "username": 1, "skills": 1}):
+        seen.add(user["username"])
+        block.append(user)
+        if len(block) >= BATCH_RECOMMENDATION_BLOCK_SIZE:
+            yield from score_block(block)
+            block = []
+    if block:
+        yield from score_block(block)
+
+    for username in dict.fromkeys(usernames or []):
+        if username not in seen:
+            yield dumps({"username": username, "detail": "Invalid username"}) + b"\n"
+
+
+@app.post("/batch_recommended_jobs")
+async def batch_recommended_jobs(
+    request: BatchRecommendationRequest, x_admin_token: Optional[str] = Header(default=None)
+):
+    """
+    Get recommended jobs for many users in one call, streamed back as NDJSON.
+
+    Users are selected either by an explicit list of usernames or by a cohort filter,
+    and loaded with a single query. Each block of users is scored against all jobs in
+    one matrix operation, so this is much cheaper than calling
+    /get_recommended_jobs/{username} once per user.
+
+    Headers:
+    - X-Admin-Token: Must match the ADMIN_API_TOKEN environment variable (the response lists usernames).
+
+    Request body (one of usernames or cohort):
+    {
+        "usernames": ["user1@example.com", "user2@example.com"],
+        "limit": 5
+    }
+    or
+    {
+        "cohort": {"email_domain": "smu.edu.sg", "skills": ["python", "sql"]},
+        "limit": 5
+    }
 
-    # Sort by match percentage (descending) and then by number of matching skills (descending)
-    recommended_jobs = sorted(
-        job_matches, key=lambda x: (x["match_percentage"], len(x["matching_skills"])), reverse=True
-    )[:5]
+    Response (Content-Type: application/x-ndjson), one JSON object per line:
+    {"username": "user1@example.com", "recommended_jobs": [{"job_title": "...", "company": "...", "job_link": "...", "match_percentage": 85.71, "matching_skills": ["python"]}, ...]}
+    {"username": "user2@example.com", "message": "User has no skills listed. No job recommendations available."}
+    {"username": "missing@example.com", "detail": "Invalid username"}
 
-    return recommended_jobs
+    Notes:
+    - Each user's recommendations are identical to /get_recommended_jobs/{username} (with limit=5).
+    - cohort.email_domain matches the end of the username (case-insensitive); cohort.skills
+      selects users with at least one of the listed skills. Both filters can be combined.
+    - Possible errors: 400 Bad Request if neither usernames nor a cohort filter is given, 403 Forbidden
+      if ADMIN_API_TOKEN is not set or the token does not match.
+    """
+    require_admin_token(x_admin_token)
+    if request.usernames:
+        query = {"username": {"$in": request.usernames}}
+    elif request.cohort and (request.cohort.email_domain or request.cohort.skills):
+        query = build_cohort_query(request.cohort)
+    else:
+        raise HTTPException(status_code=400, detail="Provide a list of usernames or a cohort filter")
+
+    return StreamingResponse(
+        stream_batch_recommendations(query, request.usernames, request.limit), media_type=NDJSON_MEDIA_TYPE
+    )
 
 
 @app.get("/get_recommended_skill_to_learn/{username}")
@@ -913,8 +1681,8 @@ async def get_recommended_skill_to_learn(username: str):
     This function performs the following steps:
     1. Validates the username exists in the database.
     2. Retrieves the user's current skills.
-    3. Finds jobs where the user matches at least one skill.
-    4. Identifies new skills from these jobs that the user doesn't have.
+    3. Looks up the precomputed skill co-occurrence counts for each of the user's skills.
+    4. Identifies co-occurring skills that the user doesn't have.
     5. Ranks these new skills by frequency.
     6. Returns the top 5 skills with their frequency and example jobs.
 
@@ -925,8 +1693,9 @@ async def get_recommended_skill_to_learn(username: str):
         List[Dict]: A list of dictionaries containing the top (up to 5) recommended skills.
                     Each dictionary includes:
                     - skill (str): The name of the recommended skill.
-                    - frequency (int): Number of matching jobs that require this skill.
-                    - example_jobs (List[str]): Titles of up to 3 jobs requiring this skill.
+                    - frequency (int): Number of jobs listing this skill together with at least one
+                      of the user's skills.
+                    - example_jobs (List[str]): Titles of up to 3 of those jobs.
 
     Raises:
         HTTPException:
@@ -966,57 +1735,171 @@ async def get_recommended_skill_to_learn(username: str):
 
     Notes:
         - The function recommends skills from jobs where the user matches at least one skill.
-        - Recommended skills are ranked by their frequency in matching jobs.
+        - Recommended skills are ranked by the number of matching jobs listing them, read from an
+          in-memory model that is rebuilt from the jobs when ingest.py changes them.
         - If there are fewer than 5 new skills to recommend, only the available skills are returned.
-        - In case of ties in skill frequency, skills are ranked based on the order they appear in the data.
+        - In case of ties in skill frequency, the skill listed by the earliest matching job comes first,
+          then the alphabetically first one.
         - The function provides up to 3 example job titles for each recommended skill.
     """
     # Validate user and retrieve their skills
-    user = auth_collection.find_one({"username": username})
+    user = await async_auth_collection.find_one({"username": username})
     if not user:
         raise HTTPException(status_code=404, detail="Invalid username")
 
-    user_skills = set(user.get("skills", []))
-    if not user_skills:
-        return {"message": "User has no skills listed. No skill recommendations available."}
+    return await run_in_threadpool(recommend_skills_to_learn, user.get("skills", []))
 
-    # Find jobs where the user matches at least one skill
-    matching_jobs = list(jobs_collection.find({"skills": {"$in": list(user_skills)}}))
 
-    if not matching_jobs:
-        return {"message": "No matching jobs found for user's skills. No skill recommendations available."}
+# Function to run the resume analysis pipeline on an uploaded file, shared by the sync and async upload modes
+async def analyze_resume(user: dict, stream: BinaryIO, started: Optional[float] = None) -> dict:
+    """
+    Extract text and skills from a resume, update the user's skills, and gather suggestions and recommendations.
 
-    # Identify new skills from matching jobs
-    new_skills = set()
-    skill_to_jobs = {}
-    for job in matching_jobs:
-        job_skills = set(job.get("skills", []))
-        new_job_skills = job_skills - user_skills
-        new_skills.update(new_job_skills)
-        for skill in new_job_skills:
-            if skill not in skill_to_jobs:
-                skill_to_jobs[skill] = []
-            skill_to_jobs[skill].append(job["job_title"])
-
-    # Count frequency of new skills
-    skill_frequency = Counter()
-    for job in matching_jobs:
-        job_skills = set(job.get("skills", []))
-        new_job_skills = job_skills - user_skills
-        skill_frequency.update(new_job_skills)
-
-    # Prepare recommendations
-    recommendations = []
-    for skill, freq in skill_frequency.most_common(5):  # Get top 5 skills
-        recommendations.append(
-            {"skill": skill, "frequency": freq, "example_jobs": skill_to_jobs[skill][:3]}  # Limit to 3 example jobs
-        )
+    Args:
+        user (dict): The user document from the auth collection.
+        stream (BinaryIO): Seekable file object with the resume (PDF or DOCX).
+        started (float, optional): perf_counter() value the reported total is measured from.
 
-    return recommendations
+    Returns:
+        dict: The /upload_resume response.
+
+    Raises:
+        HTTPException: 400 status code if the file is not a PDF or DOCX document or has no text.
+    """
+    timings = {}
+    started = started or time.perf_counter()
+
+    # Identical uploads are analysed once: the cache key covers the file bytes and the taxonomy and prompt versions
+    taxonomy = skill_registry.get()
+    file_hash = await run_timed_stage(timings, "hash_file", file_sha256, stream)
+    cache_key = make_cache_key(file_hash, taxonomy.version, AI_PROMPT_VERSION)
+    cached = await run_in_threadpool(resume_cache.get, cache_key)
+
+    if cached is not None:
+        text = cached["text"]
+        extraction_info = cached["extraction"]
+        extracted_skills = cached["extracted_skills"]
+    else:
+        # Check the file type from its content and parse
+        file_type = await run_in_threadpool(detect_resume_type, stream)
+
+        if file_type == "pdf":
+            pdf_extraction = await run_timed_stage(timings, "parse_file", parse_pdf, stream)
+            text = pdf_extraction.text
+            extraction_info = pdf_extraction.info()
+        elif file_type == "docx":
+            text = await run_timed_stage(timings, "parse_file", parse_docx, stream)
+            extraction_info = {"truncated": False}
+        else:
+            raise HTTPException(
+                status_code=400, detail="Unsupported file format. Please upload a PDF or DOCX document."
+            )
+
+        if not text:
+            raise HTTPException(status_code=400, detail=f"Failed to extract text from the {file_type.upper()} file")
+
+        # Parse skills from the extracted text
+        extracted_skills = await run_timed_stage(timings, "extract_skills", parse_resume_skills, text, taxonomy)
+
+    if cached is None:
+        # Only a cleaned, token-budgeted copy of the text is sent to the model
+        prepared = await run_timed_stage(timings, "prepare_prompt", prompt_builder.prepare, text)
+        prompt_info = prepared.info()
+        ai_stage = run_timed_stage(timings, "ai_improvements", get_ai_improvements, prepared.text)
+    else:
+        prompt_info = None
+        # Resolves immediately to the cached suggestions, so both paths share the gather below
+        ai_stage = asyncio.sleep(0, result=cached["ai_improvements"])
+
+    # The remaining stages only depend on the text and the extracted skills, so they run concurrently:
+    # the skills update, the OpenAI call and both recommendations
+    _, ai_improvements, recommended_jobs, recommended_skills = await asyncio.gather(
+        run_timed_stage(timings, "update_user_skills", update_user_skills, user["_id"], extracted_skills),
+        ai_stage,
+        run_timed_stage(timings, "recommended_jobs", recommend_jobs_for_skills, extracted_skills),
+        run_timed_stage(timings, "recommended_skills_to_learn", recommend_skills_to_learn, extracted_skills),
+    )
+
+    # Extractions cut short by load (timeouts, CPU budget) may succeed next time, so only complete
+    # or page-capped analyses are cached
+    if cached is None and extraction_info.get("reason") in (None, "max_pages"):
+        analysis = {
+            "text": text,
+            "extraction": extraction_info,
+            "extracted_skills": extracted_skills,
+            "ai_improvements": ai_improvements,
+        }
+        await run_in_threadpool(resume_cache.put, cache_key, analysis)
+
+    timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+
+    return {
+        "message": text,
+        "extracted_skills": extracted_skills,
+        "ai_improvements": ai_improvements,
+        "recommended_jobs": recommended_jobs,
+        "recommended_skills_to_learn": recommended_skills,
+        "extraction": extraction_info,
+        "cached": cached is not None,
+        "prompt_tokens": prompt_info,
+        "timings_ms": timings,
+    }
+
+
+def remove_job_file(file_path: str):
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+
+
+# Function to queue a background resume analysis; the upload is copied to RESUME_JOB_DIR for the worker
+async def submit_resume_analysis_job(user: dict, stream: BinaryIO, priority: str) -> dict:
+    file_path = os.path.join(RESUME_JOB_DIR, uuid.uuid4().hex)
+
+    def save_upload():
+        stream.seek(0)
+        with open(file_path, "wb") as target:
+            shutil.copyfileobj(stream, target)
+
+    await run_in_threadpool(save_upload)
+    try:
+        return await resume_job_queue.submit({"username": user["username"], "file_path": file_path}, priority)
+    except Exception:
+        remove_job_file(file_path)
+        raise
+
+
+# Function run by the background workers for each queued resume analysis
+async def run_resume_analysis_job(job: dict) -> dict:
+    user = await async_auth_collection.find_one({"username": job["username"]})
+    if not user:
+        remove_job_file(job["file_path"])
+        raise HTTPException(status_code=401, detail="Invalid username")
+
+    try:
+        with open(job["file_path"], "rb") as stream:
+            result = await analyze_resume(user, stream)
+    except FileNotFoundError:
+        raise HTTPException(status_code=410, detail="The uploaded file is no longer available")
+    except asyncio.CancelledError:
+        # Shutting down: keep the file so the job can be resumed after a restart
+        raise
+    except Exception:
+        remove_job_file(job["file_path"])
+        raise
+
+    remove_job_file(job["file_path"])
+    return result
 
 
 @app.post("/upload_resume")
-async def upload_resume(file: UploadFile = File(...), username: str = Form(...)):
+async def upload_resume(
+    file: UploadFile = File(...),
+    username: str = Form(...),
+    mode: str = Query("sync", pattern="^(sync|async)$"),
+    priority: str = Query("normal", pattern="^(high|normal|low)$"),
+):
     """
     Upload and process a resume file (PDF or DOCX), extract skills, and provide recommendations.
 
@@ -1033,21 +1916,32 @@ async def upload_resume(file: UploadFile = File(...), username: str = Form(...))
     Args:
         file (UploadFile): The resume file to be uploaded and processed. Must be in PDF or DOCX format.
         username (str): The username (email) of the user uploading the resume.
+        mode (str): "sync" (default) to process the resume within the request, or "async" to queue it
+            and return a job id immediately.
+        priority (str): Queue priority for async mode: "high", "normal" (default) or "low".
 
     Returns:
-        dict: A dictionary containing the following keys:
+        dict: With mode=async, a 202 response with "job_id", "status", "status_url" and "events_url".
+        Otherwise a dictionary containing the following keys:
             - message (str): The full text extracted from the resume.
             - extracted_skills (List[str]): List of skills extracted from the resume.
             - ai_improvements (str): AI-generated suggestions for improving the resume.
             - recommended_jobs (List[dict]): List of recommended jobs based on the user's skills.
             - recommended_skills_to_learn (List[dict]): List of recommended skills for the user to learn.
+            - extraction (dict): Whether the text was cut short ("truncated"); for PDFs also the page
+              count, pages extracted, the limit that was hit ("reason") and the CPU time used.
+            - cached (bool): Whether the analysis (text, skills, AI suggestions) came from the resume cache.
+            - prompt_tokens (dict): Resume tokens before and after prompt preparation ("original_tokens",
+              "sent_tokens", "tokens_saved", "truncated"); null when the AI suggestions came from the cache.
+            - timings_ms (dict): Time spent in each stage of the pipeline, in milliseconds.
 
     Raises:
         HTTPException:
             - 401 status code if the username is invalid.
             - 413 status code if the file size exceeds the maximum allowed size (512 MB).
-            - 400 status code if the file is empty or in an unsupported format.
+            - 400 status code if the file is empty or its content is not a PDF or DOCX document.
             - 400 status code if text extraction from the file fails.
+            - 503 status code if mode=async and the analysis queue is full.
 
     Example usage:
         POST /upload_resume
@@ -1078,25 +1972,61 @@ async def upload_resume(file: UploadFile = File(...), username: str = Form(...))
                 "example_jobs": ["DevOps Engineer", "Cloud Architect", "Full Stack Developer"]
             },
             ...
-        ]
+        ],
+        "extraction": {
+            "page_count": 2,
+            "pages_extracted": 2,
+            "truncated": false,
+            "reason": null,
+            "cpu_time_ms": 35.2
+        },
+        "cached": false,
+        "prompt_tokens": {
+            "original_tokens": 1840,
+            "sent_tokens": 1210,
+            "tokens_saved": 630,
+            "truncated": false
+        },
+        "timings_ms": {
+            "hash_file": 0.4,
+            "parse_file": 42.1,
+            "extract_skills": 0.8,
+            "update_user_skills": 3.2,
+            "ai_improvements": 8120.5,
+            "recommended_jobs": 2.4,
+            "recommended_skills_to_learn": 0.6,
+            "total": 8170.3
+        }
     }
 
     Notes:
         - The maximum allowed file size is 512 MB.
-        - Only PDF and DOCX file formats are supported.
+        - PDF pages are extracted in parallel, up to 50 pages and 30 seconds; longer documents return the
+          text extracted so far with "truncated" set in "extraction".
+        - Only PDF and DOCX file formats are supported. The format is detected from the file content, not its name.
+        - Uploads larger than the limit are rejected with 413 as soon as the Content-Length header or the
+          number of bytes received exceeds it; the file is spooled to disk beyond 1 MB instead of held in memory.
         - The user's skills in the database are updated based on the extracted skills from the resume.
-        - The AI improvements are generated using the OpenAI GPT model.
-        - Job and skill recommendations are retrieved from separate endpoints within the same API.
+        - The AI improvements are generated using the OpenAI GPT model, bounded by OPENAI_TIMEOUT. Use
+          /ai_improvements/stream to receive them incrementally instead.
+        - Job and skill recommendations are computed in-process from the extracted skills, using the same
+          services as /get_recommended_jobs and /get_recommended_skill_to_learn.
+        - The skills update, the AI call and both recommendations run concurrently after skill extraction.
+        - Analyses are cached by the SHA-256 of the file plus the taxonomy and prompt versions. Re-uploading
+          the same file skips parsing, skill extraction and the AI call; only the user's skills update and
+          the (in-memory) recommendations run again.
         - This endpoint combines multiple operations and may take longer to respond compared to simpler endpoints.
+          With mode=async it returns 202 with a job id immediately instead; see /resume_jobs/{job_id}.
     """
+    started = time.perf_counter()
+
     # Authenticate user
-    user = auth_collection.find_one({"username": username.lower()})
+    user = await async_auth_collection.find_one({"username": username.lower()})
     if not user:
         raise HTTPException(status_code=401, detail="Invalid username")
 
-    # Read the file content
-    contents = await file.read()
-    file_size = len(contents)
+    # The upload is already spooled to a temporary file; it is parsed from there without being read into memory
+    file_size = file.size
 
     if file_size > MAX_FILE_SIZE:
         raise HTTPException(status_code=413, detail="File too large")
@@ -1104,58 +2034,236 @@ async def upload_resume(file: UploadFile = File(...), username: str = Form(...))
     if file_size == 0:
         raise HTTPException(status_code=400, detail="Empty file")
 
-    # Check file type and parse
-    file_extension = file.filename.lower().split(".")[-1]
+    if mode == "async":
+        # Reject unsupported files now rather than in the background job
+        if await run_in_threadpool(detect_resume_type, file.file) is None:
+            raise HTTPException(
+                status_code=400, detail="Unsupported file format. Please upload a PDF or DOCX document."
+            )
+        job = await submit_resume_analysis_job(user, file.file, priority)
+        return JSONResponse(
+            status_code=202,
+            content={
+                "job_id": job["job_id"],
+                "status": job["status"],
+                "status_url": f"/resume_jobs/{job['job_id']}",
+                "events_url": f"/resume_jobs/{job['job_id']}/events",
+            },
+        )
 
-    if file_extension == "pdf":
-        text = parse_pdf(contents)
-    elif file_extension == "docx":
-        text = parse_docx(contents)
-    else:
-        raise HTTPException(status_code=400, detail="Unsupported file format. Please upload a PDF or DOCX document.")
+    return await analyze_resume(user, file.file, started)
 
-    if not text:
-        raise HTTPException(status_code=400, detail=f"Failed to extract text from the {file_extension.upper()} file")
 
-    json_file_path = "tech-skills-json.json"
+def public_job_view(job: dict) -> dict:
+    # Internal fields (the spooled file path and the owning process's lease) are not returned to clients
+    return {key: value for key, value in job.items() if key not in ("file_path", "owner", "lease_expires_at")}
 
-    # Parse skills from the extracted text
-    extracted_skills = parse_resume_skills(text, json_file_path)
 
-    # Update user's skills in the database
-    update_user_skills(user["_id"], extracted_skills)
+@app.get("/resume_jobs/{job_id}")
+async def get_resume_job(job_id: str):
+    """
+    Get the status, and once finished the result, of a resume analysis queued with /upload_resume?mode=async.
 
-    # Get AI-generated content improvements
-    ai_improvements = get_ai_improvements(text)
+    Args:
+        job_id (str): The job id returned by the upload.
 
-    # Get recommended jobs
-    async with httpx.AsyncClient() as client:
-        recommended_jobs_response = await client.get(f"http://localhost:8000/get_recommended_jobs/{username}")
-        recommended_jobs = recommended_jobs_response.json()
+    Returns:
+        dict: The job, with:
+            - status (str): "queued", "running", "done" or "failed".
+            - result (dict): The /upload_resume response, once status is "done".
+            - error (dict): {"status_code", "detail"} of the failure, once status is "failed".
 
-    # Get recommended skills to learn
-    async with httpx.AsyncClient() as client:
-        recommended_skills_response = await client.get(
-            f"http://localhost:8000/get_recommended_skill_to_learn/{username}"
-        )
-        recommended_skills = recommended_skills_response.json()
+    Raises:
+        HTTPException: 404 status code if the job does not exist (or finished more than a day ago).
 
-    return {
-        "message": text,
-        "extracted_skills": extracted_skills,
-        "ai_improvements": ai_improvements,
-        "recommended_jobs": recommended_jobs,
-        "recommended_skills_to_learn": recommended_skills,
+    Response example:
+    {
+        "job_id": "5f0c9a3e1b2d4c6e8f7a9b0c1d2e3f4a",
+        "status": "done",
+        "priority": "normal",
+        "attempts": 1,
+        "username": "user@example.com",
+        "created_at": 1729238400.1,
+        "started_at": 1729238400.2,
+        "finished_at": 1729238408.4,
+        "result": {"message": "...", "extracted_skills": ["python"], ...},
+        "error": null
     }
+    """
+    job = await resume_job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return public_job_view(job)
+
+
+@app.get("/resume_jobs/{job_id}/events")
+async def stream_resume_job_events(job_id: str):
+    """
+    Follow a resume analysis job as Server-Sent Events until it finishes.
+
+    Returns:
+        StreamingResponse: A text/event-stream with an "status" event ({"job_id", "status"}) whenever the
+            status changes, then a final "done" event with the whole job (as from /resume_jobs/{job_id})
+            or a "failed" event with it and its error.
+
+    Raises:
+        HTTPException: 404 status code if the job does not exist.
+
+    Notes:
+        - Updates made by this process are pushed immediately; the job is also re-read every 2 seconds,
+          so jobs running in another API process are followed too.
+    """
+    job = await resume_job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events():
+        current = job
+        last_status = None
+        while True:
+            if current["status"] != last_status:
+                last_status = current["status"]
+                if last_status in FINISHED_STATES:
+                    yield format_sse(public_job_view(current), event=last_status)
+                    return
+                yield format_sse({"job_id": job_id, "status": last_status}, event="status")
+            await resume_job_queue.wait_for_change(job_id, timeout=2.0)
+            current = await resume_job_queue.get(job_id) or current
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def format_sse(data: dict, event: Optional[str] = None) -> str:
+    # One Server-Sent Events message; the JSON payload never contains raw newlines
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+@app.post("/ai_improvements/stream")
+async def stream_ai_improvements(request: ResumeTextRequest):
+    """
+    Stream AI resume improvement suggestions as Server-Sent Events while the model generates them.
+
+    Args:
+        request (ResumeTextRequest): The user's username and the resume text (e.g. the "message" returned
+            by /upload_resume).
+
+    Returns:
+        StreamingResponse: A text/event-stream of messages:
+            - data: {"delta": "..."} for each piece of generated text, in order
+            - event: done, data: {} once the suggestions are complete
+            - event: error, data: {"detail": "..."} if generation fails midway
+
+    Raises:
+        HTTPException:
+            - 401 status code if the username does not exist.
+            - 429 status code if the user made AI_STREAM_MAX_CALLS calls within the last AI_STREAM_WINDOW seconds.
+            - 503 status code if too many AI calls are already running.
+            - 504 status code if the model does not start answering in time.
+            - 502 status code if the AI provider fails.
+
+    Example usage:
+        POST /ai_improvements/stream
+        {"username": "user@example.com", "resume_text": "Full text of the resume..."}
+
+    Response example:
+        data: {"delta": "{\n  \"content_improvements\""}
+
+        data: {"delta": ": {"}
+
+        event: done
+        data: {}
+
+    Notes:
+        - The first piece of text is awaited before the response starts, so failures to start are
+          reported with a normal status code; later failures arrive as an "error" event.
+    """
+    # Authenticate user
+    user = await async_auth_collection.find_one({"username": request.username.lower()}, {"_id": 0, "username": 1})
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid username")
+
+    retry_after = ai_stream_rate_limiter.acquire(user["username"])
+    if retry_after:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many AI suggestion requests, please try again later",
+            headers={"Retry-After": str(int(retry_after) + 1)},
+        )
+
+    prepared = await run_in_threadpool(prompt_builder.prepare, request.resume_text)
+    deltas = llm_client.stream(build_ai_improvements_messages(prepared.text), model=AI_IMPROVEMENTS_MODEL)
+    try:
+        first = await deltas.__anext__()
+    except StopAsyncIteration:
+        first = None
+
+    async def events():
+        try:
+            if first is not None:
+                yield format_sse({"delta": first})
+                async for delta in deltas:
+                    yield format_sse({"delta": delta})
+            yield format_sse({}, event="done")
+        except LLMError as e:
+            print(f"ERROR: AI suggestions stream failed: {str(e)}")
+            yield format_sse({"detail": "AI suggestions were interrupted, please try again"}, event="error")
+        finally:
+            await deltas.aclose()
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# SingStat TableBuilder API endpoint for labor market statistics
+# Filters data for 2024 Q2 using the M184071 dataset; overridable to point at a local stub
+SINGSTAT_LABOR_STATS_URL = os.environ.get(
+    "SINGSTAT_LABOR_STATS_URL", "https://tablebuilder.singstat.gov.sg/api/table/tabledata/M184071?timeFilter=2024%202Q"
+)
+SINGSTAT_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,/;q=0.8",
+}
+
+# One client for all SingStat requests, so connections are reused
+singstat_http_client = httpx.AsyncClient(timeout=float(os.environ.get("SINGSTAT_TIMEOUT", "10")))
+
+
+# Function to fetch and process the labor statistics from the SingStat API
+async def fetch_singapore_labor_stats() -> dict:
+    print("INFO: Retrieving labor statistics from SingStat API")
+    response = await singstat_http_client.get(SINGSTAT_LABOR_STATS_URL, headers=SINGSTAT_HEADERS)
+    response.raise_for_status()
+
+    processed_data = process_labor_stats_3levels(response.text)
+    # Invalid or empty data is treated as a failure, so it is never cached
+    if not processed_data or not processed_data.get("2024 2Q"):
+        raise ValueError("SingStat API returned invalid data")
+    return processed_data
+
+
+# The data changes a few times a year, so it is cached for hours and refreshed in the background
+labor_stats_cache = SingleFlightCache(
+    fetch_singapore_labor_stats,
+    ttl=float(os.environ.get("LABOR_STATS_TTL", str(6 * 3600))),
+    name="Singapore labor stats",
+)
 
 
 @app.get("/processed_singapore_labor_stats")
 async def get_processed_singapore_labor_stats():
     """
     Retrieve and process labor market statistics from Singapore's TableBuilder API.
-    Falls back to MongoDB backup if API request fails.
+    Falls back to MongoDB backup if API request fails and no processed copy is cached.
     Returns only categories with exactly 3 levels in their series number.
 
+    The processed result is kept in memory. After LABOR_STATS_TTL seconds the cached copy is still
+    served while one background request refreshes it, and concurrent requests with nothing cached
+    share a single API request.
+
     Returns:
         dict: Processed labor statistics in the format:
             {
@@ -1169,61 +2277,19 @@ async def get_processed_singapore_labor_stats():
     Raises:
         HTTPException: 500 status code for unexpected errors
     """
-    # SingStat TableBuilder API endpoint for labor market statistics
-    # Filters data for 2024 Q2 using the M184071 dataset
-    url = "https://tablebuilder.singstat.gov.sg/api/table/tabledata/M184071?timeFilter=2024%202Q"
-
-    hdr = {"User-Agent": "Mozilla/5.0", "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,/;q=0.8"}
-
     try:
-        # Try API request first
-        async with httpx.AsyncClient() as client:
-            print("1. Attempting to retrieve from API...")
-            try:
-                response = await client.get(url, headers=hdr)
-                print("2. Got response from API")
-                response.raise_for_status()
-            except Exception as api_error:
-                print(f"3. API request failed: {str(api_error)}")
-                raise  # Re-raise to be caught by outer try-except
-            raw_data = response.text
-
-        # Process the API data
-        processed_data = process_labor_stats_3levels(raw_data)
-
-        # If API returns empty or invalid data, fall back to backup
-        if not processed_data or "2024 2Q" not in processed_data:
-            print("4. API returned invalid data. Retrieving from backup instead")
-            backup_data = singstat_backup.find_one({"2024 2Q": {"$exists": True}})
-            if backup_data:
-                # Remove MongoDB _id field and return backup data
-                backup_data.pop("_id", None)
-                return backup_data
-            else:
-                raise HTTPException(status_code=500, detail="No data available in backup database")
-
-        return processed_data
-
-    except (httpx.HTTPStatusError, httpx.RequestError) as e:
-        # If API request fails, try backup data
-        print(f"5. Caught HTTP error: {str(e)}")
-        try:
-            print("6. Retrieving from backup")
-            backup_data = singstat_backup.find_one({"2024 2Q": {"$exists": True}})
-            if backup_data:
-                # Remove MongoDB _id field and return backup data
-                backup_data.pop("_id", None)
-                return backup_data
-            else:
-                raise HTTPException(status_code=500, detail="No data available in backup database")
-        except Exception as db_error:
-            print(f"7. Database error: {str(db_error)}")
-            raise HTTPException(status_code=500, detail=f"Database error: {str(db_error)}")
-
+        # Served from memory; refreshed in the background once older than LABOR_STATS_TTL
+        return await labor_stats_cache.get()
     except Exception as e:
-        # Handle any other unexpected errors
-        print(f"8. Unexpected error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
+        # Only reached when there is no cached copy and the API request failed
+        print(f"INFO: SingStat API unavailable ({str(e)}). Retrieving from backup instead")
+
+    backup_data = await async_singstat_backup.find_one({"2024 2Q": {"$exists": True}})
+    if backup_data:
+        # Remove MongoDB _id field and return backup data
+        backup_data.pop("_id", None)
+        return backup_data
+    raise HTTPException(status_code=500, detail="No data available in backup database")
 
 
 def process_labor_stats_3levels(raw_data):
@@ -1291,10 +2357,9 @@ async def get_employment_stats(university: str, school: str, degree: str):
         }
     """
     # Query the database for exact matches
-    results = employment_survey_collection.find({"university": university, "school": school, "degree": degree})
-
-    # Convert cursor to list
-    data = list(results)
+    data = await async_employment_survey_collection.find(
+        {"university": university, "school": school, "degree": degree}
+    )
 
     # If no data found, return appropriate message
     if not data:
@@ -1314,7 +2379,7 @@ async def get_employment_stats(university: str, school: str, degree: str):
 
 
 @app.get("/university_stats")
-async def get_university_stats():
+async def get_university_stats(request: Request):
     """
     Retrieve hierarchical employment statistics for all universities.
     Returns a nested structure organized by university, school, degree, and yearly statistics.
@@ -1343,36 +2408,10 @@ async def get_university_stats():
             }
         }
     }
-    """
-    # Get all records from the collection
-    records = list(employment_survey_collection.find())
-
-    # Initialize the result dictionary
-    result = {}
-
-    # Process each record and build the hierarchical structure
-    for record in records:
-        university = record["university"]
-        school = record["school"]
-        degree = record["degree"]
-        year = str(record["year"])
-
-        # Create nested dictionaries if they don't exist
-        if university not in result:
-            result[university] = {}
-
-        if school not in result[university]:
-            result[university][school] = {}
-
-        if degree not in result[university][school]:
-            result[university][school][degree] = {"employment_rate_overall": {}, "gross_monthly_mean": {}}
 
-        # Add the statistics
-        result[university][school][degree]["employment_rate_overall"][year] = record["employment_rate_overall"]
-        result[university][school][degree]["gross_monthly_mean"][year] = record["gross_monthly_mean"]
-
-    # Return the nested structure
-    return result
+    Served from a pre-serialized snapshot with an ETag; send If-None-Match to get 304 when unchanged.
+    """
+    return await serve_dataset_snapshot(request, "university_stats")
 
 
 # Run the FastAPI application
@@ -0,0 +1,57 @@
+"""
+One-off migration of stored jobs to the fields ingestion now derives from each job.
+
+First, jobs stored with random ids get the deterministic id ingest.make_job_id derives from
+their link, title and company, and duplicate copies of a posting are deleted, so the next
+re-ingest updates them instead of adding copies. The skill co-occurrence model is then rebuilt
+if any duplicates were removed. Second, the search fields (see ingest.add_search_fields) are
+backfilled, so jobs ingested earlier can be found through their indexes.
+Run it once before re-ingesting into an existing database. Safe to re-run: only jobs whose
+id or fields are missing or stale are written.
+
+Usage (from the backend directory):
+    python migrate_jobs.py
+    python migrate_jobs.py --dry-run
+    python migrate_jobs.py --batch-size 1000
+"""
+
+import argparse
+import time
+
+from cooccurrence import rebuild_collection
+from ingest import backfill_search_fields, migrate_job_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=500, help="Updates per MongoDB bulk_write")
+    parser.add_argument("--dry-run", action="store_true", help="Count the jobs that need updating without writing")
+    args = parser.parse_args()
+
+    # Importing main sets up the MongoDB connection (and the search indexes) the same way the API does
+    from main import jobs_collection, skill_cooccurrence_collection
+
+    start = time.perf_counter()
+    ids = migrate_job_ids(jobs_collection, batch_size=args.batch_size, dry_run=args.dry_run)
+    action = "would be" if args.dry_run else "were"
+    print(
+        f"SUCCESS: {ids['renamed']} of {ids['scanned']} job ids {action} rewritten and "
+        f"{ids['deleted']} duplicate jobs {action} deleted in {time.perf_counter() - start:.2f}s"
+    )
+    if ids["deleted"] and not args.dry_run:
+        skill_count = rebuild_collection(
+            skill_cooccurrence_collection, jobs_collection.find({}, {"_id": 0, "id": 1, "skills": 1, "job_title": 1})
+        )
+        print(f"SUCCESS: Rebuilt skill co-occurrence model ({skill_count} skills)")
+
+    start = time.perf_counter()
+    result = backfill_search_fields(jobs_collection, batch_size=args.batch_size, dry_run=args.dry_run)
+    action = "would be updated" if args.dry_run else "updated"
+    print(
+        f"SUCCESS: {result['updated']} of {result['scanned']} jobs {action} "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
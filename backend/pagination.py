@@ -0,0 +1,50 @@
+import base64
+import binascii
+import json
+from typing import Dict, Optional
+
+from fastapi import HTTPException
+
+
+# Page sizes shared by the job listing endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(position: dict) -> str:
+    """
+    Encode the sort key of the last item on a page as an opaque, URL-safe cursor.
+    """
+    raw = json.dumps(position, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], fields: Dict[str, type]) -> Optional[dict]:
+    """
+    Decode a cursor produced by encode_cursor for the same sort key fields.
+
+    Args:
+        cursor (str, optional): The cursor from the client.
+        fields (Dict[str, type]): The sort key fields and the type each value must have.
+
+    Returns:
+        Optional[dict]: The sort key to continue after, or None for the first page.
+
+    Raises:
+        HTTPException: 400 status code if the cursor is malformed, has values of the wrong type,
+            or is from a different listing.
+    """
+    if not cursor:
+        return None
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(position, dict) or set(position) != set(fields):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    # Values are compared with stored sort keys, so a crafted cursor must not carry another type (bool is an int)
+    for field, expected in fields.items():
+        value = position[field]
+        if not isinstance(value, expected) or isinstance(value, bool):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    return position
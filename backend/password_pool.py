@@ -0,0 +1,91 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PasswordPoolBusyError(Exception):
+    """Raised when the password hashing pool cannot take another request in time."""
+
+
+class PasswordHasherPool:
+    """
+    Runs bcrypt hashing and verification on a small dedicated thread pool.
+
+    bcrypt is deliberately slow (tens to hundreds of milliseconds of CPU per call), so
+    running it inside an async handler freezes the event loop. Here at most `max_workers`
+    hashes run at once; up to `max_queue` more requests may wait, each for at most
+    `queue_timeout` seconds. Anything beyond that is rejected with PasswordPoolBusyError,
+    which the API turns into a 503, instead of piling up.
+    """
+
+    def __init__(self, context, max_workers: int = 2, max_queue: int = 32, queue_timeout: float = 5.0):
+        self.context = context
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._slots = None
+        self._waiting = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        # Durations of the most recent hashes, in seconds
+        self._durations = deque(maxlen=500)
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(self.context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(self.context.verify, plain_password, hashed_password)
+
+    async def _submit(self, func, *args):
+        # Created lazily so the semaphore binds to the running event loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+
+        if not self._slots.locked():
+            # A free worker: acquiring an unlocked semaphore does not suspend
+            await self._slots.acquire()
+        elif self._waiting >= self.max_queue:
+            self._rejected += 1
+            raise PasswordPoolBusyError("Password hashing queue is full")
+        else:
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._timed_out += 1
+                raise PasswordPoolBusyError("Timed out waiting for a password hashing worker")
+            finally:
+                self._waiting -= 1
+
+        self._running += 1
+        start = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            self._durations.append(time.perf_counter() - start)
+            self._running -= 1
+            self._completed += 1
+            self._slots.release()
+
+    def metrics(self) -> dict:
+        durations = sorted(self._durations)
+        count = len(durations)
+        return {
+            "workers": self.max_workers,
+            "running": self._running,
+            "queue_depth": self._waiting,
+            "max_queue": self.max_queue,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "timed_out": self._timed_out,
+            "hash_time_ms": {
+                "samples": count,
+                "avg": round(sum(durations) / count * 1000, 1) if count else 0.0,
+                "p95": round(durations[min(count - 1, int(count * 0.95))] * 1000, 1) if count else 0.0,
+                "max": round(durations[-1] * 1000, 1) if count else 0.0,
+            },
+        }
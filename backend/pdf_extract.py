@@ -0,0 +1,260 @@
+"""
+Page-parallel PDF text extraction with page, time and CPU limits.
+
+The parent process counts the pages and copies the upload to a temporary file once.
+Pages are then extracted in small batches on a process pool, and each worker opens the
+file itself. Page texts are joined once at the end. Extraction stops early, returning
+the text gathered so far with `truncated` set, when:
+
+- the document has more than `max_pages` pages,
+- a single page takes longer than `page_timeout` seconds (the page is skipped),
+- the CPU time spent by all workers exceeds `cpu_budget` seconds, or
+- the whole extraction exceeds `total_timeout` seconds of wall-clock time.
+"""
+
+import os
+import shutil
+import signal
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from PyPDF2 import PdfReader
+
+
+# Pages handed to a worker per task; small enough to spread short resumes across workers
+PAGES_PER_TASK = 2
+
+# Reader cached per worker process, so consecutive batches of one document do not reparse it
+_worker_reader: Dict[str, PdfReader] = {}
+
+
+class PageTimeoutError(BaseException):
+    """
+    Raised inside a worker when a single page takes too long to extract.
+
+    Derived from BaseException so the PDF library's broad `except Exception` fallbacks do not swallow it.
+    """
+
+
+class PdfExtraction:
+    """
+    Result of a PDF extraction.
+
+    Attributes:
+        text (str): Text of the extracted pages, in page order.
+        page_count (int): Number of pages in the document.
+        pages_extracted (int): Number of pages whose text was extracted.
+        truncated (bool): Whether extraction stopped before covering every page.
+        reason (Optional[str]): Why extraction was truncated ("max_pages", "page_timeout",
+            "cpu_budget" or "total_timeout"); the first limit hit wins.
+        cpu_time (float): CPU seconds spent extracting, summed over the workers.
+    """
+
+    def __init__(self, text: str, page_count: int, pages_extracted: int, reason: Optional[str], cpu_time: float):
+        self.text = text
+        self.page_count = page_count
+        self.pages_extracted = pages_extracted
+        self.truncated = reason is not None
+        self.reason = reason
+        self.cpu_time = cpu_time
+
+    def info(self) -> dict:
+        return {
+            "page_count": self.page_count,
+            "pages_extracted": self.pages_extracted,
+            "truncated": self.truncated,
+            "reason": self.reason,
+            "cpu_time_ms": round(self.cpu_time * 1000, 1),
+        }
+
+
+def _on_page_timeout(signum, frame):
+    raise PageTimeoutError()
+
+
+def _open_reader(path: str) -> PdfReader:
+    reader = _worker_reader.get(path)
+    if reader is None:
+        _worker_reader.clear()
+        reader = PdfReader(path)
+        # Build the page list now, outside any page timeout
+        len(reader.pages)
+        _worker_reader[path] = reader
+    return reader
+
+
+# Function run in a worker process to extract a batch of pages
+def _extract_pages(
+    path: str, pages: List[int], page_timeout: float, deadline: float
+) -> Tuple[Dict[int, str], bool, bool, float]:
+    """
+    Extract the text of some pages of a PDF file.
+
+    The per-page timeout uses SIGALRM, which only works on the main thread of a process;
+    pool workers run tasks there. Elsewhere (inline extraction) only the deadline applies.
+
+    Returns:
+        Tuple: Page texts by page number, whether a page timed out, whether the deadline
+            passed, and the CPU seconds used.
+    """
+    cpu_start = time.process_time()
+    reader = _open_reader(path)
+    use_alarm = (
+        page_timeout > 0 and threading.current_thread() is threading.main_thread() and hasattr(signal, "setitimer")
+    )
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _on_page_timeout)
+
+    texts = {}
+    page_timed_out = False
+    deadline_passed = False
+    try:
+        for page_number in pages:
+            if time.time() > deadline:
+                deadline_passed = True
+                break
+            page = reader.pages[page_number]
+            try:
+                if use_alarm:
+                    signal.setitimer(signal.ITIMER_REAL, page_timeout)
+                try:
+                    texts[page_number] = page.extract_text() or ""
+                finally:
+                    if use_alarm:
+                        signal.setitimer(signal.ITIMER_REAL, 0)
+            except PageTimeoutError:
+                page_timed_out = True
+                # The interrupted page may have left cached objects half-built; reopen for later batches
+                _worker_reader.clear()
+                reader = _open_reader(path)
+    finally:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, previous_handler)
+
+    return texts, page_timed_out, deadline_passed, time.process_time() - cpu_start
+
+
+class PdfExtractor:
+    """
+    Extracts PDF text on a shared process pool, within page, time and CPU limits.
+
+    With `max_workers=0` pages are extracted inline in the calling thread (useful for
+    debugging); the per-page timeout is then not enforced.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pages: int = 50,
+        page_timeout: float = 5.0,
+        cpu_budget: float = 20.0,
+        total_timeout: float = 30.0,
+    ):
+        self.max_workers = os.cpu_count() if max_workers is None else max_workers
+        self.max_pages = max_pages
+        self.page_timeout = page_timeout
+        self.cpu_budget = cpu_budget
+        self.total_timeout = total_timeout
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # Created lazily so importing the API does not start worker processes
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    def shutdown(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def extract(self, stream: BinaryIO) -> PdfExtraction:
+        """
+        Extract the text of a PDF file.
+
+        Args:
+            stream (BinaryIO): Seekable file object with the PDF content.
+
+        Returns:
+            PdfExtraction: The text and how much of the document it covers.
+        """
+        started = time.time()
+        deadline = started + self.total_timeout
+
+        stream.seek(0)
+        page_count = len(PdfReader(stream).pages)
+        pages = list(range(min(page_count, self.max_pages)))
+        reason = "max_pages" if page_count > self.max_pages else None
+
+        # Workers read the document from a temporary file instead of receiving a copy per task
+        stream.seek(0)
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            shutil.copyfileobj(stream, temp_file)
+            path = temp_file.name
+
+        try:
+            if self.max_workers == 0:
+                texts, batch_reason, cpu_time = self._extract_inline(path, pages, deadline)
+            else:
+                texts, batch_reason, cpu_time = self._extract_parallel(path, pages, deadline)
+        finally:
+            os.remove(path)
+
+        reason = reason or batch_reason
+        # Join once, in page order, skipping pages that were not extracted
+        text = "".join(texts[page_number] for page_number in pages if page_number in texts)
+        return PdfExtraction(text, page_count, len(texts), reason, cpu_time)
+
+    def _extract_inline(self, path: str, pages: List[int], deadline: float):
+        texts, page_timed_out, deadline_passed, cpu_time = _extract_pages(path, pages, 0, deadline)
+        _worker_reader.clear()
+        return texts, "total_timeout" if deadline_passed else None, cpu_time
+
+    def _extract_parallel(self, path: str, pages: List[int], deadline: float):
+        pool = self._get_pool()
+        batches = [pages[i : i + PAGES_PER_TASK] for i in range(0, len(pages), PAGES_PER_TASK)]
+        texts = {}
+        reason = None
+        stopped = False
+        cpu_time = 0.0
+
+        # Keep at most one batch per worker in flight, so a CPU budget overrun stops new work quickly
+        pending = set()
+        next_batch = 0
+        while next_batch < len(batches) or pending:
+            while next_batch < len(batches) and len(pending) < self.max_workers and not stopped:
+                pending.add(pool.submit(_extract_pages, path, batches[next_batch], self.page_timeout, deadline))
+                next_batch += 1
+            if not pending:
+                break
+
+            done, pending = wait(pending, timeout=max(deadline - time.time(), 0), return_when=FIRST_COMPLETED)
+            if not done:
+                # Batches still running finish on their own (each page is bounded by the page timeout)
+                reason = reason or "total_timeout"
+                for future in pending:
+                    future.cancel()
+                break
+
+            for future in done:
+                batch_texts, page_timed_out, deadline_passed, batch_cpu_time = future.result()
+                texts.update(batch_texts)
+                cpu_time += batch_cpu_time
+                # A slow page is skipped; the other pages are still extracted
+                if page_timed_out:
+                    reason = reason or "page_timeout"
+                if deadline_passed:
+                    reason = reason or "total_timeout"
+                    stopped = True
+                if cpu_time > self.cpu_budget:
+                    reason = reason or "cpu_budget"
+                    stopped = True
+            # Once stopped, batches already running finish and their text is kept
+
+        return texts, reason, cpu_time
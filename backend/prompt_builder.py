@@ -0,0 +1,251 @@
+"""
+Prompt preparation for the resume improvement call.
+
+Extracted resume text is normalized (whitespace runs, repeated page headers/footers and
+duplicate lines removed), counted in tokens locally, and trimmed section by section to
+a token budget before it is sent. Messages put the fixed system prompt and instructions
+first and the resume last, so providers that cache prompt prefixes can reuse them.
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import List, Optional
+
+try:
+    import tiktoken
+except ImportError:  # Token counts fall back to an estimate
+    tiktoken = None
+
+
+# Lines that only carry a page number, e.g. "Page 2 of 3", "- 2 -", "2/3"
+_PAGE_NUMBER = re.compile(r"^(?:page\s*)?[-–—(]?\s*\d+\s*(?:(?:of|/)\s*\d+)?\s*[-–—)]?$", re.IGNORECASE)
+_SPACES = re.compile(r"[ \t\u00a0\u2000-\u200b\u3000]+")
+_TOKEN_PIECES = re.compile(r"\w+|[^\w\s]")
+
+# Resume section headings, by how much the suggestions depend on them (lower is kept longer)
+SECTION_PRIORITIES = {
+    "summary": 0,
+    "profile": 0,
+    "objective": 0,
+    "experience": 0,
+    "work experience": 0,
+    "professional experience": 0,
+    "employment": 0,
+    "projects": 1,
+    "skills": 1,
+    "technical skills": 1,
+    "achievements": 1,
+    "education": 2,
+    "certifications": 2,
+    "awards": 2,
+    "leadership": 2,
+    "activities": 3,
+    "volunteering": 3,
+    "interests": 3,
+    "hobbies": 3,
+    "references": 4,
+}
+# Text before the first heading (usually the name and contact details)
+HEADER_PRIORITY = 0
+
+# Lines kept at the start of every section however tight the budget
+SECTION_HEAD_LINES = 2
+
+# Lines repeated at least this often (page headers/footers), or repeated lines at least this long
+# (text extracted twice), are kept only once
+REPEATED_LINE_MIN_COUNT = 3
+DUPLICATE_LINE_MIN_LENGTH = 40
+
+
+class TokenCounter:
+    """
+    Counts tokens with the model's tiktoken encoding when it is available locally.
+
+    tiktoken downloads encodings on first use; when it is not installed or the download
+    fails, tokens are estimated from word and punctuation pieces (about 4 characters per
+    token for long words), which is within a few percent for English resume text.
+    """
+
+    def __init__(self, model: str):
+        self.model = model
+        self._encoding = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def exact(self) -> bool:
+        return self._get_encoding() is not None
+
+    def _get_encoding(self):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    if tiktoken is not None:
+                        try:
+                            self._encoding = tiktoken.encoding_for_model(self.model)
+                        except Exception as e:
+                            print(f"INFO: tiktoken encoding unavailable, estimating tokens: {type(e).__name__}")
+                    self._loaded = True
+        return self._encoding
+
+    def count(self, text: str) -> int:
+        encoding = self._get_encoding()
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+        return sum(max(1, math.ceil(len(piece) / 4)) for piece in _TOKEN_PIECES.findall(text))
+
+
+class PreparedResume:
+    """
+    Resume text ready to send, with token counts before and after preparation.
+    """
+
+    def __init__(self, text: str, original_tokens: int, tokens: int, truncated: bool):
+        self.text = text
+        self.original_tokens = original_tokens
+        self.tokens = tokens
+        self.truncated = truncated
+
+    def info(self) -> dict:
+        return {
+            "original_tokens": self.original_tokens,
+            "sent_tokens": self.tokens,
+            "tokens_saved": self.original_tokens - self.tokens,
+            "truncated": self.truncated,
+        }
+
+
+def normalize_resume_text(text: str) -> str:
+    """
+    Clean extracted resume text without changing its content.
+
+    Collapses runs of spaces and blank lines, drops page-number lines, and keeps only the
+    first copy of lines repeated on many pages (headers and footers) or long lines that
+    were extracted twice. Short lines repeated once or twice (e.g. a job title held at
+    two companies) are kept.
+    """
+    lines = [_SPACES.sub(" ", line).strip() for line in text.splitlines()]
+    counts = Counter(line.lower() for line in lines if line)
+
+    seen = set()
+    cleaned = []
+    for line in lines:
+        key = line.lower()
+        if not line:
+            # Keep a single blank line between blocks
+            if cleaned and cleaned[-1]:
+                cleaned.append("")
+            continue
+        if _PAGE_NUMBER.match(line):
+            continue
+        if key in seen and (counts[key] >= REPEATED_LINE_MIN_COUNT or len(line) >= DUPLICATE_LINE_MIN_LENGTH):
+            continue
+        seen.add(key)
+        cleaned.append(line)
+
+    return "\n".join(cleaned).strip()
+
+
+def _section_priority(line: str) -> Optional[int]:
+    # A heading is a short line matching a known section name, ignoring case and trailing colons
+    key = line.strip().rstrip(":").strip().lower()
+    if len(key) > 40:
+        return None
+    return SECTION_PRIORITIES.get(key)
+
+
+def split_sections(text: str) -> List[dict]:
+    """
+    Split resume text into sections at known headings.
+
+    Returns:
+        List[dict]: Sections in order, each {"priority": int, "lines": List[str]} with the
+            heading as the first line (none for the leading header block).
+    """
+    sections = [{"priority": HEADER_PRIORITY, "lines": []}]
+    for line in text.split("\n"):
+        priority = _section_priority(line) if line else None
+        if priority is not None:
+            sections.append({"priority": priority, "lines": [line]})
+        else:
+            sections[-1]["lines"].append(line)
+    return [section for section in sections if section["lines"]]
+
+
+class ResumePromptBuilder:
+    """
+    Prepares resume text for the improvement prompt within a token budget.
+
+    When the normalized text is over `max_tokens`, lines are removed from the end of the
+    lowest-priority sections first (references and hobbies before education before
+    experience), always keeping each section's heading and first lines, so the model still
+    sees every section. Totals of tokens saved are kept for the stats endpoint.
+    """
+
+    def __init__(self, model: str, max_tokens: int = 3000):
+        self.max_tokens = max_tokens
+        self.counter = TokenCounter(model)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._original_tokens = 0
+        self._sent_tokens = 0
+        self._truncated = 0
+
+    def prepare(self, text: str) -> PreparedResume:
+        original_tokens = self.counter.count(text)
+        normalized = normalize_resume_text(text)
+        tokens = self.counter.count(normalized)
+
+        truncated = tokens > self.max_tokens
+        if truncated:
+            normalized = self._truncate(normalized)
+            tokens = self.counter.count(normalized)
+
+        with self._lock:
+            self._requests += 1
+            self._original_tokens += original_tokens
+            self._sent_tokens += tokens
+            self._truncated += truncated
+        return PreparedResume(normalized, original_tokens, tokens, truncated)
+
+    def _truncate(self, text: str) -> str:
+        sections = split_sections(text)
+        line_tokens = [[self.counter.count(line) + 1 for line in section["lines"]] for section in sections]
+        total = sum(sum(tokens) for tokens in line_tokens)
+
+        # Remove from the least important sections first; among equals, from the longest
+        order = sorted(
+            range(len(sections)), key=lambda index: (-sections[index]["priority"], -sum(line_tokens[index]))
+        )
+        for index in order:
+            lines, tokens = sections[index]["lines"], line_tokens[index]
+            while total > self.max_tokens and len(lines) > SECTION_HEAD_LINES:
+                lines.pop()
+                total -= tokens.pop()
+            if total <= self.max_tokens:
+                break
+
+        # Still over (many sections, or huge first lines): cut whole lines from the end of the text
+        kept = [line for section in sections for line in section["lines"]]
+        kept_tokens = [tokens for section_tokens in line_tokens for tokens in section_tokens]
+        while total > self.max_tokens and len(kept) > 1:
+            kept.pop()
+            total -= kept_tokens.pop()
+        if total > self.max_tokens:
+            # A single line over the budget: keep its share of characters
+            kept[0] = kept[0][: int(len(kept[0]) * self.max_tokens / total)]
+        return "\n".join(kept)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "original_tokens": self._original_tokens,
+                "sent_tokens": self._sent_tokens,
+                "tokens_saved": self._original_tokens - self._sent_tokens,
+                "truncated": self._truncated,
+                "max_tokens": self.max_tokens,
+                "exact_token_counts": self.counter.exact,
+            }
@@ -0,0 +1,52 @@
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict
+
+
+class SlidingWindowRateLimiter:
+    """
+    Allows each key (e.g. a username) at most `max_calls` calls in any `window` seconds.
+
+    Call times are kept in memory per process, so with several API processes each one
+    enforces the limit separately.
+    """
+
+    def __init__(self, max_calls: int, window: float):
+        self.max_calls = max_calls
+        self.window = window
+        self._calls: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._rejected = 0
+
+    def acquire(self, key: str) -> float:
+        """
+        Record a call for `key` if it is within the limit.
+
+        Returns:
+            float: 0 if the call is allowed, otherwise the seconds until it would be.
+        """
+        now = time.monotonic()
+        with self._lock:
+            calls = self._calls.setdefault(key, deque())
+            while calls and calls[0] <= now - self.window:
+                calls.popleft()
+            if len(calls) >= self.max_calls:
+                self._rejected += 1
+                return calls[0] + self.window - now
+            calls.append(now)
+
+            # Drop keys whose calls have all expired, so memory follows the active users
+            if len(self._calls) > 1024:
+                for other in [other for other, times in self._calls.items() if times[-1] <= now - self.window]:
+                    del self._calls[other]
+            return 0.0
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "max_calls": self.max_calls,
+                "window_seconds": self.window,
+                "tracked_keys": len(self._calls),
+                "rejected": self._rejected,
+            }
@@ -0,0 +1,134 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import BinaryIO, Optional
+
+from pymongo.errors import PyMongoError
+
+
+# Read size when hashing an upload
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+# Function to hash an uploaded file without reading it into memory at once
+def file_sha256(stream: BinaryIO) -> str:
+    """
+    Compute the SHA-256 of a seekable file object, then rewind it.
+    """
+    digest = hashlib.sha256()
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def make_cache_key(file_hash: str, taxonomy_version: str, prompt_version: str) -> str:
+    # A new taxonomy or prompt changes the analysis, so both are part of the key
+    return f"{file_hash}:{taxonomy_version}:{prompt_version}"
+
+
+class ResumeAnalysisCache:
+    """
+    Content-addressed cache of resume analyses (extracted text, skills, AI suggestions).
+
+    Entries live in memory in a size-bounded LRU with a TTL. When a Mongo `collection` is
+    given, entries are also written there with an `expires_at` date (a TTL index removes
+    them), and memory misses fall back to it, so the cache survives restarts and is shared
+    between API processes. Persistent-tier errors are logged and treated as misses; the
+    cache never fails an upload.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 7 * 24 * 3600, collection=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.collection = collection
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+
+        if collection is not None:
+            try:
+                collection.create_index("expires_at", expireAfterSeconds=0)
+            except PyMongoError as e:
+                print(f"ERROR: Failed to create resume cache TTL index: {str(e)}")
+
+    def get(self, key: str) -> Optional[dict]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+
+        document = self._get_persistent(key, now)
+        with self._lock:
+            if document is None:
+                self._misses += 1
+                return None
+            self._persistent_hits += 1
+        # Keep the stored expiry, so reading an entry back does not extend its lifetime
+        self._remember(key, document["value"], _timestamp(document["expires_at"]))
+        return document["value"]
+
+    def put(self, key: str, value: dict):
+        now = time.time()
+        self._remember(key, value, now + self.ttl)
+        if self.collection is not None:
+            try:
+                self.collection.replace_one(
+                    {"_id": key},
+                    {"_id": key, "value": value, "expires_at": _utc_datetime(now + self.ttl)},
+                    upsert=True,
+                )
+            except PyMongoError as e:
+                print(f"ERROR: Failed to persist resume analysis: {str(e)}")
+
+    def _remember(self, key: str, value: dict, expires_at: float):
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _get_persistent(self, key: str, now: float) -> Optional[dict]:
+        # Returns the stored document ({"value", "expires_at"}) or None
+        if self.collection is None:
+            return None
+        try:
+            # The TTL monitor only runs once a minute, so expiry is checked here too
+            document = self.collection.find_one({"_id": key, "expires_at": {"$gt": _utc_datetime(now)}})
+        except PyMongoError as e:
+            print(f"ERROR: Failed to read resume analysis cache: {str(e)}")
+            return None
+        return document
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "persistent_hits": self._persistent_hits,
+                "misses": self._misses,
+                "persistent": self.collection is not None,
+            }
+
+
+def _utc_datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+def _timestamp(value: datetime) -> float:
+    # PyMongo returns naive UTC datetimes unless the client is tz_aware
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
@@ -0,0 +1,274 @@
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+
+# Only the fields recommendations need are loaded into the index
+JOB_INDEX_PROJECTION = {"_id": 0, "job_title": 1, "company": 1, "job_link": 1, "skills": 1}
+
+
+class SkillIndex:
+    """
+    Immutable jobs x skills incidence matrix used to score every job in one pass.
+
+    Each job is a CSR row with a 1 for every distinct (lowercase) skill it lists, and
+    skills are integer column ids. Scoring a user is a single sparse matrix-vector
+    product divided by each job's precomputed skill count, followed by an
+    argpartition top-k. Jobs keep the position they had in the collection scan, which
+    is the final tie-breaker, so rankings match a stable sort over the full jobs list.
+    """
+
+    def __init__(self, jobs: Iterable[dict]):
+        start = time.perf_counter()
+        self.jobs: List[dict] = []
+        self.skill_ids: Dict[str, int] = {}
+        indptr = [0]
+        indices = []
+        skill_counts = []
+
+        for job in jobs:
+            skills = job.get("skills", []) or []
+            self.jobs.append(
+                {"job_title": job["job_title"], "company": job["company"], "job_link": job["job_link"], "skills": skills}
+            )
+            # The match percentage divides by the raw list length, duplicates included
+            skill_counts.append(len(skills))
+
+            row = {self.skill_ids.setdefault(skill.lower(), len(self.skill_ids)) for skill in skills}
+            indices.extend(sorted(row))
+            indptr.append(len(indices))
+
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+            shape=(len(self.jobs), len(self.skill_ids)),
+        )
+        self.skill_counts = np.array(skill_counts, dtype=np.float64)
+        # Jobs without skills score 0; dividing by 1 instead of 0 avoids NaNs
+        self._divisors = np.maximum(self.skill_counts, 1.0)
+
+        self.built_at = time.time()
+        self.build_time = time.perf_counter() - start
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def user_vector(self, user_skills: List[str]) -> np.ndarray:
+        """
+        Encode the user's skills as a dense vector over the skill ids.
+
+        A skill listed twice counts twice, as it did in the old per-job loop. Skills that no
+        job mentions are dropped.
+        """
+        vector = np.zeros(len(self.skill_ids), dtype=np.float32)
+        for skill in user_skills:
+            skill_id = self.skill_ids.get(skill.lower())
+            if skill_id is not None:
+                vector[skill_id] += 1
+        return vector
+
+    def user_matrix(self, users_skills: List[List[str]]) -> sparse.csc_matrix:
+        """
+        Encode several users' skills as a sparse (skills x users) matrix, one column per user.
+        """
+        rows, cols, values = [], [], []
+        for column, user_skills in enumerate(users_skills):
+            for skill in user_skills:
+                skill_id = self.skill_ids.get(skill.lower())
+                if skill_id is not None:
+                    rows.append(skill_id)
+                    cols.append(column)
+                    values.append(1.0)
+        # Duplicate (row, column) entries are summed, so repeated skills count twice
+        return sparse.csc_matrix(
+            (np.array(values, dtype=np.float32), (np.array(rows, dtype=np.int32), np.array(cols, dtype=np.int32))),
+            shape=(len(self.skill_ids), len(users_skills)),
+        )
+
+    def score(self, user_vectors) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score every job against one user vector, or a (skills x users) block of them.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Match percentages rounded to 2 decimals, and the
+                number of matching skills, shaped like matrix @ user_vectors.
+        """
+        matches = self.matrix @ user_vectors
+        if sparse.issparse(matches):
+            matches = matches.toarray()
+        matches = np.asarray(matches)
+        divisors = self._divisors if matches.ndim == 1 else self._divisors[:, None]
+        percentages = np.round(matches / divisors * 100, 2)
+        return percentages, matches
+
+    def top_k(self, percentages: np.ndarray, matches: np.ndarray, k: int) -> np.ndarray:
+        """
+        Select the positions of the top k jobs by (match_percentage, matching skills).
+
+        argpartition finds the k-th best key; every job strictly above it is kept, and
+        the remaining slots go to the earliest jobs tied with it, like a stable sort.
+
+        Returns:
+            np.ndarray: Job positions in ranked order.
+        """
+        if not len(self.jobs) or k <= 0:
+            return np.empty(0, dtype=np.int64)
+        k = min(k, len(self.jobs))
+
+        # Percentages have 2 decimals and matches are bounded by the job's skill count,
+        # so one int64 key orders by percentage first and matches second
+        keys = np.rint(percentages * 100).astype(np.int64) * (int(self.skill_counts.max()) + 1) + matches.astype(
+            np.int64
+        )
+        threshold = keys[np.argpartition(-keys, k - 1)[k - 1]]
+        above = np.flatnonzero(keys > threshold)
+        tied = np.flatnonzero(keys == threshold)[: k - len(above)]
+        selected = np.concatenate([above, tied])
+        # Sort by key descending, then position ascending
+        return selected[np.lexsort((selected, -keys[selected]))]
+
+    def recommend(self, user_skills: List[str], k: int = 5) -> List[dict]:
+        """
+        Rank jobs by (match_percentage, number of matching skills), keeping the top k.
+
+        If fewer than k jobs match, the rest are filled with 0% jobs in collection order,
+        as the full sort did.
+
+        Args:
+            user_skills (List[str]): The user's skills (any case).
+            k (int): Number of recommendations to return.
+
+        Returns:
+            List[dict]: Recommended jobs in the /get_recommended_jobs response format.
+        """
+        percentages, matches = self.score(self.user_vector(user_skills))
+        positions = self.top_k(percentages, matches, k)
+        return [self.format_match(int(position), user_skills, float(percentages[position])) for position in positions]
+
+    def recommend_many(self, users_skills: List[List[str]], k: int = 5) -> List[List[dict]]:
+        """
+        Recommend jobs for several users with a single sparse matrix-matrix product.
+
+        The dense result is jobs x users, so callers should pass users in blocks
+        (e.g. 64 at a time) to bound memory on large job tables.
+
+        Returns:
+            List[List[dict]]: For each user, the same list recommend() would return.
+        """
+        if not users_skills:
+            return []
+        percentages, matches = self.score(self.user_matrix(users_skills))
+        results = []
+        for column, user_skills in enumerate(users_skills):
+            positions = self.top_k(percentages[:, column], matches[:, column], k)
+            results.append(
+                [
+                    self.format_match(int(position), user_skills, float(percentages[position, column]))
+                    for position in positions
+                ]
+            )
+        return results
+
+    def format_match(self, position: int, user_skills: List[str], match_percentage: float) -> dict:
+        job = self.jobs[position]
+
+        # Only the k returned jobs need their matching skills spelled out
+        job_skills = {}
+        for skill in job["skills"]:
+            job_skills.setdefault(skill.lower(), skill)
+        matching_skills = [job_skills[skill.lower()] for skill in user_skills if skill.lower() in job_skills]
+
+        return {
+            "job_title": job["job_title"],
+            "company": job["company"],
+            "job_link": job["job_link"],
+            "match_percentage": match_percentage if job["skills"] else 0,
+            "matching_skills": matching_skills,
+        }
+
+
+class IndexRegistry:
+    """
+    Process-wide holder for an in-memory index that is rebuilt when the jobs change.
+
+    The index is built on first use by calling `build`. Every `check_interval` seconds the
+    `signature` callable (e.g. the collection's document count) is compared with the value
+    seen at build time, and the index is also rebuilt once it is older than `max_age`. Call
+    `invalidate()` after writing jobs in-process to force a rebuild on the next request.
+    As with the taxonomy registry, the new index is fully built before it is swapped in.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[], object],
+        name: str,
+        signature: Optional[Callable[[], object]] = None,
+        check_interval: float = 30.0,
+        max_age: float = 600.0,
+    ):
+        self.build = build
+        self.name = name
+        self.signature = signature
+        self.check_interval = check_interval
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._index = None
+        self._signature = None
+        self._built_at = 0.0
+        self._last_check = 0.0
+        self._stale = True
+
+    def _rebuild(self):
+        start = time.perf_counter()
+        signature = self.signature() if self.signature else None
+        index = self.build()
+        self._index = index
+        self._signature = signature
+        self._stale = False
+        self._built_at = self._last_check = time.monotonic()
+        print(f"INFO: Built {self.name} in {time.perf_counter() - start:.2f}s")
+        return index
+
+    def _needs_rebuild(self) -> bool:
+        if self._stale or time.monotonic() - self._built_at > self.max_age:
+            return True
+        return self.signature is not None and self.signature() != self._signature
+
+    def get(self):
+        index = self._index
+        if index is None:
+            # First use: everyone waits for the initial build
+            with self._lock:
+                return self._index if self._index is not None else self._rebuild()
+
+        now = time.monotonic()
+        if not self._stale and now - self._last_check < self.check_interval:
+            return index
+
+        # Only one caller checks and rebuilds; the others keep serving the current index
+        if not self._lock.acquire(blocking=False):
+            return index
+        try:
+            self._last_check = now
+            try:
+                if self._needs_rebuild():
+                    return self._rebuild()
+            except Exception as e:
+                print(f"ERROR: Failed to rebuild {self.name}: {str(e)}")
+            return index
+        finally:
+            self._lock.release()
+
+    def rebuild(self):
+        """
+        Rebuild the index now, waiting for a rebuild already in progress.
+
+        Unlike get(), failures are raised to the caller and the current index is kept.
+        """
+        with self._lock:
+            return self._rebuild()
+
+    def invalidate(self):
+        self._stale = True
@@ -0,0 +1,117 @@
+import re
+from typing import Dict, Iterable, List
+
+
+# Characters that count as part of a word when checking skill boundaries.
+# "go" must not match inside "google", but "c++" and "node.js" still match
+# because their trailing characters are not word characters.
+_WORD_CHARS = "a-z0-9"
+
+# Suffixes still accepted after a skill: plurals ("apis") and versions ("html5", "python3.11")
+_SUFFIX = r"(?:s|[0-9]+(?:\.[0-9]+)*)?"
+
+
+def _build_trie(skills: Iterable[str]) -> Dict:
+    # Nested dict keyed by character; the empty-string key marks the end of a skill
+    trie = {}
+    for skill in skills:
+        node = trie
+        for char in skill:
+            node = node.setdefault(char, {})
+        node[""] = True
+    return trie
+
+
+def _trie_to_regex(node: Dict) -> str:
+    """
+    Convert a character trie into a regex that tries the longest alternative first.
+
+    Args:
+        node (Dict): A trie node produced by _build_trie.
+
+    Returns:
+        str: A regex fragment matching every skill stored below the node.
+    """
+    is_terminal = "" in node
+    branches = [re.escape(char) + _trie_to_regex(child) for char, child in sorted(node.items()) if char != ""]
+
+    if not branches:
+        return ""
+
+    if len(branches) == 1:
+        body = branches[0]
+        # A single branch only needs a group if it is optional
+        return f"(?:{body})?" if is_terminal else body
+
+    body = "(?:" + "|".join(branches) + ")"
+    return f"{body}?" if is_terminal else body
+
+
+class SkillMatcher:
+    """
+    Compiled multi-pattern matcher for the skill taxonomy.
+
+    All skills are folded into a single trie-shaped regex, so a description is scanned
+    once instead of once per skill. Matches must sit on word boundaries, which stops
+    false positives such as "go" inside "google" or "java" inside "javascript". A plural
+    "s" or a version number directly after a skill ("apis", "css3") is still accepted.
+
+    The regex finds the longest skill starting at each word start. Shorter skills that
+    are a word-bounded prefix of a longer one (e.g. "machine" in "machine learning") are
+    precomputed so they are still reported, matching the per-skill scan's output.
+    """
+
+    def __init__(self, skills: List[str]):
+        # Keep the taxonomy order (first occurrence wins) so results are stable
+        self.skills = list(dict.fromkeys(skill.lower() for skill in skills if skill))
+        self._order = {skill: index for index, skill in enumerate(self.skills)}
+        self._prefixes = self._build_prefix_map(self.skills)
+
+        if self.skills:
+            alternatives = _trie_to_regex(_build_trie(self.skills))
+            self._pattern = re.compile(
+                rf"(?<![{_WORD_CHARS}])(?=({alternatives}){_SUFFIX}(?![{_WORD_CHARS}]))"
+            )
+        else:
+            self._pattern = None
+
+    @staticmethod
+    def _build_prefix_map(skills: List[str]) -> Dict[str, List[str]]:
+        # For each skill, list the other skills that end on a word boundary inside its prefix
+        skill_set = set(skills)
+        word_char = re.compile(rf"[{_WORD_CHARS}]")
+        prefixes = {}
+        for skill in skills:
+            implied = [
+                skill[:end]
+                for end in range(1, len(skill))
+                if skill[:end] in skill_set and not word_char.match(skill[end])
+            ]
+            if implied:
+                prefixes[skill] = implied
+        return prefixes
+
+    def find(self, text: str) -> List[str]:
+        """
+        Find every taxonomy skill mentioned in the text.
+
+        Args:
+            text (str): The job description or resume text.
+
+        Returns:
+            List[str]: Matched lowercase skills, in taxonomy order and without duplicates.
+        """
+        if self._pattern is None or not text:
+            return []
+
+        found = set()
+        for match in self._pattern.finditer(text.lower()):
+            skill = match.group(1)
+            if skill not in found:
+                found.add(skill)
+                found.update(self._prefixes.get(skill, ()))
+
+        return sorted(found, key=self._order.__getitem__)
+
+    def __len__(self):
+        return len(self.skills)
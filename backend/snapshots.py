@@ -0,0 +1,102 @@
+import gzip
+import hashlib
+import json
+import time
+from typing import Dict, Optional
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+
+try:
+    import brotli
+except ImportError:  # Responses are offered gzip-compressed only
+    brotli = None
+
+
+# Encodings we can store, in order of preference when the client accepts several
+ENCODING_PREFERENCE = ("br", "gzip", "identity")
+
+
+class DatasetSnapshot:
+    """
+    A read-only dataset serialized to JSON once, with compressed copies and an ETag.
+
+    The body is encoded exactly as JSONResponse would encode it. gzip (and brotli, when the
+    package is installed) copies are made at build time with maximum compression, and kept
+    only if they are smaller. The ETag is a hash of the JSON bytes, so rebuilding a snapshot
+    from unchanged data keeps the same ETag and clients keep getting 304s.
+    """
+
+    def __init__(self, data):
+        self.body = json.dumps(
+            jsonable_encoder(data), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+        self.etag = f'W/"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+        self.built_at = time.time()
+
+        self.encodings: Dict[str, bytes] = {"identity": self.body}
+        compressed = {"gzip": gzip.compress(self.body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            compressed["br"] = brotli.compress(self.body, quality=11)
+        for encoding, content in compressed.items():
+            if len(content) < len(self.body):
+                self.encodings[encoding] = content
+
+    def info(self) -> dict:
+        return {
+            "etag": self.etag,
+            "built_at": self.built_at,
+            "bytes": {encoding: len(content) for encoding, content in self.encodings.items()},
+        }
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against an ETag, as used for GET requests.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == bare for candidate in if_none_match.split(","))
+
+
+def choose_encoding(accept_encoding: Optional[str], available) -> str:
+    """
+    Pick the preferred stored encoding the client accepts, falling back to identity.
+    """
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+
+    for encoding in ENCODING_PREFERENCE:
+        if encoding == "identity":
+            return encoding
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if encoding in available and quality > 0:
+            return encoding
+    return "identity"
+
+
+def snapshot_response(request: Request, snapshot: DatasetSnapshot) -> Response:
+    """
+    Answer a GET with the stored bytes of a snapshot, or 304 when the client's copy is current.
+    """
+    headers = {"ETag": snapshot.etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+        return Response(status_code=304, headers=headers)
+
+    encoding = choose_encoding(request.headers.get("accept-encoding"), snapshot.encodings)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=snapshot.encodings[encoding], media_type="application/json", headers=headers)
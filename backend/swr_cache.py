@@ -0,0 +1,102 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+
+class SingleFlightCache:
+    """
+    In-memory cache for one slow upstream value, with single-flight loading and
+    stale-while-revalidate refreshes.
+
+    - Fresh (younger than `ttl`): returned from memory.
+    - Stale: returned from memory at once, and one background refresh is started. If the
+      refresh fails the stale copy keeps being served, so a flaky upstream is invisible to
+      readers once a copy exists; the next refresh is tried after `error_ttl` seconds.
+    - Missing: concurrent callers share a single `loader()` call. If it fails, they all get
+      the error, and further loads are skipped for `error_ttl` seconds so a down upstream
+      is not hammered (callers fall back to their own backup in the meantime).
+    """
+
+    def __init__(self, loader: Callable[[], Awaitable[Any]], ttl: float, name: str, error_ttl: float = 30.0):
+        self.loader = loader
+        self.ttl = ttl
+        self.name = name
+        self.error_ttl = error_ttl
+        self._value = None
+        self._loaded_at: Optional[float] = None
+        self._expired = False
+        self._inflight: Optional[asyncio.Future] = None
+        self._last_error: Optional[Exception] = None
+        self._failed_at: Optional[float] = None
+        self._hits = 0
+        self._stale_hits = 0
+        self._loads = 0
+        self._load_failures = 0
+
+    async def get(self):
+        """
+        Return the cached value, loading or refreshing it as needed.
+
+        Raises:
+            Exception: The loader's error, when there is no cached copy to fall back on.
+        """
+        now = time.monotonic()
+        if self._loaded_at is not None:
+            if not self._expired and now - self._loaded_at < self.ttl:
+                self._hits += 1
+            else:
+                self._stale_hits += 1
+                # After a failed refresh, wait error_ttl before trying the upstream again
+                if self._failed_at is None or now - self._failed_at >= self.error_ttl:
+                    self._start_load()
+            return self._value
+
+        if self._inflight is None and self._failed_at is not None and now - self._failed_at < self.error_ttl:
+            raise self._last_error
+        # shield: a caller that gives up (e.g. client disconnect) does not cancel the shared load
+        return await asyncio.shield(self._start_load())
+
+    def _start_load(self) -> asyncio.Future:
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._load())
+            # A background refresh nobody awaits must not log "exception was never retrieved"
+            self._inflight.add_done_callback(lambda future: future.cancelled() or future.exception())
+        return self._inflight
+
+    async def _load(self):
+        start = time.perf_counter()
+        self._loads += 1
+        try:
+            value = await self.loader()
+        except Exception as e:
+            self._load_failures += 1
+            self._last_error = e
+            self._failed_at = time.monotonic()
+            print(f"ERROR: Failed to load {self.name}: {str(e)}")
+            raise
+        finally:
+            self._inflight = None
+
+        self._value = value
+        self._loaded_at = time.monotonic()
+        self._expired = False
+        self._failed_at = None
+        print(f"INFO: Loaded {self.name} in {time.perf_counter() - start:.2f}s")
+        return value
+
+    def invalidate(self):
+        # The next get() serves the current copy (if any) and refreshes it
+        self._expired = True
+        self._failed_at = None
+
+    def metrics(self) -> dict:
+        return {
+            "cached": self._loaded_at is not None,
+            "age_seconds": round(time.monotonic() - self._loaded_at, 1) if self._loaded_at is not None else None,
+            "ttl": self.ttl,
+            "hits": self._hits,
+            "stale_hits": self._stale_hits,
+            "loads": self._loads,
+            "load_failures": self._load_failures,
+            "refreshing": self._inflight is not None,
+        }
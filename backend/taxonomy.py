@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from skill_matcher import SkillMatcher
+
+
+class TaxonomySnapshot:
+    """
+    Immutable view of one loaded version of the skill taxonomy.
+
+    Callers should grab a snapshot once per request and use it throughout, so a reload
+    that happens mid-request never mixes skills, ids and matcher from different versions.
+    """
+
+    def __init__(self, skills: List[str], version: str, mtime: float):
+        start = time.perf_counter()
+        self.matcher = SkillMatcher(skills)
+        # Lowercase, de-duplicated skills in taxonomy order
+        self.skills = self.matcher.skills
+        self.skill_ids: Dict[str, int] = {skill: index for index, skill in enumerate(self.skills)}
+        self.version = version
+        self.mtime = mtime
+        self.loaded_at = time.time()
+        self.build_time = time.perf_counter() - start
+
+    def info(self) -> dict:
+        return {
+            "version": self.version,
+            "skill_count": len(self.skills),
+            "loaded_at": self.loaded_at,
+            "build_time_ms": round(self.build_time * 1000, 2),
+        }
+
+
+def load_taxonomy(json_file_path: str) -> TaxonomySnapshot:
+    """
+    Read the taxonomy JSON file and build a snapshot from it.
+
+    Args:
+        json_file_path (str): Path to a JSON file with a top-level "skills" list.
+
+    Returns:
+        TaxonomySnapshot: The built snapshot, versioned by a hash of the file contents.
+    """
+    mtime = os.path.getmtime(json_file_path)
+    with open(json_file_path, "rb") as file:
+        raw = file.read()
+    data = json.loads(raw)
+    version = hashlib.sha256(raw).hexdigest()[:12]
+    return TaxonomySnapshot(data["skills"], version, mtime)
+
+
+class TaxonomyRegistry:
+    """
+    Process-wide holder for the skill taxonomy that reloads when the JSON file changes.
+
+    The file's mtime is checked at most once every `check_interval` seconds. A new
+    snapshot is fully built before it replaces the current one, and the swap is a
+    single reference assignment, so readers always see a complete index.
+    """
+
+    def __init__(self, json_file_path: str, check_interval: float = 5.0):
+        self.json_file_path = json_file_path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+        self._snapshot: Optional[TaxonomySnapshot] = None
+        self.reload()
+
+    def _build(self) -> TaxonomySnapshot:
+        return load_taxonomy(self.json_file_path)
+
+    def reload(self) -> TaxonomySnapshot:
+        """
+        Rebuild the taxonomy from disk and swap it in.
+
+        Returns:
+            TaxonomySnapshot: The snapshot that is now current.
+        """
+        with self._lock:
+            snapshot = self._build()
+            self._snapshot = snapshot
+            self._last_check = time.monotonic()
+        print(f"INFO: Loaded skill taxonomy version {snapshot.version} ({len(snapshot.skills)} skills)")
+        return snapshot
+
+    def get(self) -> TaxonomySnapshot:
+        """
+        Return the current snapshot, reloading first if the file has changed on disk.
+
+        A failed reload (e.g. the file is mid-write and not valid JSON) keeps serving the
+        previous snapshot and is retried on the next check.
+        """
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return snapshot
+
+        # Only one thread checks the file; the others keep using the current snapshot
+        if not self._lock.acquire(blocking=False):
+            return snapshot
+        try:
+            self._last_check = now
+            try:
+                if os.path.getmtime(self.json_file_path) == snapshot.mtime:
+                    return snapshot
+                new_snapshot = self._build()
+            except (OSError, ValueError, KeyError) as e:
+                print(f"ERROR: Failed to reload skill taxonomy: {str(e)}")
+                return snapshot
+            self._snapshot = new_snapshot
+        finally:
+            self._lock.release()
+
+        print(f"INFO: Reloaded skill taxonomy version {new_snapshot.version} ({len(new_snapshot.skills)} skills)")
+        return new_snapshot
+
+    def info(self) -> dict:
+        return self.get().info()
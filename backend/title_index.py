@@ -0,0 +1,90 @@
+import bisect
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+# Only the fields title search needs are loaded into the index
+TITLE_INDEX_PROJECTION = {"_id": 0, "id": 1, "job_title": 1}
+
+TRIGRAM = 3
+
+
+def title_trigrams(text: str) -> set:
+    return {text[i : i + TRIGRAM] for i in range(len(text) - TRIGRAM + 1)}
+
+
+class TitleIndex:
+    """
+    Immutable trigram inverted index for case-insensitive substring search over job titles.
+
+    Titles are casefolded and every 3-character window maps to the sorted positions of the
+    titles containing it. A query's candidates are the intersection of its trigrams'
+    posting lists, smallest first, and each candidate is confirmed with a substring check
+    (trigrams can match out of order). Queries shorter than 3 characters scan the titles.
+
+    Jobs are kept ordered by job id, so a page can continue after the last id of the
+    previous one and a search stops as soon as the page is full.
+    """
+
+    def __init__(self, jobs: Iterable[dict]):
+        start = time.perf_counter()
+        entries = sorted((job["id"], job["job_title"].casefold()) for job in jobs if job.get("job_title"))
+        self.ids: List[str] = [job_id for job_id, _ in entries]
+        self.titles: List[str] = [title for _, title in entries]
+
+        postings: Dict[str, List[int]] = {}
+        for position, title in enumerate(self.titles):
+            for trigram in title_trigrams(title):
+                postings.setdefault(trigram, []).append(position)
+        # Positions are appended in order, so every posting list is already sorted
+        self.postings = {trigram: np.array(positions, dtype=np.int32) for trigram, positions in postings.items()}
+
+        self.built_at = time.time()
+        self.build_time = time.perf_counter() - start
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _candidates(self, query: str, start: int) -> Iterable[int]:
+        if len(query) < TRIGRAM:
+            return range(start, len(self.titles))
+
+        lists = []
+        for trigram in title_trigrams(query):
+            positions = self.postings.get(trigram)
+            if positions is None:
+                return []
+            lists.append(positions)
+        lists.sort(key=len)
+
+        candidates = lists[0][np.searchsorted(lists[0], start) :]
+        for positions in lists[1:]:
+            if not len(candidates):
+                break
+            candidates = np.intersect1d(candidates, positions, assume_unique=True)
+        return candidates.tolist()
+
+    def search(self, text: str, limit: int, after: Optional[str] = None) -> List[str]:
+        """
+        Find jobs whose title contains `text`, ignoring case.
+
+        Args:
+            text (str): The substring to look for.
+            limit (int): Maximum number of job ids to return.
+            after (str, optional): Only return jobs whose id sorts after this one.
+
+        Returns:
+            List[str]: Matching job ids, in id order.
+        """
+        query = text.casefold()
+        start = bisect.bisect_right(self.ids, after) if after is not None else 0
+
+        matches = []
+        for position in self._candidates(query, start):
+            if query in self.titles[position]:
+                matches.append(self.ids[position])
+                if len(matches) >= limit:
+                    break
+        return matches
@@ -0,0 +1,90 @@
+import zipfile
+from typing import BinaryIO, Iterable, Optional
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+
+# Room for the multipart boundaries, headers and small form fields around the file itself
+MULTIPART_OVERHEAD = 64 * 1024
+
+# Bytes read from the start of an upload to sniff its type
+SNIFF_SIZE = 1024
+
+
+class UploadSizeLimitMiddleware:
+    """
+    ASGI middleware that rejects oversized request bodies before they are buffered.
+
+    For the configured paths, a request whose Content-Length is above the limit gets a
+    413 without its body being read. Requests without a Content-Length (chunked uploads)
+    or with a wrong one are counted as they are received, and parsing stops with a 413
+    as soon as the running total passes the limit.
+    """
+
+    def __init__(self, app, paths: Iterable[str], max_size: int):
+        self.app = app
+        self.paths = set(paths)
+        # The limit applies to the file; the body also carries the multipart framing
+        self.max_body_size = max_size + MULTIPART_OVERHEAD
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_size:
+            response = JSONResponse(status_code=413, content={"detail": "File too large"})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    # FastAPI re-raises HTTPExceptions from body parsing, so this becomes the response
+                    raise HTTPException(status_code=413, detail="File too large")
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+# Function to identify a resume file from its content instead of its filename
+def detect_resume_type(stream: BinaryIO) -> Optional[str]:
+    """
+    Sniff whether an uploaded file is a PDF or a DOCX document from its magic bytes.
+
+    Only the first few bytes are read (plus the ZIP directory for DOCX), and the stream is
+    rewound before returning.
+
+    Args:
+        stream (BinaryIO): Seekable file object with the upload.
+
+    Returns:
+        Optional[str]: "pdf", "docx", or None if the file is neither.
+    """
+    stream.seek(0)
+    head = stream.read(SNIFF_SIZE)
+    stream.seek(0)
+
+    # PDF readers accept the header anywhere in the first kilobyte
+    if b"%PDF-" in head:
+        return "pdf"
+
+    # DOCX is a ZIP container with a word/document.xml part
+    if head.startswith(b"PK\x03\x04"):
+        try:
+            with zipfile.ZipFile(stream) as archive:
+                if "word/document.xml" in archive.namelist():
+                    return "docx"
+        except zipfile.BadZipFile:
+            pass
+        finally:
+            stream.seek(0)
+
+    return None
@@ -103,26 +103,38 @@ export const register = async (username: string, password: string): Promise<Auth
 };
 
 // Existing job-related endpoints
-export const getAllJobs = async (limit?: number): Promise<Job[]> => {
-  const response = await axios.get<Job[]>(`${API_URL}/jobs/all`, {
-    params: { limit },
+// Job listings are paginated: each call returns one page, and next_cursor (passed back as `cursor`) fetches the next
+export interface JobPage {
+  jobs: Job[];
+  next_cursor: string | null;
+}
+
+export const getAllJobs = async (cursor?: string, limit?: number): Promise<JobPage> => {
+  const response = await axios.get<JobPage>(`${API_URL}/jobs/all`, {
+    params: { cursor, limit },
   });
   return response.data;
 };
 
-export const getJobsByCompany = async (companyName: string): Promise<Job[]> => {
-  const response = await axios.get<Job[]>(`${API_URL}/jobs/company/${encodeURIComponent(companyName)}`);
+export const getJobsByCompany = async (companyName: string, cursor?: string): Promise<JobPage> => {
+  const response = await axios.get<JobPage>(`${API_URL}/jobs/company/${encodeURIComponent(companyName)}`, {
+    params: { cursor },
+  });
   return response.data;
 };
 
-export const getJobsByTitle = async (titlePart: string): Promise<Job[]> => {
-  const response = await axios.get<Job[]>(`${API_URL}/jobs/title/${encodeURIComponent(titlePart)}`);
+export const getJobsByTitle = async (titlePart: string, cursor?: string): Promise<JobPage> => {
+  const response = await axios.get<JobPage>(`${API_URL}/jobs/title/${encodeURIComponent(titlePart)}`, {
+    params: { cursor },
+  });
   return response.data;
 };
 
-export const getJobsBySkills = async (skills: string[]): Promise<Job[]> => {
+export const getJobsBySkills = async (skills: string[], cursor?: string): Promise<JobPage> => {
   const skillsString = skills.map(skill => encodeURIComponent(skill)).join(',');
-  const response = await axios.get<Job[]>(`${API_URL}/jobs/skills/${skillsString}`);
+  const response = await axios.get<JobPage>(`${API_URL}/jobs/skills/${skillsString}`, {
+    params: { cursor },
+  });
   return response.data;
 };
 